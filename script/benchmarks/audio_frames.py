@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Micro-benchmark of audio frame creation cost.
+
+Compares `OutputAudioRawFrame` and `InputAudioRawFrame`, which use the
+`LightweightFrame` path, with equivalent frames initialized the way `Frame`
+used to be (locked id and count, eager name and metadata).
+
+Usage:
+    python script/benchmarks/audio_frames.py [--frames 200000]
+"""
+
+import argparse
+import collections
+import itertools
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+from piopiy.frames.frames import (
+    AudioRawFrame,
+    DataFrame,
+    InputAudioRawFrame,
+    OutputAudioRawFrame,
+    SystemFrame,
+)
+
+_COUNTS = collections.defaultdict(itertools.count)
+_COUNTS_LOCK = threading.Lock()
+_ID = itertools.count()
+_ID_LOCK = threading.Lock()
+
+
+def eager_init(frame):
+    """Initialize a frame the way `Frame.__post_init__` used to."""
+    with _ID_LOCK:
+        frame.id = next(_ID)
+    with _COUNTS_LOCK:
+        count = next(_COUNTS[frame.__class__.__name__])
+    frame.name = f"{frame.__class__.__name__}#{count}"
+    frame.pts = None
+    frame.metadata = {}
+    frame.transport_source = None
+    frame.transport_destination = None
+    frame.num_frames = int(len(frame.audio) / (frame.num_channels * 2))
+
+
+@dataclass
+class EagerOutputAudioRawFrame(DataFrame, AudioRawFrame):
+    """`OutputAudioRawFrame` with the old eager initialization."""
+
+    def __post_init__(self):
+        eager_init(self)
+
+
+@dataclass
+class EagerInputAudioRawFrame(SystemFrame, AudioRawFrame):
+    """`InputAudioRawFrame` with the old eager initialization."""
+
+    def __post_init__(self):
+        eager_init(self)
+
+
+def measure(name, frame_class, num_frames, audio):
+    """Print and return the creation time (ns) of a frame class."""
+    # Warm up.
+    for _ in range(1000):
+        frame_class(audio=audio, sample_rate=16000, num_channels=1)
+
+    start = time.perf_counter()
+    for _ in range(num_frames):
+        frame_class(audio=audio, sample_rate=16000, num_channels=1)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    frames = [frame_class(audio=audio, sample_rate=16000, num_channels=1) for _ in range(10000)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del frames
+
+    per_frame = elapsed / num_frames * 1e9
+    print(f"{name:>28}: {per_frame:8.0f} ns/frame, {size / 10000:6.0f} bytes/frame")
+    return per_frame
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=200000)
+    args = parser.parse_args()
+
+    # 20 ms of 16 kHz mono audio.
+    audio = bytes(640)
+
+    print(f"{args.frames} frames")
+    for eager_class, light_class in (
+        (EagerOutputAudioRawFrame, OutputAudioRawFrame),
+        (EagerInputAudioRawFrame, InputAudioRawFrame),
+    ):
+        eager = measure(f"eager {light_class.__name__}", eager_class, args.frames, audio)
+        light = measure(f"light {light_class.__name__}", light_class, args.frames, audio)
+        print(f"{'speedup':>28}: {eager / light:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Micro-benchmark of frame push throughput with eager and lazy trace logging.
+
+Runs 20 ms audio frames through a queued (unfused) pipeline of pass-through
+processors with trace logging disabled (a WARNING handler is installed). The
+"eager" processors rebuild the per-push f-string ``logger.trace()`` call that
+`FrameProcessor` used to make, the "lazy" ones rely on the level-checked
+call of `piopiy.utils.hot_path_logging`. Each variant runs several times and
+the best run is reported.
+
+Usage:
+    python script/benchmarks/hot_path_logging.py [--frames 5000] [--depth 10] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from loguru import logger
+
+from piopiy.frames.frames import EndFrame, InputAudioRawFrame
+from piopiy.pipeline.pipeline import Pipeline
+from piopiy.pipeline.runner import PipelineRunner
+from piopiy.pipeline.task import PipelineTask
+from piopiy.processors.filters.identity_filter import IdentityFilter
+from piopiy.processors.frame_processor import FrameDirection
+
+
+class EagerIdentityFilter(IdentityFilter):
+    """`IdentityFilter` formatting its trace messages on every push."""
+
+    async def push_frame(self, frame, direction=FrameDirection.DOWNSTREAM):
+        """Log the push eagerly, then push the frame."""
+        if direction == FrameDirection.DOWNSTREAM:
+            logger.trace(f"Pushing {frame} from {self} to {self._next}")
+        else:
+            logger.trace(f"Pushing {frame} upstream from {self} to {self._prev}")
+        await super().push_frame(frame, direction)
+
+
+async def run_pipeline(processor_class, depth, frames):
+    """Run frames through a chain of processors and return the elapsed time."""
+    pipeline = Pipeline([processor_class() for _ in range(depth)], fuse_inline_processors=False)
+    task = PipelineTask(
+        pipeline,
+        idle_timeout_secs=None,
+        enable_turn_tracking=False,
+        check_dangling_tasks=False,
+    )
+    runner = PipelineRunner(handle_sigint=False)
+
+    started = asyncio.Event()
+    start_time = 0.0
+
+    @task.event_handler("on_pipeline_started")
+    async def on_pipeline_started(task, frame):
+        nonlocal start_time
+        start_time = time.perf_counter()
+        started.set()
+
+    async def feed():
+        await started.wait()
+        await task.queue_frames(frames)
+        await task.queue_frame(EndFrame())
+
+    feeder = asyncio.create_task(feed())
+    await runner.run(task)
+    elapsed = time.perf_counter() - start_time
+    await feeder
+    return elapsed
+
+
+def measure(name, processor_class, depth, frames, repeat=5):
+    """Print and return the best throughput (frames/s) of a processor class."""
+    # Warm up.
+    asyncio.run(run_pipeline(processor_class, depth, frames[:100]))
+
+    best = min(asyncio.run(run_pipeline(processor_class, depth, frames)) for _ in range(repeat))
+    fps = len(frames) / best
+    print(f"{name:>6}: {fps:10.0f} frames/s ({best / len(frames) * 1e6:7.2f} µs/frame)")
+    return fps
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=5000)
+    parser.add_argument("--depth", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per variant")
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    # 20 ms of 16 kHz mono audio.
+    audio = bytes(640)
+    frames = [
+        InputAudioRawFrame(audio=audio, sample_rate=16000, num_channels=1)
+        for _ in range(args.frames)
+    ]
+
+    print(f"{args.frames} frames, {args.depth} processors, best of {args.repeat}")
+    eager = measure("eager", EagerIdentityFilter, args.depth, frames, args.repeat)
+    lazy = measure("lazy", IdentityFilter, args.depth, frames, args.repeat)
+    print(f"speedup: {lazy / eager:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Micro-benchmark of output audio chunking over a 30 s TTS utterance.
+
+Compares the old `bytearray` extend-and-slice approach used by
+`BaseOutputTransport.MediaSender.handle_audio_frame` with `AudioChunker`,
+copying and zero-copy. The utterance is fed as provider-sized frames and
+as a single burst (a non-streaming TTS response).
+
+Usage:
+    python script/benchmarks/output_chunking.py [--seconds 30] [--sample-rate 24000]
+"""
+
+import argparse
+import time
+
+from piopiy.audio.ring_buffer import AudioChunker
+
+
+def bytearray_chunker(chunk_size):
+    """Return a chunker using the old accumulate-and-slice `bytearray`."""
+    audio_buffer = bytearray()
+
+    def process(audio):
+        nonlocal audio_buffer
+        chunks = []
+        audio_buffer.extend(audio)
+        while len(audio_buffer) >= chunk_size:
+            chunks.append(bytes(audio_buffer[:chunk_size]))
+            audio_buffer = audio_buffer[chunk_size:]
+        return chunks
+
+    return process
+
+
+def audio_chunker(zero_copy):
+    """Return a factory of `AudioChunker` chunkers."""
+
+    def factory(chunk_size):
+        return AudioChunker(chunk_size, zero_copy=zero_copy).write
+
+    return factory
+
+
+def measure(name, factory, frames, chunk_size, repeat=5):
+    """Print and return the best time of a chunker over the frames."""
+    best = float("inf")
+    for _ in range(repeat):
+        process = factory(chunk_size)
+        start = time.perf_counter()
+        num_chunks = 0
+        for frame in frames:
+            num_chunks += len(process(frame))
+        best = min(best, time.perf_counter() - start)
+    print(f"{name:>20}: {best * 1e3:9.2f} ms ({num_chunks} chunks)")
+    return best
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=30.0)
+    parser.add_argument("--sample-rate", type=int, default=24000)
+    parser.add_argument("--frame-ms", type=int, default=100, help="TTS provider frame size")
+    parser.add_argument("--chunk-ms", type=int, default=40, help="Output chunk size")
+    args = parser.parse_args()
+
+    bytes_per_ms = args.sample_rate * 2 // 1000
+    utterance = bytes(range(256)) * (int(args.seconds * 1000) * bytes_per_ms // 256)
+    chunk_size = args.chunk_ms * bytes_per_ms
+    frame_size = args.frame_ms * bytes_per_ms
+
+    for label, frames in (
+        (
+            f"{args.frame_ms} ms frames",
+            [utterance[i : i + frame_size] for i in range(0, len(utterance), frame_size)],
+        ),
+        ("single burst", [utterance]),
+    ):
+        print(f"{args.seconds:.0f} s utterance, {label}, {args.chunk_ms} ms chunks")
+        old = measure("bytearray", bytearray_chunker, frames, chunk_size)
+        copy = measure("AudioChunker", audio_chunker(False), frames, chunk_size)
+        view = measure("AudioChunker (view)", audio_chunker(True), frames, chunk_size)
+        print(f"{'speedup':>20}: {old / copy:.1f}x copying, {old / view:.1f}x zero-copy")
+
+
+if __name__ == "__main__":
+    main()
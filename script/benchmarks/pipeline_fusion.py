@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Micro-benchmark of per-frame pipeline overhead with and without fusion.
+
+Runs 20 ms audio frames through pipelines of pass-through processors
+(`IdentityFilter`, which declares `inline_safe`) of increasing depth, once
+with every processor in its own tasks and queues and once with the chain
+fused by `Pipeline(fuse_inline_processors=True)`.
+
+Usage:
+    python script/benchmarks/pipeline_fusion.py [--frames 5000] [--depths 1 5 10 20]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from loguru import logger
+
+from piopiy.frames.frames import EndFrame, InputAudioRawFrame
+from piopiy.pipeline.pipeline import Pipeline
+from piopiy.pipeline.runner import PipelineRunner
+from piopiy.pipeline.task import PipelineTask
+from piopiy.processors.filters.identity_filter import IdentityFilter
+
+
+async def run_pipeline(depth, fuse, frames):
+    """Run frames through a chain of processors and return the elapsed time."""
+    pipeline = Pipeline([IdentityFilter() for _ in range(depth)], fuse_inline_processors=fuse)
+    task = PipelineTask(
+        pipeline,
+        idle_timeout_secs=None,
+        enable_turn_tracking=False,
+        check_dangling_tasks=False,
+    )
+    runner = PipelineRunner(handle_sigint=False)
+
+    started = asyncio.Event()
+    start_time = 0.0
+
+    @task.event_handler("on_pipeline_started")
+    async def on_pipeline_started(task, frame):
+        nonlocal start_time
+        start_time = time.perf_counter()
+        started.set()
+
+    async def feed():
+        await started.wait()
+        await task.queue_frames(frames)
+        await task.queue_frame(EndFrame())
+
+    feeder = asyncio.create_task(feed())
+    await runner.run(task)
+    elapsed = time.perf_counter() - start_time
+    await feeder
+    return elapsed
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=5000)
+    parser.add_argument("--depths", type=int, nargs="+", default=[1, 5, 10, 20])
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    # 20 ms of 16 kHz mono audio.
+    audio = bytes(640)
+    frames = [
+        InputAudioRawFrame(audio=audio, sample_rate=16000, num_channels=1)
+        for _ in range(args.frames)
+    ]
+
+    print(f"{args.frames} frames per run")
+    for depth in args.depths:
+        results = {}
+        for fuse in (False, True):
+            # Warm up, then measure.
+            asyncio.run(run_pipeline(depth, fuse, frames[:100]))
+            elapsed = asyncio.run(run_pipeline(depth, fuse, frames))
+            results[fuse] = elapsed / len(frames) * 1e6
+        print(
+            f"depth {depth:>3}: queued {results[False]:8.2f} µs/frame, "
+            f"fused {results[True]:8.2f} µs/frame ({results[False] / results[True]:4.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Benchmark of stream resampler quality tiers on telephony conversions.
+
+Streams a multi-tone test signal (300 Hz to 3.3 kHz, the telephony band) in
+frames through every quality tier of `create_stream_resampler` and reports
+the CPU time per second of audio and the SNR against the exact signal at the
+output rate (after compensating the resampler delay). Use ``--frame-ms`` to
+compare 20 ms transport frames with larger TTS chunks.
+
+Usage:
+    python script/benchmarks/resampling.py [--seconds 20] [--frame-ms 20]
+    python script/benchmarks/resampling.py --conversions 8000:16000 16000:8000
+"""
+
+import argparse
+import asyncio
+import time
+
+import numpy as np
+
+from piopiy.audio.utils import SOXR_QUALITIES, create_stream_resampler
+
+TONES_HZ = (300.0, 1000.0, 2500.0, 3300.0)
+
+
+def tones(sample_rate, num_samples, delay=0.0):
+    """Return the test signal, optionally delayed by a number of samples."""
+    t = (np.arange(num_samples) - delay) / sample_rate
+    signal = sum(np.sin(2 * np.pi * f * t) for f in TONES_HZ)
+    return signal * (8000 / len(TONES_HZ))
+
+
+def snr(output, out_rate):
+    """Return the SNR (dB) of a resampled signal against the exact one."""
+    # Skip the start-up transient, then find the delay (to a hundredth of a
+    # sample) that best aligns (two seconds of) the output with the exact
+    # signal.
+    skip = out_rate // 10
+    output = output[skip : skip + 2 * out_rate].astype(np.float64)
+
+    def error(delay):
+        reference = tones(out_rate, output.size + skip, delay)[skip:]
+        return np.sum((output - reference) ** 2), reference
+
+    best = min(np.arange(0, 64), key=lambda d: error(d)[0])
+    best = min(np.arange(best - 1, best + 1, 0.01), key=lambda d: error(d)[0])
+    noise, reference = error(best)
+    return 10 * np.log10(np.sum(reference**2) / max(noise, 1e-12))
+
+
+async def run(resampler, frames, in_rate, out_rate):
+    """Resample the frames and return the CPU time and the output."""
+    output = []
+    start = time.process_time()
+    for frame in frames:
+        output.append(await resampler.resample(frame, in_rate, out_rate))
+    return time.process_time() - start, np.frombuffer(b"".join(output), dtype=np.int16)
+
+
+def measure(quality, in_rate, out_rate, seconds, frame_ms):
+    """Print and return the CPU time per second of audio of a quality tier."""
+    signal = np.rint(tones(in_rate, int(seconds * in_rate))).astype(np.int16)
+    frame_size = in_rate * frame_ms // 1000
+    frames = [signal[i : i + frame_size].tobytes() for i in range(0, signal.size, frame_size)]
+
+    cpu, output = asyncio.run(run(create_stream_resampler(quality), frames, in_rate, out_rate))
+    cpu_per_sec = cpu / seconds * 1e3
+    print(
+        f"{quality:>4}: {cpu_per_sec:7.3f} ms CPU/s of audio, SNR {snr(output, out_rate):5.1f} dB"
+    )
+    return cpu_per_sec
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=20.0)
+    parser.add_argument("--frame-ms", type=int, default=20)
+    parser.add_argument(
+        "--conversions",
+        nargs="+",
+        default=["8000:16000", "16000:8000", "8000:24000", "24000:8000", "16000:24000"],
+        help="in_rate:out_rate pairs",
+    )
+    args = parser.parse_args()
+
+    for conversion in args.conversions:
+        in_rate, out_rate = (int(rate) for rate in conversion.split(":"))
+        print(f"{in_rate} Hz -> {out_rate} Hz, {args.seconds:.0f} s in {args.frame_ms} ms frames")
+        for quality in SOXR_QUALITIES:
+            measure(quality, in_rate, out_rate, args.seconds, args.frame_ms)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Benchmark of smart turn prediction throughput and latency with batching.
+
+Simulates 1, 10 and 100 concurrent sessions ending turns of random length
+(0.5 to 6 s) at random moments, all sharing one `SmartTurnInferenceEngine`,
+with batching disabled (``max_batch_size=1``) and enabled, optionally with a
+batch window for the idle worker. The default model is synthetic: a fixed
+per-call overhead plus per-sample work, the cost profile of a small
+transformer on CPU. Pass ``--onnx-model`` to use a smart-turn-v2 ONNX export.
+
+Usage:
+    python script/benchmarks/smart_turn_batching.py [--turns 5] [--window-ms 0]
+    python script/benchmarks/smart_turn_batching.py --onnx-model smart-turn-v2.onnx
+"""
+
+import argparse
+import asyncio
+import functools
+import random
+import time
+
+import numpy as np
+
+from piopiy.audio.turn.smart_turn.inference_engine import (
+    SmartTurnInferenceEngine,
+    SmartTurnModel,
+)
+
+
+class SyntheticModel(SmartTurnModel):
+    """Model whose inference time grows with the padded batch size."""
+
+    def __init__(self, overhead_ms=20.0, ms_per_sec=4.0):
+        """Initialize the model with a fixed and a per-second cost."""
+        self._overhead = overhead_ms / 1000
+        self._per_sample = ms_per_sec / 1000 / 16000
+
+    def predict(self, audio):
+        """Predict a single input."""
+        return self.predict_batch([audio])[0]
+
+    def predict_batch(self, audios):
+        """Predict padded inputs, sleeping for the inference time."""
+        length = max(len(audio) for audio in audios)
+        padded = np.zeros((len(audios), length), dtype=np.float32)
+        for i, audio in enumerate(audios):
+            padded[i, : len(audio)] = audio
+        # time.sleep() releases the GIL like a real inference runtime does.
+        time.sleep(self._overhead + padded.size * self._per_sample)
+        return [{"prediction": 1, "probability": float(p)} for p in padded.mean(axis=1)]
+
+
+def onnx_model_factory(path):
+    """Return a factory of ONNX smart-turn-v2 models."""
+    from piopiy.audio.turn.smart_turn.local_smart_turn_v2_onnx import SmartTurnV2OnnxModel
+
+    return functools.partial(SmartTurnV2OnnxModel, path)
+
+
+async def session(engine, turns, latencies):
+    """Predict a number of turns of random length, recording latencies."""
+    for _ in range(turns):
+        await asyncio.sleep(random.uniform(0.0, 0.5))
+        audio = np.random.uniform(-0.1, 0.1, int(random.uniform(0.5, 6.0) * 16000))
+        start = time.perf_counter()
+        await engine.predict(audio.astype(np.float32))
+        latencies.append(time.perf_counter() - start)
+
+
+async def run(engine, sessions, turns):
+    """Run concurrent sessions and return the latencies and elapsed time."""
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(session(engine, turns, latencies) for _ in range(sessions)))
+    return latencies, time.perf_counter() - start
+
+
+def measure(name, model_factory, sessions, turns, max_batch_size, window_ms):
+    """Print the throughput and latencies of an engine and return the p95."""
+    engine = SmartTurnInferenceEngine(
+        model_factory,
+        key=(name, max_batch_size, window_ms),
+        batch_window_ms=window_ms,
+        max_batch_size=max_batch_size,
+    )
+    engine.load()
+    random.seed(0)
+    latencies, elapsed = asyncio.run(run(engine, sessions, turns))
+    engine.close()
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1e3
+    p95 = latencies[int(len(latencies) * 0.95)] * 1e3
+    throughput = len(latencies) / elapsed
+    print(
+        f"{sessions:>4} sessions, max batch {max_batch_size:>2}, window {window_ms:>3.0f} ms:"
+        f" {throughput:7.1f} turns/s,"
+        f" p50 {p50:7.1f} ms, p95 {p95:7.1f} ms, batch {engine.average_batch_size:5.1f}"
+    )
+    return p95
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=5, help="Turns per session")
+    parser.add_argument("--window-ms", type=float, default=0.0)
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--onnx-model", help="smart-turn-v2 ONNX export to use")
+    args = parser.parse_args()
+
+    if args.onnx_model:
+        name, model_factory = "onnx", onnx_model_factory(args.onnx_model)
+    else:
+        name, model_factory = "synthetic", SyntheticModel
+
+    for sessions in args.sessions:
+        unbatched = measure(name, model_factory, sessions, args.turns, 1, 0)
+        batched = measure(name, model_factory, sessions, args.turns, 16, args.window_ms)
+        print(f"{'p95 speedup':>42}: {unbatched / batched:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Micro-benchmark of the smart turn audio history.
+
+Replays the `BaseSmartTurn` buffer operations for a call of 20 ms chunks:
+every chunk is appended and the history trimmed to the default 11 s, and a
+segment is extracted every ``--segment-every`` chunks. Compares the list of
+``(time, array)`` tuples `BaseSmartTurn` used to keep with
+`TimestampedAudioBuffer`.
+
+Usage:
+    python script/benchmarks/smart_turn_buffer.py [--seconds 600] [--sample-rate 16000]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from piopiy.audio.ring_buffer import TimestampedAudioBuffer
+
+MAX_BUFFER_SECS = 11
+MAX_DURATION_SECS = 8
+
+
+class ListHistory:
+    """The list of ``(time, array)`` tuples `BaseSmartTurn` used to keep."""
+
+    def __init__(self, capacity):
+        """Initialize the history (the list is unbounded)."""
+        self._chunks = []
+
+    def write(self, audio, timestamp):
+        """Convert and append a chunk."""
+        audio_int16 = np.frombuffer(audio, dtype=np.int16)
+        audio_float32 = np.frombuffer(audio_int16, dtype=np.int16).astype(np.float32) / 32768.0
+        self._chunks.append((timestamp, audio_float32))
+
+    def trim_before(self, timestamp):
+        """Drop the chunks older than the given time."""
+        while self._chunks and self._chunks[0][0] < timestamp:
+            self._chunks.pop(0)
+
+    def read_since(self, timestamp, max_samples):
+        """Concatenate the chunks since the given time."""
+        start_index = 0
+        for i, (t, _) in enumerate(self._chunks):
+            if t >= timestamp:
+                start_index = i
+                break
+        segment = np.concatenate([chunk for _, chunk in self._chunks[start_index:]])
+        return segment[-max_samples:]
+
+
+def measure(name, history_class, chunks, sample_rate, segment_every):
+    """Print and return the total time of the history operations for a call."""
+    history = history_class(MAX_BUFFER_SECS * sample_rate)
+    max_samples = MAX_DURATION_SECS * sample_rate
+    append_time = 0.0
+    segment_time = 0.0
+    segments = 0
+    for i, chunk in enumerate(chunks):
+        now = i * 0.02
+        start = time.perf_counter()
+        history.write(chunk, now)
+        history.trim_before(now - MAX_BUFFER_SECS)
+        append_time += time.perf_counter() - start
+        if i % segment_every == 0:
+            start = time.perf_counter()
+            history.read_since(now - MAX_DURATION_SECS, max_samples)
+            segment_time += time.perf_counter() - start
+            segments += 1
+    total = append_time + segment_time
+    print(
+        f"{name:>22}: {append_time / len(chunks) * 1e6:6.2f} µs/chunk,"
+        f" {segment_time / segments * 1e6:7.1f} µs/segment, {total:.3f} s total"
+    )
+    return total
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=int, default=600)
+    parser.add_argument("--sample-rate", type=int, default=16000)
+    parser.add_argument("--segment-every", type=int, default=50, help="Chunks per extraction")
+    args = parser.parse_args()
+
+    chunk = np.random.randint(-1000, 1000, args.sample_rate // 50, dtype=np.int16).tobytes()
+    chunks = [chunk] * (args.seconds * 50)
+
+    print(f"{args.seconds} s call, segment every {args.segment_every} chunks")
+    old = measure("list", ListHistory, chunks, args.sample_rate, args.segment_every)
+    new = measure(
+        "TimestampedAudioBuffer",
+        TimestampedAudioBuffer,
+        chunks,
+        args.sample_rate,
+        args.segment_every,
+    )
+    print(f"{'speedup':>22}: {old / new:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
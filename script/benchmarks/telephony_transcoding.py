@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Benchmark of telephony serializer audio transcoding in frames/s per core.
+
+Compares the two-pass `ulaw_to_pcm`/`pcm_to_ulaw` (and A-law) helpers,
+which go through intermediate ``bytes`` and the async resampler, with the
+single-step `G711Decoder`/`G711Encoder` used by the Twilio, Telnyx and Plivo
+serializers. Frames are 20 ms of 8kHz G.711 in and 20 ms of pipeline PCM
+out.
+
+Usage:
+    python script/benchmarks/telephony_transcoding.py [--frames 20000] [--sample-rate 16000]
+"""
+
+import argparse
+import asyncio
+import time
+
+import numpy as np
+
+from piopiy.audio.g711 import G711Decoder, G711Encoder
+from piopiy.audio.utils import (
+    alaw_to_pcm,
+    create_stream_resampler,
+    pcm_to_alaw,
+    pcm_to_ulaw,
+    ulaw_to_pcm,
+)
+
+TWO_PASS = {"PCMU": (ulaw_to_pcm, pcm_to_ulaw), "PCMA": (alaw_to_pcm, pcm_to_alaw)}
+
+
+async def run_two_pass(encoding, payload, pcm, sample_rate, num_frames):
+    """Return the decode and encode CPU times of the two-pass helpers."""
+    to_pcm, from_pcm = TWO_PASS[encoding]
+    input_resampler = create_stream_resampler()
+    output_resampler = create_stream_resampler()
+
+    start = time.process_time()
+    for _ in range(num_frames):
+        await to_pcm(payload, 8000, sample_rate, input_resampler)
+    decode = time.process_time() - start
+
+    start = time.process_time()
+    for _ in range(num_frames):
+        await from_pcm(pcm, sample_rate, 8000, output_resampler)
+    return decode, time.process_time() - start
+
+
+async def run_transcoder(encoding, payload, pcm, sample_rate, num_frames):
+    """Return the decode and encode CPU times of `G711Decoder`/`G711Encoder`."""
+    decoder = G711Decoder(encoding)
+    encoder = G711Encoder(encoding)
+
+    start = time.process_time()
+    for _ in range(num_frames):
+        decoder.decode(payload, sample_rate)
+    decode = time.process_time() - start
+
+    start = time.process_time()
+    for _ in range(num_frames):
+        encoder.encode(pcm, sample_rate)
+    return decode, time.process_time() - start
+
+
+def measure(name, run, encoding, payload, pcm, sample_rate, num_frames):
+    """Print the frame rates of a transcoding path and return its CPU time."""
+    decode, encode = asyncio.run(run(encoding, payload, pcm, sample_rate, num_frames))
+    print(
+        f"{name:>10} {encoding}: decode {num_frames / decode:8.0f} frames/s,"
+        f" encode {num_frames / encode:8.0f} frames/s"
+    )
+    return decode + encode
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=20000)
+    parser.add_argument("--sample-rate", type=int, default=16000, help="Pipeline sample rate")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    payload = rng.integers(0, 256, 160, dtype=np.uint8).tobytes()
+    pcm = rng.integers(-8000, 8000, args.sample_rate // 50, dtype=np.int16).tobytes()
+
+    print(f"{args.frames} frames of 20 ms, 8000 Hz <-> {args.sample_rate} Hz")
+    for encoding in TWO_PASS:
+        old = measure(
+            "two-pass", run_two_pass, encoding, payload, pcm, args.sample_rate, args.frames
+        )
+        new = measure("G711", run_transcoder, encoding, payload, pcm, args.sample_rate, args.frames)
+        print(f"{'speedup':>15}: {old / new:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Micro-benchmark of VAD window buffering.
+
+Compares the old `bytes` accumulate-and-slice approach used by
+`VADAnalyzer.analyze_audio` with `AudioRingBuffer`. Only buffering and the
+int16 -> float32 conversion are measured (no model inference).
+
+Usage:
+    python script/benchmarks/vad_buffer.py [--frames 50000] [--sample-rate 16000]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from piopiy.audio.ring_buffer import AudioRingBuffer
+
+
+def bytes_buffer(window_size):
+    """Return a frame handler using the old `bytes` buffering."""
+    num_required_bytes = window_size * 2
+    vad_buffer = b""
+
+    def process(frame):
+        nonlocal vad_buffer
+        vad_buffer += frame
+        while len(vad_buffer) >= num_required_bytes:
+            audio_frames = vad_buffer[:num_required_bytes]
+            vad_buffer = vad_buffer[num_required_bytes:]
+            audio_int16 = np.frombuffer(audio_frames, np.int16)
+            np.frombuffer(audio_int16, dtype=np.int16).astype(np.float32) / 32768.0
+
+    return process
+
+
+def ring_buffer(window_size):
+    """Return a frame handler using `AudioRingBuffer`."""
+    buffer = AudioRingBuffer(window_size)
+
+    def process(frame):
+        buffer.write(frame)
+        for _ in buffer.windows():
+            pass
+
+    return process
+
+
+def measure(name, factory, frames, window_size):
+    """Print the time and transient allocations per frame of a handler."""
+    process = factory(window_size)
+
+    # Warm up.
+    for frame in frames[:100]:
+        process(frame)
+
+    start = time.perf_counter()
+    for frame in frames:
+        process(frame)
+    elapsed = time.perf_counter() - start
+
+    # Transient bytes allocated while handling a frame (peak above baseline).
+    tracemalloc.start()
+    transient = 0
+    for frame in frames[:2000]:
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        process(frame)
+        _, peak = tracemalloc.get_traced_memory()
+        transient += peak - baseline
+    tracemalloc.stop()
+
+    us_per_frame = elapsed / len(frames) * 1e6
+    bytes_per_frame = transient / min(len(frames), 2000)
+    print(f"{name:>8}: {us_per_frame:7.2f} µs/frame, {bytes_per_frame:8.1f} transient bytes/frame")
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=50000)
+    parser.add_argument("--sample-rate", type=int, default=16000)
+    args = parser.parse_args()
+
+    # 20 ms transport frames, Silero window sizes.
+    frame_samples = args.sample_rate // 50
+    window_size = 512 if args.sample_rate == 16000 else 256
+
+    rng = np.random.default_rng(0)
+    frames = [
+        rng.integers(-3000, 3000, frame_samples, dtype=np.int16).tobytes()
+        for _ in range(args.frames)
+    ]
+
+    print(f"{args.frames} frames of {frame_samples} samples, window {window_size}")
+    measure("bytes", bytes_buffer, frames, window_size)
+    measure("ring", ring_buffer, frames, window_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Micro-benchmark of the VAD volume estimators.
+
+Measures µs per VAD window for each `VolumeEstimator` and how far the cheap
+estimators are from the EBU R128 value on the same windows.
+
+Usage:
+    python script/benchmarks/vad_volume.py [--wav speech.wav] [--sample-rate 16000]
+
+Without --wav, a synthetic voiced signal (harmonics with a syllable envelope
+plus noise) is used.
+"""
+
+import argparse
+import time
+import wave
+
+import numpy as np
+
+from piopiy.audio.utils import (
+    StreamingLoudnessMeter,
+    calculate_audio_volume,
+    calculate_audio_volume_rms,
+)
+
+
+def synthetic_speech(sample_rate, seconds=30):
+    """Return a speech-like int16 signal."""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(sample_rate * seconds)) / sample_rate
+    f0 = 140 + 30 * np.sin(2 * np.pi * 0.5 * t)
+    phase = 2 * np.pi * np.cumsum(f0) / sample_rate
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 12))
+    envelope = np.clip(np.sin(2 * np.pi * 3 * t), 0, None) * (t % 4 < 3)
+    signal = 0.2 * envelope * voiced + 0.003 * rng.standard_normal(t.size)
+    return (np.clip(signal, -1, 1) * 32767).astype(np.int16)
+
+
+def load_wav(path):
+    """Return the samples and sample rate of a mono 16-bit wav file."""
+    with wave.open(path, "rb") as f:
+        assert f.getsampwidth() == 2 and f.getnchannels() == 1, "mono 16-bit wav required"
+        return np.frombuffer(f.readframes(f.getnframes()), dtype=np.int16), f.getframerate()
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--wav")
+    parser.add_argument("--sample-rate", type=int, default=16000)
+    args = parser.parse_args()
+
+    if args.wav:
+        samples, sample_rate = load_wav(args.wav)
+    else:
+        sample_rate = args.sample_rate
+        samples = synthetic_speech(sample_rate)
+
+    window_size = 512 if sample_rate == 16000 else 256
+    windows = [
+        samples[i : i + window_size] for i in range(0, samples.size - window_size + 1, window_size)
+    ]
+    windows_float32 = [w.astype(np.float32) / 32768.0 for w in windows]
+
+    meter = StreamingLoudnessMeter(sample_rate)
+    estimators = {
+        "ebu_r128": lambda i: calculate_audio_volume(windows[i].tobytes(), sample_rate),
+        "k_weighted": lambda i: meter.volume(windows_float32[i]),
+        "rms": lambda i: calculate_audio_volume_rms(windows_float32[i]),
+    }
+
+    print(f"{len(windows)} windows of {window_size} samples at {sample_rate} Hz")
+    reference = None
+    for name, estimate in estimators.items():
+        meter.reset()
+        start = time.perf_counter()
+        volumes = np.array([estimate(i) for i in range(len(windows))])
+        elapsed = time.perf_counter() - start
+        line = f"{name:>10}: {elapsed / len(windows) * 1e6:8.2f} µs/window"
+        if reference is None:
+            reference = volumes
+        else:
+            line += f", mean |Δ| vs ebu_r128 {np.mean(np.abs(volumes - reference)):.3f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+# admission.py
+# Copyright (c) 2024–2025, TeleCMI
+# SPDX-License-Identifier: BSD 2-Clause License
+
+"""Admission control and load reporting for :class:`piopiy.agent.Agent`.
+
+The agent consults an :class:`AdmissionController` before starting a session.
+An invite is admitted only while the number of sessions, the event loop lag
+and the CPU usage are below the configured limits; otherwise it is deferred
+(up to ``defer_timeout_secs``) or rejected with a reason that is sent back to
+the signaling server.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+REJECT_MAX_SESSIONS = "max_sessions"
+REJECT_LOOP_LAG = "loop_lag"
+REJECT_CPU = "cpu"
+REJECT_NO_WORKERS = "no_workers"
+
+
+@dataclass
+class AdmissionParams:
+    """Limits for admitting new sessions. ``None`` disables a limit.
+
+    ``max_cpu_percent`` is measured per process as a percentage of one core,
+    which is the ceiling a single event loop can use.
+    """
+
+    max_sessions: Optional[int] = None
+    max_loop_lag_secs: Optional[float] = None
+    max_cpu_percent: Optional[float] = None
+    defer_timeout_secs: float = 0.0
+    sample_interval_secs: float = 0.5
+    load_report_interval_secs: Optional[float] = 5.0
+
+
+@dataclass
+class LoadGauge:
+    """Point-in-time load of an agent, as reported to the signaling server."""
+
+    sessions: int
+    max_sessions: Optional[int]
+    loop_lag_secs: float
+    cpu_percent: float
+    deferred: int
+    accepting: bool
+
+    def to_dict(self) -> dict:
+        """Return the gauge as a JSON-serializable dict."""
+        return asdict(self)
+
+
+class LoopMonitor:
+    """Samples event loop lag and process CPU usage at a fixed interval.
+
+    Lag is how late a ``sleep(interval)`` wakes up; a loop that is busy with
+    audio work for many sessions wakes up late.
+    """
+
+    def __init__(
+        self,
+        interval_secs: float = 0.5,
+        on_sample: Optional[Callable[[float, float], None]] = None,
+    ):
+        """Create a monitor; sampling starts with `start()`.
+
+        ``on_sample(loop_lag_secs, cpu_percent)`` is called after every sample.
+        """
+        self.interval_secs = interval_secs
+        self.on_sample = on_sample
+        self.loop_lag_secs = 0.0
+        self.cpu_percent = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start sampling on the running event loop."""
+        if not self._task:
+            self._task = asyncio.create_task(self._run(), name="loop-monitor")
+
+    async def stop(self) -> None:
+        """Stop sampling."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        last_wall = time.monotonic()
+        last_cpu = time.process_time()
+        while True:
+            await asyncio.sleep(self.interval_secs)
+            now_wall = time.monotonic()
+            now_cpu = time.process_time()
+            elapsed = now_wall - last_wall
+            self.loop_lag_secs = max(0.0, elapsed - self.interval_secs)
+            self.cpu_percent = 100.0 * (now_cpu - last_cpu) / elapsed if elapsed > 0 else 0.0
+            last_wall, last_cpu = now_wall, now_cpu
+            if self.on_sample:
+                self.on_sample(self.loop_lag_secs, self.cpu_percent)
+
+
+class AdmissionController:
+    """Decides whether a new session may start given the current load."""
+
+    def __init__(self, params: AdmissionParams):
+        """Create a controller enforcing ``params``."""
+        self.params = params
+        self.monitor = LoopMonitor(params.sample_interval_secs)
+        self.deferred = 0
+
+    def start(self) -> None:
+        """Start sampling the load of this process's event loop."""
+        self.monitor.start()
+
+    async def stop(self) -> None:
+        """Stop sampling the load."""
+        await self.monitor.stop()
+
+    def reject_reason(
+        self, sessions: int, loop_lag_secs: float, cpu_percent: float
+    ) -> Optional[str]:
+        """Return why a new session would be rejected, or ``None`` to admit it."""
+        p = self.params
+        if p.max_sessions is not None and sessions >= p.max_sessions:
+            return REJECT_MAX_SESSIONS
+        if p.max_loop_lag_secs is not None and loop_lag_secs > p.max_loop_lag_secs:
+            return REJECT_LOOP_LAG
+        if p.max_cpu_percent is not None and cpu_percent > p.max_cpu_percent:
+            return REJECT_CPU
+        return None
+
+    async def admit(self, load: Callable[[], LoadGauge]) -> Optional[str]:
+        """Wait until ``load()`` allows a new session or the deferral times out.
+
+        Returns ``None`` once admitted, or the last rejection reason.
+        """
+        gauge = load()
+        reason = self.reject_reason(gauge.sessions, gauge.loop_lag_secs, gauge.cpu_percent)
+        if reason is None or self.params.defer_timeout_secs <= 0:
+            return reason
+
+        deadline = time.monotonic() + self.params.defer_timeout_secs
+        self.deferred += 1
+        try:
+            while reason is not None and time.monotonic() < deadline:
+                await asyncio.sleep(self.params.sample_interval_secs)
+                gauge = load()
+                reason = self.reject_reason(
+                    gauge.sessions, gauge.loop_lag_secs, gauge.cpu_percent
+                )
+        finally:
+            self.deferred -= 1
+        return reason
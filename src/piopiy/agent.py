@@ -5,13 +5,30 @@
 import asyncio
 import logging
 import signal
-from typing import Awaitable, Callable, Dict, Optional
+import sys
+import time
+from typing import Awaitable, Callable, Dict, Optional, Sequence
 from contextvars import ContextVar
 import socketio
 
+from piopiy.admission import (
+    REJECT_NO_WORKERS,
+    AdmissionController,
+    AdmissionParams,
+    LoadGauge,
+)
+from piopiy.utils.http_clients import (
+    HTTPClientLimits,
+    get_http_client_registry,
+    set_http_client_limits,
+)
+from piopiy.worker_pool import SessionWorkerPool
+
 URL_CTX: ContextVar[str] = ContextVar("telecmi_url")
 TOKEN_CTX: ContextVar[str] = ContextVar("telecmi_token")
 ROOM_CTX: ContextVar[str] = ContextVar("telecmi_room")
+# time.time() when the session's invite arrived, for latency measurements.
+INVITE_TIME_CTX: ContextVar[Optional[float]] = ContextVar("telecmi_invite_time", default=None)
 
 
 logger = logging.getLogger(__name__)
@@ -23,6 +40,16 @@ except Exception:
     DEFAULT_SIGNALING_URL = "https://signaling.piopiy.com"
  
 
+async def close_shared_clients() -> None:
+    """Close the HTTP clients and MCP sessions shared by this process's sessions."""
+    await get_http_client_registry().close()
+    # Pools only exist if a session used MCP: don't import the optional
+    # dependency otherwise.
+    mcp_service = sys.modules.get("piopiy.services.mcp_service")
+    if mcp_service:
+        await mcp_service.close_mcp_session_pools()
+
+
 class Agent:
     def __init__(
         self,
@@ -30,14 +57,57 @@ class Agent:
         agent_token: str,
         create_session: Callable[[str, str, str], Awaitable[None]],
         signaling_url: Optional[str] = None,
+        use_worker_pool: bool = False,
+        num_workers: Optional[int] = None,
+        admission: Optional[AdmissionParams] = None,
+        prewarm_urls: Sequence[str] = (),
+        warmup: Optional[Callable[[], Awaitable[None]]] = None,
+        http_client_limits: Optional[HTTPClientLimits] = None,
     ):
         """
         create_session(url, token, room_name) -> coroutine
+
+        With use_worker_pool=True, sessions run in num_workers forked processes
+        (default: one per CPU core) instead of this process's event loop.
+
+        admission limits concurrent sessions, event loop lag and CPU; invites
+        over the limits are deferred or rejected with a reason sent back over
+        the signaling socket ("join_rejected").
+
+        prewarm_urls (e.g. provider base URLs) are connected to at startup
+        (DNS, TCP and TLS), in every worker with a pool, so the first call
+        does not pay the handshakes. Provider services share these
+        keep-alive connections, see piopiy.utils.http_clients;
+        http_client_limits sizes their connection pools.
+
+        warmup() is awaited at startup in the process running sessions (each
+        worker with a pool), e.g. VoiceAgentPool.start to pre-warm pipelines.
         """
         self.signaling_url = signaling_url or DEFAULT_SIGNALING_URL
         self.agent_id = agent_id
         self.agent_token = agent_token
         self.create_session = create_session
+        self.admission_params = admission or AdmissionParams()
+        self.admission = AdmissionController(self.admission_params)
+        self.prewarm_urls = list(prewarm_urls)
+        self.warmup = warmup
+        if http_client_limits:
+            # Set before forking so every worker's registry uses them.
+            set_http_client_limits(http_client_limits)
+        self.worker_pool: Optional[SessionWorkerPool] = (
+            SessionWorkerPool(
+                create_session,
+                num_workers,
+                self.admission_params.sample_interval_secs,
+                self.prewarm_urls,
+                warmup,
+            )
+            if use_worker_pool
+            else None
+        )
+        self._load_report_task: Optional[asyncio.Task] = None
+        self._prewarm_task: Optional[asyncio.Task] = None
+        self._warmup_task: Optional[asyncio.Task] = None
 
         logging.basicConfig(
             level=logging.INFO,
@@ -56,6 +126,7 @@ class Agent:
 
         @self.sio.on("join_room")
         async def handle_join_session(invite: dict):
+            invited_at = time.time()
             room = invite.get("room_name")
             token = invite.get("token")
             # Typically the controller gives you the LiveKit/TeleCMI URL here
@@ -66,15 +137,29 @@ class Agent:
                 return
 
             # avoid running two sessions for the same room
-            existing = self.active_sessions.get(room)
-            if existing and not existing.done():
+            if self._room_running(room):
                 logger.warning("Session %s already running", room)
                 return
-            
+
+            reason = await self.admission.admit(self.load)
+            if reason is None and self._room_running(room):
+                # A duplicate invite was admitted while this one was deferred.
+                return
+            if reason is None and self.worker_pool:
+                index = self.worker_pool.join(room, url, token, invited_at)
+                if index is not None:
+                    logger.info("Session %s assigned to worker %d", room, index)
+                    return
+                reason = REJECT_NO_WORKERS
+            if reason is not None:
+                await self._reject(room, reason)
+                return
+
             tok_url = URL_CTX.set(url)
             tok_token = TOKEN_CTX.set(token)
             tok_room = ROOM_CTX.set(room)
-            
+            tok_invited = INVITE_TIME_CTX.set(invited_at)
+
             try:
                 task = asyncio.create_task(
                     self.create_session(),  # zero-arg; will read ContextVars
@@ -82,6 +167,7 @@ class Agent:
                 )
             finally:
                 # Reset in reverse order (good hygiene)
+                INVITE_TIME_CTX.reset(tok_invited)
                 ROOM_CTX.reset(tok_room)
                 TOKEN_CTX.reset(tok_token)
                 URL_CTX.reset(tok_url)
@@ -97,6 +183,9 @@ class Agent:
             room = data.get("room_name")
             if not room:
                 return
+            if self.worker_pool:
+                self.worker_pool.cancel(room)
+                return
             task = self.active_sessions.pop(room, None)
             if task and not task.done():
                 task.cancel()
@@ -105,11 +194,83 @@ class Agent:
                 except asyncio.CancelledError:
                     pass
 
+    def _room_running(self, room: str) -> bool:
+        if self.worker_pool:
+            return self.worker_pool.has_room(room)
+        existing = self.active_sessions.get(room)
+        return bool(existing and not existing.done())
+
+    async def _reject(self, room: str, reason: str) -> None:
+        logger.warning("Rejecting session %s: %s", room, reason)
+        try:
+            await self.sio.emit(
+                "join_rejected",
+                {"room_name": room, "agent_id": self.agent_id, "reason": reason},
+            )
+        except Exception as e:
+            logger.warning("Unable to report rejection for %s: %s", room, e)
+
+    def load(self) -> LoadGauge:
+        """Current load, as used for admission and reported to signaling."""
+        if self.worker_pool:
+            sessions = self.worker_pool.total_sessions
+            worker = self.worker_pool.least_loaded()
+            # Admission targets the worker the next invite would be routed to.
+            loop_lag = worker.loop_lag_secs if worker else 0.0
+            cpu = worker.cpu_percent if worker else 0.0
+        else:
+            sessions = sum(1 for t in self.active_sessions.values() if not t.done())
+            loop_lag = self.admission.monitor.loop_lag_secs
+            cpu = self.admission.monitor.cpu_percent
+        reason = self.admission.reject_reason(sessions, loop_lag, cpu)
+        return LoadGauge(
+            sessions=sessions,
+            max_sessions=self.admission_params.max_sessions,
+            loop_lag_secs=loop_lag,
+            cpu_percent=cpu,
+            deferred=self.admission.deferred,
+            accepting=reason is None,
+        )
+
+    async def _report_load(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            if not self.sio.connected:
+                continue
+            try:
+                payload = {"agent_id": self.agent_id, **self.load().to_dict()}
+                await self.sio.emit("agent_load", payload)
+            except Exception as e:
+                logger.debug("Unable to report load: %s", e)
+
+    def session_counts(self) -> Dict[int, int]:
+        """Active sessions per worker index (a single entry 0 without a pool)."""
+        if self.worker_pool:
+            return self.worker_pool.session_counts()
+        return {0: sum(1 for t in self.active_sessions.values() if not t.done())}
+
     async def connect(self) -> None:
+        # Fork workers before installing signal handlers so children start clean.
+        if self.worker_pool:
+            self.worker_pool.start()
+        else:
+            if self.prewarm_urls:
+                self._prewarm_task = asyncio.create_task(
+                    get_http_client_registry().prewarm(self.prewarm_urls)
+                )
+            if self.warmup:
+                self._warmup_task = asyncio.create_task(self.warmup())
+            # With a pool, workers sample their own loops and report it.
+            self.admission.start()
+        if self.admission_params.load_report_interval_secs:
+            self._load_report_task = asyncio.create_task(
+                self._report_load(self.admission_params.load_report_interval_secs)
+            )
+
         loop = asyncio.get_running_loop()
         for sig in (signal.SIGINT, signal.SIGTERM):
             loop.add_signal_handler(sig, lambda: asyncio.create_task(self.shutdown()))
-        
+
         await self.sio.connect(
             self.signaling_url,
             auth={"agent_id": self.agent_id, "token": self.agent_token},
@@ -136,4 +297,24 @@ class Agent:
                 t.cancel()
         await asyncio.gather(*tasks, return_exceptions=True)
 
+        # 3) stop worker processes (they cancel their own sessions)
+        if self.worker_pool:
+            await self.worker_pool.stop()
+
+        # 4) stop load sampling and reporting
+        if self._load_report_task:
+            self._load_report_task.cancel()
+            await asyncio.gather(self._load_report_task, return_exceptions=True)
+            self._load_report_task = None
+        await self.admission.stop()
+
+        # 5) stop warming up and close shared HTTP clients and MCP sessions
+        for t in (self._prewarm_task, self._warmup_task):
+            if t:
+                t.cancel()
+                await asyncio.gather(t, return_exceptions=True)
+        self._prewarm_task = None
+        self._warmup_task = None
+        await close_shared_clients()
+
         logger.info("Agent shutdown complete.")
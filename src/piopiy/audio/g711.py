@@ -0,0 +1,108 @@
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Streaming G.711 transcoders for telephony serializers.
+
+Telephony providers exchange 8kHz μ-law (PCMU) or A-law (PCMA) audio in
+20 ms frames. `G711Decoder` and `G711Encoder` convert such a stream to or
+from 16-bit PCM at the pipeline sample rate in a single step per frame: the
+samples go straight between the codec and the resampler stream, without the
+intermediate ``bytes`` copies of `ulaw_to_pcm`/`pcm_to_ulaw` and friends.
+
+Each transcoder keeps its resampler history, so use one per call and
+direction.
+"""
+
+import audioop
+
+import numpy as np
+
+from piopiy.audio.resamplers.soxr_stream_resampler import SOXRStreamAudioResampler
+from piopiy.audio.utils import SOXR_QUALITIES
+
+_DECODERS = {"PCMU": audioop.ulaw2lin, "PCMA": audioop.alaw2lin}
+_ENCODERS = {"PCMU": audioop.lin2ulaw, "PCMA": audioop.lin2alaw}
+
+
+def _create_resampler(quality: str) -> SOXRStreamAudioResampler:
+    if quality not in SOXR_QUALITIES:
+        raise ValueError(f"Unknown resampler quality: {quality}")
+    return SOXRStreamAudioResampler(quality=quality)
+
+
+class G711Decoder:
+    """Decodes a G.711 stream to 16-bit PCM at the requested sample rate."""
+
+    def __init__(self, encoding: str = "PCMU", sample_rate: int = 8000, *, quality: str = "VHQ"):
+        """Initialize the decoder.
+
+        Args:
+            encoding: "PCMU" (μ-law) or "PCMA" (A-law).
+            sample_rate: Sample rate of the encoded audio in Hz.
+            quality: SoX quality tier of the resampler, one of `SOXR_QUALITIES`.
+
+        Raises:
+            ValueError: If the encoding or the quality is not supported.
+        """
+        if encoding not in _DECODERS:
+            raise ValueError(f"Unsupported encoding: {encoding}")
+        self._codec2lin = _DECODERS[encoding]
+        self._sample_rate = sample_rate
+        self._resampler = _create_resampler(quality)
+
+    def decode(self, payload: bytes, out_rate: int) -> bytes:
+        """Decode a frame of encoded audio.
+
+        Args:
+            payload: G.711 encoded audio.
+            out_rate: Sample rate of the returned PCM in Hz.
+
+        Returns:
+            PCM audio (16-bit signed integers) at ``out_rate``.
+        """
+        pcm = self._codec2lin(payload, 2)
+        if out_rate == self._sample_rate:
+            return pcm
+        samples = np.frombuffer(pcm, dtype=np.int16)
+        return self._resampler.resample_array(samples, self._sample_rate, out_rate).tobytes()
+
+
+class G711Encoder:
+    """Encodes 16-bit PCM to a G.711 stream, resampling it first if needed."""
+
+    def __init__(self, encoding: str = "PCMU", sample_rate: int = 8000, *, quality: str = "VHQ"):
+        """Initialize the encoder.
+
+        Args:
+            encoding: "PCMU" (μ-law) or "PCMA" (A-law).
+            sample_rate: Sample rate of the encoded audio in Hz.
+            quality: SoX quality tier of the resampler, one of `SOXR_QUALITIES`.
+
+        Raises:
+            ValueError: If the encoding or the quality is not supported.
+        """
+        if encoding not in _ENCODERS:
+            raise ValueError(f"Unsupported encoding: {encoding}")
+        self._lin2codec = _ENCODERS[encoding]
+        self._sample_rate = sample_rate
+        self._resampler = _create_resampler(quality)
+
+    def encode(self, pcm: bytes, in_rate: int) -> bytes:
+        """Encode a frame of PCM audio.
+
+        Args:
+            pcm: PCM audio (16-bit signed integers).
+            in_rate: Sample rate of ``pcm`` in Hz.
+
+        Returns:
+            G.711 encoded audio.
+        """
+        if in_rate == self._sample_rate:
+            return self._lin2codec(pcm, 2)
+        samples = np.frombuffer(pcm, dtype=np.int16)
+        return self._lin2codec(
+            self._resampler.resample_array(samples, in_rate, self._sample_rate), 2
+        )
@@ -0,0 +1,302 @@
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Preallocated audio buffers for per-frame hot paths.
+
+This module provides buffers that accumulate 16-bit PCM audio and hand out
+fixed-size windows as numpy views, so code running 50 times per second per
+call does not allocate new ``bytes`` objects for every window, a chunker
+that cuts outgoing audio into fixed-size chunks copying each byte at most
+once, and a bounded float32 audio history indexed by arrival time.
+"""
+
+from bisect import bisect_left
+from collections import deque
+from operator import itemgetter
+from typing import Deque, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+
+class AudioRingBuffer:
+    """Preallocated int16 sample buffer with fixed-size windowed reads.
+
+    Incoming audio is copied once into a preallocated int16 array. Complete
+    windows are returned as views into that array together with a float32
+    copy (scaled to [-1, 1)) kept in a second preallocated array. Read space
+    is reclaimed by moving the (less than one window) unread tail to the
+    front, so windows are always contiguous.
+
+    Views returned by :meth:`windows` are only valid until the next call to
+    :meth:`write`.
+    """
+
+    def __init__(self, window_size: int, capacity: Optional[int] = None):
+        """Initialize the ring buffer.
+
+        Args:
+            window_size: Number of samples per window.
+            capacity: Number of samples the buffer can hold. Defaults to
+                eight windows, and grows if a single write needs more.
+        """
+        self._window_size = window_size
+        self._samples = np.zeros(max(capacity or 0, window_size * 8), dtype=np.int16)
+        self._float_window = np.zeros(window_size, dtype=np.float32)
+        self._start = 0
+        self._end = 0
+
+    @property
+    def window_size(self) -> int:
+        """Number of samples per window."""
+        return self._window_size
+
+    @property
+    def capacity(self) -> int:
+        """Number of samples the buffer can hold without growing."""
+        return self._samples.size
+
+    def __len__(self) -> int:
+        """Number of buffered samples not yet read."""
+        return self._end - self._start
+
+    def write(self, audio) -> None:
+        """Append 16-bit PCM audio to the buffer.
+
+        Args:
+            audio: Bytes-like object with 16-bit signed samples.
+        """
+        data = np.frombuffer(audio, dtype=np.int16)
+        n = data.size
+        if self._end + n > self._samples.size:
+            self._compact(n)
+        self._samples[self._end : self._end + n] = data
+        self._end += n
+
+    def windows(self) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """Iterate over the complete windows currently buffered.
+
+        Yields:
+            Tuples of (int16 view, float32 view) for each window. The float32
+            array is reused for every window.
+        """
+        window_size = self._window_size
+        while self._end - self._start >= window_size:
+            window = self._samples[self._start : self._start + window_size]
+            self._start += window_size
+            self._float_window[:] = window
+            self._float_window *= 1.0 / 32768.0
+            yield window, self._float_window
+
+    def read_all(self) -> np.ndarray:
+        """Read (and copy) every buffered sample, including partial windows."""
+        samples = self._samples[self._start : self._end].copy()
+        self.clear()
+        return samples
+
+    def clear(self) -> None:
+        """Drop all buffered samples."""
+        self._start = 0
+        self._end = 0
+
+    def _compact(self, incoming: int) -> None:
+        pending = self._end - self._start
+        required = pending + incoming
+        if required > self._samples.size:
+            # Only happens when a single write is larger than the buffer.
+            samples = np.zeros(max(required, self._samples.size * 2), dtype=np.int16)
+            samples[:pending] = self._samples[self._start : self._end]
+            self._samples = samples
+        elif pending:
+            self._samples[:pending] = self._samples[self._start : self._end]
+        self._start = 0
+        self._end = pending
+
+
+class AudioChunker:
+    """Splits a stream of audio into fixed-size byte chunks.
+
+    Replaces the accumulate-and-slice ``bytearray`` pattern, which copies the
+    whole pending buffer every time a chunk is taken (quadratic for long TTS
+    bursts). Written buffers are kept as they are and chunks are cut at
+    increasing offsets; only a chunk spanning two writes is assembled, from
+    the (less than one chunk) remainder of the previous write.
+
+    With ``zero_copy``, chunks are read-only memoryviews of the written
+    buffers instead of ``bytes`` copies. Consumers must then accept any
+    bytes-like object.
+    """
+
+    def __init__(self, chunk_size: int, *, zero_copy: bool = False):
+        """Initialize the chunker.
+
+        Args:
+            chunk_size: Size of the chunks in bytes.
+            zero_copy: Return memoryviews instead of ``bytes`` copies.
+        """
+        self._chunk_size = chunk_size
+        self._zero_copy = zero_copy
+        self._remainder = b""
+
+    @property
+    def chunk_size(self) -> int:
+        """Size of the chunks in bytes."""
+        return self._chunk_size
+
+    def __len__(self) -> int:
+        """Number of buffered bytes not yet returned in a chunk."""
+        return len(self._remainder)
+
+    def write(self, audio) -> List[Union[bytes, memoryview]]:
+        """Append audio and return the chunks completed by it.
+
+        Args:
+            audio: Bytes-like audio. Anything other than ``bytes`` is copied
+                once, so chunks never see later changes to a mutable buffer.
+
+        Returns:
+            The complete chunks, in order.
+        """
+        if not isinstance(audio, bytes):
+            audio = bytes(audio)
+
+        chunks: List[Union[bytes, memoryview]] = []
+        size = self._chunk_size
+        offset = 0
+
+        if self._remainder:
+            needed = size - len(self._remainder)
+            if len(audio) < needed:
+                self._remainder += audio
+                return chunks
+            chunk = self._remainder + audio[:needed]
+            chunks.append(memoryview(chunk) if self._zero_copy else chunk)
+            self._remainder = b""
+            offset = needed
+
+        data = memoryview(audio) if self._zero_copy else audio
+        last = len(audio) - size
+        while offset <= last:
+            chunks.append(data[offset : offset + size])
+            offset += size
+
+        if offset < len(audio):
+            self._remainder = audio[offset:]
+        return chunks
+
+    def clear(self) -> None:
+        """Drop the buffered remainder."""
+        self._remainder = b""
+
+
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+
+
+class TimestampedAudioBuffer:
+    """Bounded float32 history of 16-bit PCM audio, indexed by arrival time.
+
+    Samples are converted once into a preallocated circular float32 array;
+    when it is full the oldest samples are overwritten. A parallel index
+    keeps the arrival time and position of every written chunk, so trimming
+    by time is O(1) per chunk and reading the audio since a given time costs
+    a binary search plus one copy of the samples read.
+
+    Positions in the index are absolute sample counts since the last
+    :meth:`clear`, which keeps them valid across wrap-arounds.
+    """
+
+    def __init__(self, capacity: int):
+        """Initialize the buffer.
+
+        Args:
+            capacity: Number of samples kept.
+        """
+        self._samples = np.zeros(max(capacity, 1), dtype=np.float32)
+        # (arrival time, absolute position of the first sample) per chunk.
+        self._chunks: Deque[Tuple[float, int]] = deque()
+        self._start = 0
+        self._end = 0
+
+    @property
+    def capacity(self) -> int:
+        """Number of samples the buffer keeps."""
+        return self._samples.size
+
+    def __len__(self) -> int:
+        """Number of samples kept."""
+        return self._end - self._start
+
+    def write(self, audio, timestamp: float) -> None:
+        """Append 16-bit PCM audio that arrived at the given time.
+
+        Args:
+            audio: Bytes-like object with 16-bit signed samples.
+            timestamp: Arrival time of the audio. Must not decrease.
+        """
+        data = np.frombuffer(audio, dtype=np.int16)
+        capacity = self._samples.size
+        self._chunks.append((timestamp, self._end))
+        if data.size > capacity:
+            self._end += data.size - capacity
+            data = data[-capacity:]
+
+        n = data.size
+        pos = self._end % capacity
+        first = min(n, capacity - pos)
+        np.multiply(data[:first], _INT16_SCALE, out=self._samples[pos : pos + first])
+        if first < n:
+            np.multiply(data[first:], _INT16_SCALE, out=self._samples[: n - first])
+        self._end += n
+
+        if self._end - self._start > capacity:
+            self._start = self._end - capacity
+            # Drop chunks that have been completely overwritten.
+            while len(self._chunks) > 1 and self._chunks[1][1] <= self._start:
+                self._chunks.popleft()
+
+    def trim_before(self, timestamp: float) -> None:
+        """Drop the chunks that arrived before the given time.
+
+        Args:
+            timestamp: Arrival time of the oldest chunk to keep.
+        """
+        chunks = self._chunks
+        while chunks and chunks[0][0] < timestamp:
+            chunks.popleft()
+        self._start = max(self._start, chunks[0][1]) if chunks else self._end
+
+    def read_since(self, timestamp: float, max_samples: Optional[int] = None) -> np.ndarray:
+        """Copy the audio of the chunks that arrived at or after a given time.
+
+        If every chunk is older, all the audio kept is returned.
+
+        Args:
+            timestamp: Arrival time of the first chunk to read.
+            max_samples: Only return up to this many of the newest samples.
+
+        Returns:
+            A new float32 array, which later writes do not modify.
+        """
+        start = self._start
+        index = bisect_left(self._chunks, timestamp, key=itemgetter(0))
+        if index < len(self._chunks):
+            start = max(start, self._chunks[index][1])
+        if max_samples is not None:
+            start = max(start, self._end - max_samples)
+
+        n = self._end - start
+        capacity = self._samples.size
+        pos = start % capacity
+        first = min(n, capacity - pos)
+        segment = np.empty(n, dtype=np.float32)
+        segment[:first] = self._samples[pos : pos + first]
+        segment[first:] = self._samples[: n - first]
+        return segment
+
+    def clear(self) -> None:
+        """Drop all the audio."""
+        self._chunks.clear()
+        self._start = 0
+        self._end = 0
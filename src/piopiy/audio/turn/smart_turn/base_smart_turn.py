@@ -19,6 +19,7 @@ import numpy as np
 from loguru import logger
 from pydantic import BaseModel
 
+from piopiy.audio.ring_buffer import TimestampedAudioBuffer
 from piopiy.audio.turn.base_turn_analyzer import BaseTurnAnalyzer, EndOfTurnState
 from piopiy.metrics.metrics import MetricsData, SmartTurnMetricsData
 
@@ -72,8 +73,14 @@ class BaseSmartTurn(BaseTurnAnalyzer):
         self._params = params or SmartTurnParams()
         # Configuration
         self._stop_ms = self._params.stop_secs * 1000  # silence threshold in ms
-        # Inference state
-        self._audio_buffer = []
+        # Longest audio history a turn can need
+        self._max_buffer_secs = (
+            (self._params.pre_speech_ms / 1000)
+            + self._params.stop_secs
+            + self._params.max_duration_secs
+        )
+        # Inference state, the audio buffer is allocated once the sample rate is known
+        self._audio_buffer = TimestampedAudioBuffer(0)
         self._speech_triggered = False
         self._silence_ms = 0
         self._speech_start_time = 0
@@ -96,6 +103,20 @@ class BaseSmartTurn(BaseTurnAnalyzer):
         """
         return self._params
 
+    def set_sample_rate(self, sample_rate: int):
+        """Set the sample rate and allocate the audio buffer for it.
+
+        The buffer holds ``pre_speech_ms + stop_secs + max_duration_secs`` of
+        audio, the most a turn can need.
+
+        Args:
+            sample_rate: The sample rate to set.
+        """
+        super().set_sample_rate(sample_rate)
+        self._audio_buffer = TimestampedAudioBuffer(
+            int(self._max_buffer_secs * self._sample_rate)
+        )
+
     def append_audio(self, buffer: bytes, is_speech: bool) -> EndOfTurnState:
         """Append audio data for turn analysis.
 
@@ -107,9 +128,7 @@ class BaseSmartTurn(BaseTurnAnalyzer):
             Current end-of-turn state after processing the audio.
         """
         # Convert raw audio to float32 format and append to the buffer
-        audio_int16 = np.frombuffer(buffer, dtype=np.int16)
-        audio_float32 = np.frombuffer(audio_int16, dtype=np.int16).astype(np.float32) / 32768.0
-        self._audio_buffer.append((time.time(), audio_float32))
+        self._audio_buffer.write(buffer, time.time())
 
         state = EndOfTurnState.INCOMPLETE
 
@@ -121,7 +140,7 @@ class BaseSmartTurn(BaseTurnAnalyzer):
                 self._speech_start_time = time.time()
         else:
             if self._speech_triggered:
-                chunk_duration_ms = len(audio_int16) / (self._sample_rate / 1000)
+                chunk_duration_ms = (len(buffer) // 2) / (self._sample_rate / 1000)
                 self._silence_ms += chunk_duration_ms
                 # If silence exceeds threshold, mark end of turn
                 if self._silence_ms >= self._stop_ms:
@@ -132,15 +151,7 @@ class BaseSmartTurn(BaseTurnAnalyzer):
                     self._clear(state)
             else:
                 # Trim buffer to prevent unbounded growth before speech
-                max_buffer_time = (
-                    (self._params.pre_speech_ms / 1000)
-                    + self._params.stop_secs
-                    + self._params.max_duration_secs
-                )
-                while (
-                    self._audio_buffer and self._audio_buffer[0][0] < time.time() - max_buffer_time
-                ):
-                    self._audio_buffer.pop(0)
+                self._audio_buffer.trim_before(time.time() - self._max_buffer_secs)
 
         return state
 
@@ -165,12 +176,12 @@ class BaseSmartTurn(BaseTurnAnalyzer):
         """Clear internal state based on turn completion status."""
         # If the state is still incomplete, keep the _speech_triggered as True
         self._speech_triggered = turn_state == EndOfTurnState.INCOMPLETE
-        self._audio_buffer = []
+        self._audio_buffer.clear()
         self._speech_start_time = 0
         self._silence_ms = 0
 
     async def _process_speech_segment(
-        self, audio_buffer
+        self, audio_buffer: TimestampedAudioBuffer
     ) -> Tuple[EndOfTurnState, Optional[MetricsData]]:
         """Process accumulated audio segment using ML model."""
         state = EndOfTurnState.INCOMPLETE
@@ -178,25 +189,10 @@ class BaseSmartTurn(BaseTurnAnalyzer):
         if not audio_buffer:
             return state, None
 
-        # Extract recent audio segment for prediction
+        # Extract recent audio segment for prediction, limited to the maximum duration
         start_time = self._speech_start_time - (self._params.pre_speech_ms / 1000)
-        start_index = 0
-        for i, (t, _) in enumerate(audio_buffer):
-            if t >= start_time:
-                start_index = i
-                break
-
-        end_index = len(audio_buffer) - 1
-
-        # Extract the audio segment
-        segment_audio_chunks = [chunk for _, chunk in audio_buffer[start_index : end_index + 1]]
-        segment_audio = np.concatenate(segment_audio_chunks)
-
-        # Limit maximum duration
         max_samples = int(self._params.max_duration_secs * self.sample_rate)
-        if len(segment_audio) > max_samples:
-            # slices the array to keep the last max_samples samples, discarding the earlier part.
-            segment_audio = segment_audio[-max_samples:]
+        segment_audio = audio_buffer.read_since(start_time, max_samples)
 
         result_data = None
 
@@ -218,6 +214,7 @@ class BaseSmartTurn(BaseTurnAnalyzer):
                 metrics = result.get("metrics", {})
                 inference_time = metrics.get("inference_time", 0)
                 total_time = metrics.get("total_time", 0)
+                queue_wait_time = metrics.get("queue_wait_time", 0)
 
                 # Prepare the result data
                 result_data = SmartTurnMetricsData(
@@ -227,12 +224,14 @@ class BaseSmartTurn(BaseTurnAnalyzer):
                     inference_time_ms=inference_time * 1000,
                     server_total_time_ms=total_time * 1000,
                     e2e_processing_time_ms=e2e_processing_time_ms,
+                    queue_wait_time_ms=queue_wait_time * 1000,
                 )
 
                 logger.trace(
                     f"Prediction: {'Complete' if result_data.is_complete else 'Incomplete'}"
                 )
                 logger.trace(f"Probability of complete: {result_data.probability:.4f}")
+                logger.trace(f"Queue wait time: {result_data.queue_wait_time_ms:.2f}ms")
                 logger.trace(f"Inference time: {result_data.inference_time_ms:.2f}ms")
                 logger.trace(f"Server total time: {result_data.server_total_time_ms:.2f}ms")
                 logger.trace(f"E2E processing time: {result_data.e2e_processing_time_ms:.2f}ms")
@@ -0,0 +1,350 @@
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Off-loop inference for local smart turn models.
+
+Local smart turn models take tens to hundreds of milliseconds per prediction.
+Running them on the event loop stalls every other session of the process
+(audio, VAD, websockets) for that long. A `SmartTurnInferenceEngine` runs
+predictions in a dedicated worker, either a thread (the model must release
+the GIL, which PyTorch and ONNX Runtime do) or a separate process, and
+reports how long each request waited for the worker and how long inference
+took.
+
+When many calls end a turn at the same moment, the engine also batches
+their predictions: requests arriving while the worker is busy are grouped by
+length (so little padding is needed) and each group runs as one forward pass
+once the worker is free.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from loguru import logger
+
+from piopiy.utils.model_registry import model_registry
+
+
+class SmartTurnModel(ABC):
+    """A loaded smart turn model.
+
+    ``predict()`` is blocking; engines only call it from their worker, never
+    from the event loop.
+    """
+
+    @abstractmethod
+    def predict(self, audio: np.ndarray) -> Dict[str, Any]:
+        """Predict whether the turn is complete.
+
+        Args:
+            audio: Float32 16kHz audio of the turn, trimmed to the speech.
+
+        Returns:
+            A dictionary with "prediction" (1 for complete, 0 otherwise) and
+            "probability" (of the turn being complete).
+        """
+        pass
+
+    def predict_batch(self, audios: Sequence[np.ndarray]) -> List[Dict[str, Any]]:
+        """Predict several turns at once.
+
+        The default implementation predicts them one by one. Models that
+        support padded batches override it to run a single forward pass.
+
+        Args:
+            audios: Float32 16kHz audio of each turn.
+
+        Returns:
+            One result per turn, as returned by `predict()`.
+        """
+        return [self.predict(audio) for audio in audios]
+
+
+class SmartTurnInferenceEngine:
+    """Runs smart turn predictions in a dedicated worker.
+
+    With ``worker="thread"`` the model is loaded through the model registry
+    and shared with other engines and analyzers of the process. With
+    ``worker="process"`` it is loaded in a separate (spawned) process, which
+    also keeps inference from competing with the event loop for the GIL;
+    ``model_factory`` must then be picklable, e.g. a ``functools.partial``
+    of a model class.
+
+    A request arriving while the worker is idle runs right away. Requests
+    (from any session) arriving while a batch runs are collected until it
+    is done, grouped into buckets of similar length and each bucket is
+    predicted with `SmartTurnModel.predict_batch()`. Batches grow with load
+    instead of queueing up, and a lone session never waits for a batch.
+    ``batch_window_ms`` optionally makes an idle worker wait for more
+    requests too, trading latency for larger batches.
+
+    Results carry ``metrics["queue_wait_time"]`` (time spent waiting for the
+    batch window and the worker) and ``metrics["inference_time"]`` (of the
+    whole batch), in seconds, plus ``metrics["batch_size"]``.
+    """
+
+    def __init__(
+        self,
+        model_factory: Callable[[], SmartTurnModel],
+        *,
+        key: Optional[Hashable] = None,
+        worker: str = "thread",
+        batch_window_ms: float = 0,
+        max_batch_size: int = 16,
+        bucket_secs: float = 1.0,
+    ):
+        """Initialize the engine. The worker starts on first use.
+
+        Args:
+            model_factory: Loads the model.
+            key: Model registry key of the model. Defaults to the factory.
+            worker: "thread" or "process".
+            batch_window_ms: How long an idle worker waits for more requests
+                before running them. Adds at most this much latency. With 0
+                requests only wait for a batch already running.
+            max_batch_size: Maximum number of turns per forward pass. 1
+                disables batching.
+            bucket_secs: Width of the length buckets. Turns in a batch differ
+                in length by less than this, which bounds padding.
+        """
+        if worker not in ("thread", "process"):
+            raise ValueError(f"Unknown smart turn worker: {worker}")
+        self._model_factory = model_factory
+        self._key = key if key is not None else ("smart_turn", model_factory)
+        self._worker = worker
+        self._executor: Optional[Executor] = None
+        self._pid = 0
+        self._loaded_model: Optional[SmartTurnModel] = None
+
+        self._batch_window_secs = batch_window_ms / 1000
+        self._max_batch_size = max_batch_size
+        self._bucket_samples = max(1, int(bucket_secs * 16000))
+        self._pending: List[Tuple[np.ndarray, float, asyncio.Future]] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._window_handle: Optional[asyncio.TimerHandle] = None
+        self._in_flight = 0
+
+        self._batches = 0
+        self._predictions = 0
+
+    @property
+    def worker(self) -> str:
+        """The kind of worker running predictions."""
+        return self._worker
+
+    @property
+    def average_batch_size(self) -> float:
+        """Average number of turns per forward pass so far."""
+        return self._predictions / self._batches if self._batches else 0.0
+
+    def load(self):
+        """Load the model now instead of on the first prediction. Blocking."""
+        executor = self._get_executor()
+        if self._worker == "thread":
+            self._thread_model()
+        else:
+            # Wait for the worker process to start and load the model.
+            executor.submit(_noop).result()
+
+    async def predict(self, audio: np.ndarray) -> Dict[str, Any]:
+        """Run a prediction in the worker.
+
+        Args:
+            audio: Float32 16kHz audio of the turn.
+
+        Returns:
+            The model result with queue wait and inference times added to
+            its "metrics".
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # A forked worker runs its own loop, requests of the parent are
+            # not ours to run.
+            self._loop = loop
+            self._pending = []
+            self._window_handle = None
+            self._in_flight = 0
+
+        future = loop.create_future()
+        self._pending.append((audio, time.monotonic(), future))
+        if self._in_flight:
+            # The last running batch to finish flushes, unless we already
+            # have a full batch.
+            if len(self._pending) >= self._max_batch_size:
+                self._flush()
+        elif self._batch_window_secs <= 0 or len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif not self._window_handle:
+            self._window_handle = loop.call_later(self._batch_window_secs, self._flush)
+        return await future
+
+    def close(self):
+        """Stop the worker. The engine restarts it if used again."""
+        if self._executor and self._pid == os.getpid():
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+
+    def _thread_model(self) -> SmartTurnModel:
+        if self._loaded_model is None:
+            self._loaded_model = model_registry.get(self._key, self._model_factory)
+        return self._loaded_model
+
+    def _predict_batch_in_thread(self, audios: List[np.ndarray]):
+        return _timed_predict_batch(self._thread_model(), audios)
+
+    def _flush(self):
+        if self._window_handle:
+            self._window_handle.cancel()
+            self._window_handle = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        buckets: Dict[int, list] = {}
+        for request in pending:
+            buckets.setdefault(len(request[0]) // self._bucket_samples, []).append(request)
+
+        for requests in buckets.values():
+            for i in range(0, len(requests), self._max_batch_size):
+                batch = requests[i : i + self._max_batch_size]
+                executor = None
+                try:
+                    executor = self._get_executor()
+                    task = self._submit(executor, [audio for audio, _, _ in batch])
+                except Exception as e:
+                    # The requests are no longer pending, so fail them rather
+                    # than leave their sessions waiting forever.
+                    self._on_worker_error(e, executor)
+                    for _, _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+                task.add_done_callback(lambda t, b=batch, e=executor: self._on_batch_done(t, b, e))
+                self._in_flight += 1
+
+    def _submit(self, executor: Executor, audios: List[np.ndarray]) -> asyncio.Future:
+        if self._worker == "thread":
+            return self._loop.run_in_executor(executor, self._predict_batch_in_thread, audios)
+        return self._loop.run_in_executor(executor, _predict_batch_in_worker, audios)
+
+    def _on_worker_error(self, exception: BaseException, executor: Optional[Executor]):
+        if isinstance(exception, BrokenExecutor) and executor is self._executor:
+            # The worker died (e.g. the process crashed or failed to load the
+            # model): start a new one for the next batch.
+            logger.error(f"Smart turn worker broken, restarting it: {exception}")
+            self.close()
+
+    def _on_batch_done(self, task: asyncio.Future, batch: list, executor: Executor):
+        self._in_flight -= 1
+        if not self._in_flight and self._pending:
+            self._flush()
+
+        if task.cancelled():
+            for _, _, future in batch:
+                future.cancel()
+            return
+
+        exception = task.exception()
+        if exception:
+            self._on_worker_error(exception, executor)
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(exception)
+            return
+
+        results, started_at, inference_time = task.result()
+        self._batches += 1
+        self._predictions += len(batch)
+        for (_, submitted_at, future), result in zip(batch, results):
+            if future.done():
+                continue
+            queue_wait = max(0.0, started_at - submitted_at)
+            metrics = result.setdefault("metrics", {})
+            metrics["queue_wait_time"] = queue_wait
+            metrics["inference_time"] = inference_time
+            metrics["total_time"] = queue_wait + inference_time
+            metrics["batch_size"] = len(batch)
+            future.set_result(result)
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None or self._pid != os.getpid():
+            # Workers do not survive a fork, so forked session workers start
+            # their own.
+            if self._worker == "thread":
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="smart-turn")
+            else:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=1,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(self._model_factory,),
+                )
+            self._pid = os.getpid()
+        return self._executor
+
+
+def _timed_predict_batch(
+    model: SmartTurnModel, audios: List[np.ndarray]
+) -> Tuple[List[Dict[str, Any]], float, float]:
+    started_at = time.monotonic()
+    results = model.predict_batch(audios)
+    return results, started_at, time.monotonic() - started_at
+
+
+# Model of a worker process.
+_worker_model: Optional[SmartTurnModel] = None
+
+
+def _init_worker(model_factory: Callable[[], SmartTurnModel]):
+    global _worker_model
+    _worker_model = model_factory()
+
+
+def _predict_batch_in_worker(audios: List[np.ndarray]):
+    return _timed_predict_batch(_worker_model, audios)
+
+
+def _noop():
+    pass
+
+
+_engines: Dict[Hashable, SmartTurnInferenceEngine] = {}
+
+
+def get_smart_turn_engine(
+    key: Hashable,
+    model_factory: Callable[[], SmartTurnModel],
+    *,
+    worker: str = "thread",
+    **kwargs,
+) -> SmartTurnInferenceEngine:
+    """Return the process-wide engine of a model, creating it if needed.
+
+    Analyzers of the same model share one engine (and one worker), so
+    concurrent predictions queue for it instead of oversubscribing the CPU,
+    and can be batched together.
+
+    Args:
+        key: Hashable description of the model (kind, path...).
+        model_factory: Loads the model.
+        worker: "thread" or "process", used if the engine is created.
+        **kwargs: Batching arguments of `SmartTurnInferenceEngine`, used if
+            the engine is created.
+
+    Returns:
+        The shared engine.
+    """
+    engine = _engines.get((key, worker))
+    if engine is None:
+        engine = SmartTurnInferenceEngine(model_factory, key=key, worker=worker, **kwargs)
+        _engines[(key, worker)] = engine
+    return engine
@@ -10,12 +10,18 @@ This module provides a smart turn analyzer that uses PyTorch models for
 local end-of-turn detection without requiring network connectivity.
 """
 
-from typing import Any, Dict
+import functools
+from typing import Any, Dict, List, Optional, Sequence
 
 import numpy as np
 from loguru import logger
 
 from piopiy.audio.turn.smart_turn.base_smart_turn import BaseSmartTurn
+from piopiy.audio.turn.smart_turn.inference_engine import (
+    SmartTurnInferenceEngine,
+    SmartTurnModel,
+    get_smart_turn_engine,
+)
 
 try:
     import torch
@@ -34,34 +40,33 @@ except ModuleNotFoundError as e:
     )
     raise Exception(f"Missing module: {e}")
 
+DEFAULT_SMART_TURN_V2_MODEL = "pipecat-ai/smart-turn-v2"
 
-class LocalSmartTurnAnalyzerV2(BaseSmartTurn):
-    """Local turn analyzer using the smart-turn-v2 PyTorch model.
+# The model was trained on (up to) 16 second segments at 16kHz.
+MAX_INPUT_SAMPLES = 16000 * 16
 
-    Provides end-of-turn detection using locally-stored PyTorch models,
-    enabling offline operation without network dependencies. Uses
-    Wav2Vec2 architecture for audio sequence classification.
+
+class SmartTurnV2Model(SmartTurnModel):
+    """The smart-turn-v2 PyTorch model and its feature extractor.
+
+    Inputs are trimmed to the actual speech instead of being padded to 16
+    seconds, so inference cost follows the length of the turn.
     """
 
-    def __init__(self, *, smart_turn_model_path: str, **kwargs):
-        """Initialize the local PyTorch smart-turn-v2 analyzer.
+    def __init__(self, smart_turn_model_path: str, *, pad_to_max_length: bool = False):
+        """Load the model.
 
         Args:
-            smart_turn_model_path: Path to directory containing the PyTorch model
-                and feature extractor files. If empty, uses default HuggingFace model.
-            **kwargs: Additional arguments passed to BaseSmartTurn.
+            smart_turn_model_path: Path or HuggingFace name of the model.
+            pad_to_max_length: Pad inputs to 16 seconds like the reference
+                implementation. Slower, only useful to compare results.
         """
-        super().__init__(**kwargs)
-
-        if not smart_turn_model_path:
-            # Define the path to the pretrained model on Hugging Face
-            smart_turn_model_path = "pipecat-ai/smart-turn-v2"
-
         logger.debug("Loading Local Smart Turn v2 model...")
         # Load the pretrained model for sequence classification
         self._turn_model = _Wav2Vec2ForEndpointing.from_pretrained(smart_turn_model_path)
         # Load the corresponding feature extractor for preprocessing audio
         self._turn_processor = Wav2Vec2Processor.from_pretrained(smart_turn_model_path)
+        self._pad_to_max_length = pad_to_max_length
         # Use platform-optimized backend if available (MPS for Apple silicon, CUDA for NVIDIA)
         self._device = "cpu"
         if torch.backends.mps.is_available():
@@ -73,14 +78,22 @@ class LocalSmartTurnAnalyzerV2(BaseSmartTurn):
         self._turn_model.eval()
         logger.debug("Loaded Local Smart Turn v2")
 
-    async def _predict_endpoint(self, audio_array: np.ndarray) -> Dict[str, Any]:
-        """Predict end-of-turn using local PyTorch model."""
+    def predict(self, audio: np.ndarray) -> Dict[str, Any]:
+        """Predict end-of-turn. Blocking."""
+        return self.predict_batch([audio])[0]
+
+    def predict_batch(self, audios: Sequence[np.ndarray]) -> List[Dict[str, Any]]:
+        """Predict end-of-turn of several turns in one forward pass. Blocking.
+
+        Shorter turns are padded to the longest one and masked out of the
+        attention pooling.
+        """
         inputs = self._turn_processor(
-            audio_array,
+            list(audios),
             sampling_rate=16000,
-            padding="max_length",
+            padding="max_length" if self._pad_to_max_length else "longest",
             truncation=True,
-            max_length=16000 * 16,  # 16 seconds at 16kHz
+            max_length=MAX_INPUT_SAMPLES,
             return_attention_mask=True,
             return_tensors="pt",
         )
@@ -93,15 +106,125 @@ class LocalSmartTurnAnalyzerV2(BaseSmartTurn):
             outputs = self._turn_model(**inputs)
 
             # The model returns sigmoid probabilities directly in the logits field
-            probability = outputs["logits"][0].item()
+            probabilities = outputs["logits"].view(-1).tolist()
+
+        # Make prediction (1 for Complete, 0 for Incomplete)
+        return [
+            {"prediction": 1 if probability > 0.5 else 0, "probability": probability}
+            for probability in probabilities
+        ]
+
+
+class LocalSmartTurnAnalyzerV2(BaseSmartTurn):
+    """Local turn analyzer using the smart-turn-v2 PyTorch model.
+
+    Provides end-of-turn detection using locally-stored PyTorch models,
+    enabling offline operation without network dependencies. Uses
+    Wav2Vec2 architecture for audio sequence classification.
+
+    Predictions run in a `SmartTurnInferenceEngine` worker, shared by all
+    analyzers of the same model in the process, never on the event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        smart_turn_model_path: str,
+        engine: Optional[SmartTurnInferenceEngine] = None,
+        worker: str = "thread",
+        batch_window_ms: float = 0,
+        **kwargs,
+    ):
+        """Initialize the local PyTorch smart-turn-v2 analyzer.
+
+        Args:
+            smart_turn_model_path: Path to directory containing the PyTorch model
+                and feature extractor files. If empty, uses default HuggingFace model.
+            engine: Inference engine to use. Defaults to the shared engine of
+                the model.
+            worker: Worker of the default engine, "thread" or "process".
+            batch_window_ms: How long the default engine waits for more
+                predictions when its worker is idle. Predictions arriving
+                while a batch runs are batched regardless.
+            **kwargs: Additional arguments passed to BaseSmartTurn.
+        """
+        super().__init__(**kwargs)
+
+        if not smart_turn_model_path:
+            # Define the path to the pretrained model on Hugging Face
+            smart_turn_model_path = DEFAULT_SMART_TURN_V2_MODEL
+
+        self._engine = engine or get_smart_turn_engine(
+            ("smart_turn_v2", smart_turn_model_path),
+            functools.partial(SmartTurnV2Model, smart_turn_model_path),
+            worker=worker,
+            batch_window_ms=batch_window_ms,
+        )
+        self._engine.load()
+
+    async def _predict_endpoint(self, audio_array: np.ndarray) -> Dict[str, Any]:
+        """Predict end-of-turn in the inference engine worker."""
+        return await self._engine.predict(audio_array)
+
+
+def export_smart_turn_v2_onnx(
+    output_path: str,
+    *,
+    smart_turn_model_path: str = DEFAULT_SMART_TURN_V2_MODEL,
+    quantize_int8: bool = True,
+    opset_version: int = 17,
+) -> str:
+    """Export smart-turn-v2 to ONNX for `LocalSmartTurnAnalyzerV2Onnx`.
+
+    The exported model takes ``input_values`` (normalized float32 audio) and
+    ``attention_mask`` of any length and returns the probability of the turn
+    being complete. With ``quantize_int8`` weights are dynamically quantized
+    to int8, which is usually 2-4x faster on CPU.
+
+    Args:
+        output_path: Where to write the ONNX model.
+        smart_turn_model_path: Path or HuggingFace name of the PyTorch model.
+        quantize_int8: Quantize weights to int8 (requires onnxruntime).
+        opset_version: ONNX opset to export with.
+
+    Returns:
+        The path of the exported model.
+    """
+    model = _Wav2Vec2ForEndpointing.from_pretrained(smart_turn_model_path)
+    model.eval()
+
+    class _ProbabilityOnly(nn.Module):
+        def __init__(self, model):
+            super().__init__()
+            self.model = model
+
+        def forward(self, input_values, attention_mask):
+            return self.model(input_values, attention_mask=attention_mask)["logits"]
+
+    float_path = f"{output_path}.fp32.onnx" if quantize_int8 else output_path
+    input_values = torch.zeros(1, 16000 * 2)
+    attention_mask = torch.ones(1, 16000 * 2, dtype=torch.long)
+    torch.onnx.export(
+        _ProbabilityOnly(model),
+        (input_values, attention_mask),
+        float_path,
+        input_names=["input_values", "attention_mask"],
+        output_names=["probability"],
+        dynamic_axes={
+            "input_values": {0: "batch", 1: "samples"},
+            "attention_mask": {0: "batch", 1: "samples"},
+            "probability": {0: "batch"},
+        },
+        opset_version=opset_version,
+    )
+
+    if quantize_int8:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
 
-            # Make prediction (1 for Complete, 0 for Incomplete)
-            prediction = 1 if probability > 0.5 else 0
+        quantize_dynamic(float_path, output_path, weight_type=QuantType.QInt8)
 
-        return {
-            "prediction": prediction,
-            "probability": probability,
-        }
+    logger.debug(f"Exported smart-turn-v2 to {output_path}")
+    return output_path
 
 
 class _Wav2Vec2ForEndpointing(Wav2Vec2PreTrainedModel):
@@ -0,0 +1,133 @@
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Local ONNX turn analyzer using an export of the smart-turn-v2 model.
+
+This module runs the smart-turn-v2 model exported with
+`export_smart_turn_v2_onnx` (optionally int8-quantized) on ONNX Runtime,
+without PyTorch or transformers at runtime.
+"""
+
+import functools
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from loguru import logger
+
+from piopiy.audio.turn.smart_turn.base_smart_turn import BaseSmartTurn
+from piopiy.audio.turn.smart_turn.inference_engine import (
+    SmartTurnInferenceEngine,
+    SmartTurnModel,
+    get_smart_turn_engine,
+)
+
+try:
+    import onnxruntime
+except ModuleNotFoundError as e:
+    logger.error(f"Exception: {e}")
+    logger.error(
+        "In order to use LocalSmartTurnAnalyzerV2Onnx, you need to `pip install onnxruntime`."
+    )
+    raise Exception(f"Missing module: {e}")
+
+# The model was trained on (up to) 16 second segments at 16kHz.
+MAX_INPUT_SAMPLES = 16000 * 16
+
+
+class SmartTurnV2OnnxModel(SmartTurnModel):
+    """The smart-turn-v2 model on ONNX Runtime (CPU).
+
+    Inputs are trimmed to the actual speech and normalized the way the
+    Wav2Vec2 feature extractor does (zero mean, unit variance).
+    """
+
+    def __init__(self, onnx_model_path: str, *, num_threads: int = 1):
+        """Load the model.
+
+        Args:
+            onnx_model_path: Path of the exported ONNX model.
+            num_threads: Intra-op threads of the inference session.
+        """
+        logger.debug(f"Loading Local Smart Turn v2 ONNX model {onnx_model_path}...")
+        opts = onnxruntime.SessionOptions()
+        opts.inter_op_num_threads = 1
+        opts.intra_op_num_threads = num_threads
+        self._session = onnxruntime.InferenceSession(
+            onnx_model_path, providers=["CPUExecutionProvider"], sess_options=opts
+        )
+        logger.debug("Loaded Local Smart Turn v2 ONNX model")
+
+    def predict(self, audio: np.ndarray) -> Dict[str, Any]:
+        """Predict end-of-turn. Blocking."""
+        return self.predict_batch([audio])[0]
+
+    def predict_batch(self, audios: Sequence[np.ndarray]) -> List[Dict[str, Any]]:
+        """Predict end-of-turn of several turns in one session run. Blocking.
+
+        Shorter turns are zero-padded to the longest one and masked out.
+        """
+        audios = [audio[:MAX_INPUT_SAMPLES] for audio in audios]
+        length = max(len(audio) for audio in audios)
+        input_values = np.zeros((len(audios), length), dtype=np.float32)
+        attention_mask = np.zeros((len(audios), length), dtype=np.int64)
+        for i, audio in enumerate(audios):
+            input_values[i, : len(audio)] = (audio - audio.mean()) / np.sqrt(audio.var() + 1e-7)
+            attention_mask[i, : len(audio)] = 1
+
+        (probabilities,) = self._session.run(
+            None, {"input_values": input_values, "attention_mask": attention_mask}
+        )
+
+        return [
+            {"prediction": 1 if probability > 0.5 else 0, "probability": float(probability)}
+            for probability in probabilities.reshape(-1)
+        ]
+
+
+class LocalSmartTurnAnalyzerV2Onnx(BaseSmartTurn):
+    """Local turn analyzer using an ONNX (optionally int8) smart-turn-v2 export.
+
+    Predictions run in a `SmartTurnInferenceEngine` worker, shared by all
+    analyzers of the same model in the process, never on the event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        smart_turn_model_path: str,
+        engine: Optional[SmartTurnInferenceEngine] = None,
+        worker: str = "thread",
+        num_threads: int = 1,
+        batch_window_ms: float = 0,
+        **kwargs,
+    ):
+        """Initialize the ONNX smart-turn-v2 analyzer.
+
+        Args:
+            smart_turn_model_path: Path of the ONNX model, see
+                `export_smart_turn_v2_onnx`.
+            engine: Inference engine to use. Defaults to the shared engine of
+                the model.
+            worker: Worker of the default engine, "thread" or "process".
+            num_threads: Intra-op threads of the default engine's session.
+            batch_window_ms: How long the default engine waits for more
+                predictions when its worker is idle. Predictions arriving
+                while a batch runs are batched regardless.
+            **kwargs: Additional arguments passed to BaseSmartTurn.
+        """
+        super().__init__(**kwargs)
+
+        self._engine = engine or get_smart_turn_engine(
+            ("smart_turn_v2_onnx", smart_turn_model_path, num_threads),
+            functools.partial(SmartTurnV2OnnxModel, smart_turn_model_path, num_threads=num_threads),
+            worker=worker,
+            batch_window_ms=batch_window_ms,
+        )
+        self._engine.load()
+
+    async def _predict_endpoint(self, audio_array: np.ndarray) -> Dict[str, Any]:
+        """Predict end-of-turn in the inference engine worker."""
+        return await self._engine.predict(audio_array)
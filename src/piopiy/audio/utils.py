@@ -24,6 +24,9 @@ from piopiy.audio.resamplers.soxr_stream_resampler import SOXRStreamAudioResampl
 # So we are using a threshold that is well below what real speech produces.
 SPEAKING_THRESHOLD = 20
 
+# SoX quality tiers, from the most accurate to the cheapest.
+SOXR_QUALITIES = ("VHQ", "HQ", "MQ", "LQ", "QQ")
+
 
 def create_default_resampler(**kwargs) -> BaseAudioResampler:
     """Create a default audio resampler instance.
@@ -51,28 +54,35 @@ def create_default_resampler(**kwargs) -> BaseAudioResampler:
     return SOXRAudioResampler(**kwargs)
 
 
-def create_file_resampler(**kwargs) -> BaseAudioResampler:
+def create_file_resampler(quality: str = "VHQ", **kwargs) -> BaseAudioResampler:
     """Create an audio resampler instance for batch processing of complete audio files.
 
     Args:
+        quality: SoX quality tier, one of `SOXR_QUALITIES`.
         **kwargs: Additional keyword arguments passed to the resampler constructor.
 
     Returns:
         A configured SOXRAudioResampler instance.
     """
-    return SOXRAudioResampler(**kwargs)
+    if quality not in SOXR_QUALITIES:
+        raise ValueError(f"Unknown resampler quality: {quality}")
+    return SOXRAudioResampler(quality=quality, **kwargs)
 
 
-def create_stream_resampler(**kwargs) -> BaseAudioResampler:
+def create_stream_resampler(quality: str = "VHQ", **kwargs) -> BaseAudioResampler:
     """Create a stream audio resampler instance.
 
     Args:
+        quality: SoX quality tier, one of `SOXR_QUALITIES` ("VHQ", "HQ",
+            "MQ", "LQ" or "QQ").
         **kwargs: Additional keyword arguments passed to the resampler constructor.
 
     Returns:
         A configured SOXRStreamAudioResampler instance.
     """
-    return SOXRStreamAudioResampler(**kwargs)
+    if quality not in SOXR_QUALITIES:
+        raise ValueError(f"Unknown resampler quality: {quality}")
+    return SOXRStreamAudioResampler(quality=quality, **kwargs)
 
 
 def mix_audio(audio1: bytes, audio2: bytes) -> bytes:
@@ -175,6 +185,103 @@ def calculate_audio_volume(audio: bytes, sample_rate: int) -> float:
     return loudness
 
 
+# Offset between the loudness of int16-scaled samples (what
+# `calculate_audio_volume` measures) and samples scaled to [-1, 1):
+# 20 * log10(32768) = 90.309 dB, minus the -0.691 dB from BS.1770.
+_INT16_LOUDNESS_OFFSET = 20 * np.log10(32768.0) - 0.691
+
+# Loudness below this (LUFS, int16 scale) is gated out, like pyloudnorm's
+# absolute gate.
+_LOUDNESS_ABSOLUTE_GATE = -70.0
+
+
+def _loudness_to_volume(mean_square: float) -> float:
+    """Map the mean square of [-1, 1) samples to the 0-1 volume scale."""
+    if mean_square <= 0:
+        return 0.0
+    loudness = 10 * np.log10(mean_square) + _INT16_LOUDNESS_OFFSET
+    if loudness < _LOUDNESS_ABSOLUTE_GATE:
+        return 0.0
+    return normalize_value(loudness, -20, 80)
+
+
+def calculate_audio_volume_rms(audio_float32: np.ndarray) -> float:
+    """Calculate audio volume from its RMS level, without K-weighting.
+
+    The level is mapped with the same constants as `calculate_audio_volume`,
+    so ``min_volume`` thresholds keep their meaning. For speech the result
+    is usually within a few percent of the EBU R128 value.
+
+    Args:
+        audio_float32: Audio samples as float32 in the range [-1, 1).
+
+    Returns:
+        Normalized volume between 0 (quiet) and 1 (loud).
+    """
+    if not audio_float32.size:
+        return 0.0
+    mean_square = float(np.dot(audio_float32, audio_float32)) / audio_float32.size
+    return _loudness_to_volume(mean_square)
+
+
+# BS.1770 K-weighting stages as (filter type, (gain dB, Q, center Hz)), the
+# same ones `pyln.Meter` uses for its "K-weighting" filter class.
+_K_WEIGHTING_STAGES = [
+    ("high_shelf", (4.0, 1 / np.sqrt(2), 1500.0)),
+    ("high_pass", (0.0, 0.5, 38.0)),
+]
+
+
+class StreamingLoudnessMeter:
+    """K-weighted loudness meter that keeps filter state between windows.
+
+    Computes the same quantity as `calculate_audio_volume` (BS.1770
+    K-weighting followed by the mean square of the window) but builds the
+    filters once and runs them continuously over the stream instead of
+    creating a `pyln.Meter` for every window.
+    """
+
+    def __init__(self, sample_rate: int):
+        """Initialize the meter.
+
+        Args:
+            sample_rate: Sample rate of the audio in Hz.
+        """
+        from scipy.signal import lfilter
+
+        self._lfilter = lfilter
+        self._filters = [
+            (f.b, f.a, f.passband_gain, np.zeros(max(len(f.a), len(f.b)) - 1))
+            for f in (
+                pyln.IIRfilter(*params, sample_rate, filter_type)
+                for filter_type, params in _K_WEIGHTING_STAGES
+            )
+        ]
+
+    def reset(self):
+        """Reset the filter state."""
+        self._filters = [(b, a, g, np.zeros_like(zi)) for b, a, g, zi in self._filters]
+
+    def volume(self, audio_float32: np.ndarray) -> float:
+        """Measure the normalized loudness of the next window.
+
+        Args:
+            audio_float32: Audio samples as float32 in the range [-1, 1).
+
+        Returns:
+            Normalized loudness between 0 (quiet) and 1 (loud).
+        """
+        if not audio_float32.size:
+            return 0.0
+        filtered = audio_float32
+        for i, (b, a, gain, zi) in enumerate(self._filters):
+            filtered, zi = self._lfilter(b, a, filtered, zi=zi)
+            filtered *= gain
+            self._filters[i] = (b, a, gain, zi)
+        mean_square = float(np.dot(filtered, filtered)) / filtered.size
+        return _loudness_to_volume(mean_square)
+
+
 def exp_smoothing(value: float, prev_value: float, factor: float) -> float:
     """Apply exponential smoothing to a value.
 
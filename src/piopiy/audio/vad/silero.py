@@ -13,13 +13,17 @@ which can detect voice activity in audio streams with high accuracy.
 Supports 8kHz and 16kHz sample rates.
 """
 
+import asyncio
+import functools
 import time
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 from loguru import logger
 
 from piopiy.audio.vad.vad_analyzer import VADAnalyzer, VADParams
+from piopiy.utils.model_registry import model_registry
 
 # How often should we reset internal model state
 _MODEL_RESET_STATES_TIME = 5.0
@@ -33,31 +37,68 @@ except ModuleNotFoundError as e:
     raise Exception(f"Missing module(s): {e}")
 
 
+def create_silero_session(path, force_onnx_cpu=True) -> "onnxruntime.InferenceSession":
+    """Create an ONNX runtime inference session for the Silero VAD model.
+
+    Args:
+        path: Path to the ONNX model file.
+        force_onnx_cpu: Whether to force CPU execution provider.
+
+    Returns:
+        A single-threaded inference session. Sessions are safe to share
+        between models since ``run()`` does not keep any state.
+    """
+    opts = onnxruntime.SessionOptions()
+    opts.inter_op_num_threads = 1
+    opts.intra_op_num_threads = 1
+
+    if force_onnx_cpu and "CPUExecutionProvider" in onnxruntime.get_available_providers():
+        return onnxruntime.InferenceSession(
+            path, providers=["CPUExecutionProvider"], sess_options=opts
+        )
+    return onnxruntime.InferenceSession(path, sess_options=opts)
+
+
+def silero_model_file_path() -> str:
+    """Return the path of the bundled Silero VAD ONNX model."""
+    model_name = "silero_vad.onnx"
+    package_path = "piopiy.audio.vad.data"
+
+    try:
+        import importlib_resources as impresources
+
+        model_file_path = str(impresources.files(package_path).joinpath(model_name))
+    except BaseException:
+        from importlib import resources as impresources
+
+        try:
+            with impresources.path(package_path, model_name) as f:
+                model_file_path = f
+        except BaseException:
+            model_file_path = str(impresources.files(package_path).joinpath(model_name))
+
+    return str(model_file_path)
+
+
 class SileroOnnxModel:
     """ONNX runtime wrapper for the Silero VAD model.
 
     Provides voice activity detection using the pre-trained Silero VAD model
     with ONNX runtime for efficient inference. Handles model state management
-    and input validation for audio processing.
+    and input validation for audio processing. The recurrent state lives in
+    this object, so several models can share one inference session.
     """
 
-    def __init__(self, path, force_onnx_cpu=True):
+    def __init__(self, path, force_onnx_cpu=True, session=None):
         """Initialize the Silero ONNX model.
 
         Args:
             path: Path to the ONNX model file.
             force_onnx_cpu: Whether to force CPU execution provider.
+            session: Existing inference session to reuse. If None, a new one
+                is created from ``path``.
         """
-        opts = onnxruntime.SessionOptions()
-        opts.inter_op_num_threads = 1
-        opts.intra_op_num_threads = 1
-
-        if force_onnx_cpu and "CPUExecutionProvider" in onnxruntime.get_available_providers():
-            self.session = onnxruntime.InferenceSession(
-                path, providers=["CPUExecutionProvider"], sess_options=opts
-            )
-        else:
-            self.session = onnxruntime.InferenceSession(path, sess_options=opts)
+        self.session = session or create_silero_session(path, force_onnx_cpu)
 
         self.reset_states()
         self.sample_rates = [8000, 16000]
@@ -91,6 +132,29 @@ class SileroOnnxModel:
 
     def __call__(self, x, sr: int):
         """Process audio input through the VAD model."""
+        x, context_size = self.prepare_input(x, sr)
+
+        if sr in [8000, 16000]:
+            ort_inputs = {"input": x, "state": self._state, "sr": np.array(sr, dtype="int64")}
+            ort_outs = self.session.run(None, ort_inputs)
+            out, state = ort_outs
+        else:
+            raise ValueError()
+
+        self.commit(x, state, sr, context_size)
+
+        return out
+
+    def prepare_input(self, x, sr: int):
+        """Validate ``x`` and prepend the context kept from the previous window.
+
+        Args:
+            x: Audio samples, shape (samples,) or (batch, samples).
+            sr: Sample rate (8000 or 16000).
+
+        Returns:
+            Tuple of the model input and the context size for ``sr``.
+        """
         x, sr = self._validate_input(x, sr)
         num_samples = 512 if sr == 16000 else 256
 
@@ -112,21 +176,212 @@ class SileroOnnxModel:
         if not np.shape(self._context)[1]:
             self._context = np.zeros((batch_size, context_size), dtype="float32")
 
-        x = np.concatenate((self._context, x), axis=1)
-
-        if sr in [8000, 16000]:
-            ort_inputs = {"input": x, "state": self._state, "sr": np.array(sr, dtype="int64")}
-            ort_outs = self.session.run(None, ort_inputs)
-            out, state = ort_outs
-            self._state = state
-        else:
-            raise ValueError()
+        return np.concatenate((self._context, x), axis=1), context_size
 
+    def commit(self, x, state, sr: int, context_size: int):
+        """Store the recurrent state and context after running the model on ``x``."""
+        self._state = state
         self._context = x[..., -context_size:]
         self._last_sr = sr
-        self._last_batch_size = batch_size
+        self._last_batch_size = np.shape(x)[0]
 
-        return out
+
+class SileroVADEngine:
+    """Batched Silero VAD inference shared by all sessions in a process.
+
+    Instead of every session running its own 512-sample inference, analyzers
+    submit their window to the engine, which collects pending windows on a
+    short tick, stacks inputs and recurrent states into one batch, runs a
+    single ONNX call in a dedicated thread and scatters the results back.
+
+    The recurrent state of each session still lives in its
+    :class:`SileroOnnxModel`, so results match unbatched inference. Windows
+    fail individually: a bad window only fails its own request.
+    """
+
+    def __init__(
+        self,
+        *,
+        tick_ms: float = 10,
+        max_batch_size: int = 512,
+        session: Optional["onnxruntime.InferenceSession"] = None,
+    ):
+        """Initialize the engine.
+
+        Args:
+            tick_ms: How long to collect windows before running a batch.
+                Adds at most this much latency to each window.
+            max_batch_size: Maximum number of windows per ONNX call.
+            session: Inference session to use. Defaults to the shared Silero
+                session from the model registry.
+        """
+        self._tick_secs = tick_ms / 1000
+        self._max_batch_size = max_batch_size
+        self._session = session
+        self._pending: List[
+            Tuple[SileroOnnxModel, np.ndarray, int, Optional[Callable[[], float]], asyncio.Future]
+        ] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tick_handle: Optional[asyncio.TimerHandle] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self._batches = 0
+        self._windows = 0
+
+    @property
+    def session(self) -> "onnxruntime.InferenceSession":
+        """The inference session used for batches."""
+        if not self._session:
+            model_file_path = silero_model_file_path()
+            self._session = model_registry.get(
+                ("silero_vad", model_file_path),
+                lambda: create_silero_session(model_file_path, force_onnx_cpu=True),
+            )
+        return self._session
+
+    @property
+    def average_batch_size(self) -> float:
+        """Average number of windows per ONNX call so far."""
+        return self._windows / self._batches if self._batches else 0.0
+
+    async def infer(self, model: SileroOnnxModel, x: np.ndarray, sr: int) -> float:
+        """Submit a window for ``model`` and wait for its confidence.
+
+        Args:
+            model: Per-session model holding the recurrent state.
+            x: Float32 audio window (256 samples at 8kHz, 512 at 16kHz).
+            sr: Sample rate of ``x``.
+
+        Returns:
+            Voice confidence between 0.0 and 1.0.
+        """
+        confidence, _ = await self.analyze(model, x, sr)
+        return confidence
+
+    async def analyze(
+        self,
+        model: SileroOnnxModel,
+        x: np.ndarray,
+        sr: int,
+        measure_volume: Optional[Callable[[], float]] = None,
+    ) -> Tuple[float, Optional[float]]:
+        """Submit a window for ``model`` and wait for its confidence and volume.
+
+        Args:
+            model: Per-session model holding the recurrent state.
+            x: Float32 audio window (256 samples at 8kHz, 512 at 16kHz).
+            sr: Sample rate of ``x``.
+            measure_volume: Measures the volume of the window. It is called
+                in the engine thread, off the event loop.
+
+        Returns:
+            Voice confidence between 0.0 and 1.0, and the volume returned by
+            ``measure_volume`` (None without it).
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Engines are per process; a forked worker gets its own loop and
+            # needs its own thread (threads do not survive a fork).
+            self._loop = loop
+            self._pending = []
+            self._tick_handle = None
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="silero-vad")
+
+        future = loop.create_future()
+        self._pending.append((model, x, sr, measure_volume, future))
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif not self._tick_handle:
+            self._tick_handle = loop.call_later(self._tick_secs, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._tick_handle:
+            self._tick_handle.cancel()
+            self._tick_handle = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        # Windows for different sample rates can't share a batch.
+        by_sr: Dict[int, list] = {}
+        for request in pending:
+            by_sr.setdefault(request[2], []).append(request)
+        for sr, requests in by_sr.items():
+            task = self._loop.run_in_executor(self._executor, self._run_batch, sr, requests)
+            task.add_done_callback(lambda t, r=requests: self._on_batch_done(t, r))
+
+    def _run_batch(self, sr: int, requests: list) -> list:
+        # The (confidence, volume) or the exception of each request.
+        results: list = [None] * len(requests)
+        batched = []
+        inputs = []
+        for i, (model, x, _, measure_volume, _) in enumerate(requests):
+            try:
+                model_input, context_size = model.prepare_input(x, sr)
+                volume = measure_volume() if measure_volume else None
+            except Exception as e:
+                results[i] = e
+                continue
+            batched.append((i, model, context_size, volume))
+            inputs.append(model_input)
+
+        if not batched:
+            return results
+        try:
+            self._run_models(sr, batched, inputs, results)
+        except Exception as e:
+            if len(batched) == 1:
+                results[batched[0][0]] = e
+                return results
+            # Run the windows one by one, so only the failing ones fail.
+            for request, model_input in zip(batched, inputs):
+                try:
+                    self._run_models(sr, [request], [model_input], results)
+                except Exception as e:
+                    results[request[0]] = e
+        return results
+
+    def _run_models(self, sr: int, batched: list, inputs: list, results: list):
+        batch = np.concatenate(inputs, axis=0)
+        state = np.concatenate([model._state for _, model, _, _ in batched], axis=1)
+        out, new_state = self.session.run(
+            None, {"input": batch, "state": state, "sr": np.array(sr, dtype="int64")}
+        )
+
+        for j, (i, model, context_size, volume) in enumerate(batched):
+            model.commit(batch[j : j + 1], new_state[:, j : j + 1, :], sr, context_size)
+            results[i] = (float(out[j][0]), volume)
+
+        self._batches += 1
+        self._windows += len(batched)
+
+    def _on_batch_done(self, task: asyncio.Future, requests: list):
+        futures = [request[-1] for request in requests]
+        if task.cancelled():
+            for future in futures:
+                future.cancel()
+            return
+        exception = task.exception()
+        results = task.result() if not exception else [exception] * len(futures)
+        for future, result in zip(futures, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+_shared_engine: Optional[SileroVADEngine] = None
+
+
+def get_silero_vad_engine() -> SileroVADEngine:
+    """Return the process-wide batched Silero VAD engine."""
+    global _shared_engine
+    if _shared_engine is None:
+        _shared_engine = SileroVADEngine()
+    return _shared_engine
 
 
 class SileroVADAnalyzer(VADAnalyzer):
@@ -137,38 +392,45 @@ class SileroVADAnalyzer(VADAnalyzer):
     with automatic model state management and periodic resets.
     """
 
-    def __init__(self, *, sample_rate: Optional[int] = None, params: Optional[VADParams] = None):
+    def __init__(
+        self,
+        *,
+        sample_rate: Optional[int] = None,
+        params: Optional[VADParams] = None,
+        engine: Optional[SileroVADEngine] = None,
+    ):
         """Initialize the Silero VAD analyzer.
 
         Args:
             sample_rate: Audio sample rate (8000 or 16000 Hz). If None, will be set later.
             params: VAD parameters for detection thresholds and timing.
+            engine: Batched inference engine shared across sessions (see
+                :func:`get_silero_vad_engine`). If None, each window is
+                analyzed with its own inference call.
         """
         super().__init__(sample_rate=sample_rate, params=params)
 
-        logger.debug("Loading Silero VAD model...")
+        self._engine = engine
 
-        model_name = "silero_vad.onnx"
-        package_path = "piopiy.audio.vad.data"
-
-        try:
-            import importlib_resources as impresources
-
-            model_file_path = str(impresources.files(package_path).joinpath(model_name))
-        except BaseException:
-            from importlib import resources as impresources
-
-            try:
-                with impresources.path(package_path, model_name) as f:
-                    model_file_path = f
-            except BaseException:
-                model_file_path = str(impresources.files(package_path).joinpath(model_name))
-
-        self._model = SileroOnnxModel(model_file_path, force_onnx_cpu=True)
+        # The inference session is shared process-wide, only the recurrent
+        # state is per analyzer.
+        model_file_path = silero_model_file_path()
+        session = model_registry.get(
+            ("silero_vad", model_file_path),
+            lambda: create_silero_session(model_file_path, force_onnx_cpu=True),
+        )
+        self._model = SileroOnnxModel(model_file_path, session=session)
 
         self._last_reset_time = 0
 
-        logger.debug("Loaded Silero VAD")
+    @classmethod
+    def preload(cls):
+        """Load the shared Silero VAD session ahead of the first session."""
+        model_file_path = silero_model_file_path()
+        model_registry.preload(
+            ("silero_vad", model_file_path),
+            lambda: create_silero_session(model_file_path, force_onnx_cpu=True),
+        )
 
     #
     # VADAnalyzer
@@ -198,6 +460,15 @@ class SileroVADAnalyzer(VADAnalyzer):
         """
         return 512 if self.sample_rate == 16000 else 256
 
+    @property
+    def supports_async_analysis(self) -> bool:
+        """Whether windows are analyzed by a shared batched engine.
+
+        Returns:
+            True if an engine was given.
+        """
+        return self._engine is not None
+
     def voice_confidence(self, buffer) -> float:
         """Calculate voice activity confidence for the given audio buffer.
 
@@ -207,22 +478,76 @@ class SileroVADAnalyzer(VADAnalyzer):
         Returns:
             Voice confidence score between 0.0 and 1.0.
         """
+        # Divide by 32768 because we have signed 16-bit data.
+        audio_float32 = np.frombuffer(buffer, dtype=np.int16).astype(np.float32) / 32768.0
+        return self._window_confidence(None, audio_float32)
+
+    async def voice_confidence_async(self, buffer) -> float:
+        """Calculate voice activity confidence using the batched engine.
+
+        Args:
+            buffer: Audio buffer to analyze.
+
+        Returns:
+            Voice confidence score between 0.0 and 1.0.
+        """
+        audio_float32 = np.frombuffer(buffer, dtype=np.int16).astype(np.float32) / 32768.0
+        return await self._window_confidence_async(None, audio_float32)
+
+    def _window_confidence(self, window, window_float32: np.ndarray) -> float:
+        # The analyzer already converted the window to float32, use it as is.
         try:
-            audio_int16 = np.frombuffer(buffer, np.int16)
-            # Divide by 32768 because we have signed 16-bit data.
-            audio_float32 = np.frombuffer(audio_int16, dtype=np.int16).astype(np.float32) / 32768.0
-            new_confidence = self._model(audio_float32, self.sample_rate)[0]
-
-            # We need to reset the model from time to time because it doesn't
-            # really need all the data and memory will keep growing otherwise.
-            curr_time = time.time()
-            diff_time = curr_time - self._last_reset_time
-            if diff_time >= _MODEL_RESET_STATES_TIME:
-                self._model.reset_states()
-                self._last_reset_time = curr_time
+            new_confidence = self._model(window_float32, self.sample_rate)[0]
+
+            self._maybe_reset_states()
 
             return new_confidence
         except Exception as e:
             # This comes from an empty audio array
             logger.error(f"Error analyzing audio with Silero VAD: {e}")
             return 0
+
+    async def _window_confidence_async(self, window, window_float32: np.ndarray) -> float:
+        if not self._engine:
+            return self._window_confidence(window, window_float32)
+
+        try:
+            new_confidence = await self._engine.infer(self._model, window_float32, self.sample_rate)
+
+            self._maybe_reset_states()
+
+            return new_confidence
+        except Exception as e:
+            logger.error(f"Error analyzing audio with Silero VAD: {e}")
+            return 0
+
+    async def _window_analysis_async(
+        self, window, window_float32: np.ndarray
+    ) -> Tuple[float, Optional[float]]:
+        if not self._engine:
+            return self._window_confidence(window, window_float32), None
+
+        try:
+            # The volume is measured in the engine thread too.
+            new_confidence, volume = await self._engine.analyze(
+                self._model,
+                window_float32,
+                self.sample_rate,
+                functools.partial(self._window_volume, window, window_float32),
+            )
+
+            self._maybe_reset_states()
+
+            return new_confidence, volume
+        except Exception as e:
+            logger.error(f"Error analyzing audio with Silero VAD: {e}")
+            return 0, None
+
+    def _maybe_reset_states(self):
+        # We need to reset the model from time to time because it doesn't
+        # really need all the data and memory will keep growing otherwise.
+        curr_time = time.time()
+        diff_time = curr_time - self._last_reset_time
+        if diff_time >= _MODEL_RESET_STATES_TIME:
+            self._model.reset_states()
+            self._last_reset_time = curr_time
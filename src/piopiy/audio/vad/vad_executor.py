@@ -0,0 +1,125 @@
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Execution strategies for running VAD analysis from input transports.
+
+The VAD model is small, so for dense deployments the cost of handing every
+20 ms frame to a thread (a future, a thread switch and a callback back into
+the loop) can be as large as the inference itself. This module provides the
+alternatives a transport can choose from with
+``TransportParams.vad_execution_mode``.
+"""
+
+import asyncio
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from typing import Any, Callable, Optional
+
+from loguru import logger
+
+
+class VADExecutionMode(str, Enum):
+    """Where VAD analysis runs.
+
+    Parameters:
+        EXECUTOR: A single-thread executor owned by each transport (default).
+        SHARED_EXECUTOR: A thread pool shared by every transport in the process.
+        THREAD: One dedicated VAD thread per process, fed through a lock-free
+            queue. Frames from all sessions are analyzed in arrival order.
+        INLINE: Directly on the event loop. No hand-off cost, but the loop is
+            blocked for the duration of the inference.
+    """
+
+    EXECUTOR = "executor"
+    SHARED_EXECUTOR = "shared_executor"
+    THREAD = "thread"
+    INLINE = "inline"
+
+
+class VADThread:
+    """A dedicated thread running VAD jobs submitted from event loops.
+
+    Jobs are passed through a ``queue.SimpleQueue`` (no locks held while
+    waiting) and results are delivered with ``call_soon_threadsafe``, which
+    is lighter than going through ``run_in_executor``.
+    """
+
+    def __init__(self):
+        """Initialize the VAD thread. The thread starts on first use."""
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, fn: Callable[..., Any], *args) -> asyncio.Future:
+        """Run ``fn(*args)`` in the VAD thread.
+
+        Returns:
+            A future of the running loop resolved with the result.
+        """
+        if not self._thread:
+            self._thread = threading.Thread(target=self._run, name="vad", daemon=True)
+            self._thread.start()
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queue.put((loop, future, fn, args))
+        return future
+
+    def _run(self):
+        while True:
+            loop, future, fn, args = self._queue.get()
+            try:
+                callback, value = _set_result, fn(*args)
+            except Exception as e:
+                callback, value = _set_exception, e
+            except BaseException as e:
+                logger.error(f"VAD thread exiting: {e}")
+                raise
+            try:
+                loop.call_soon_threadsafe(callback, future, value)
+            except RuntimeError:
+                # The submitting loop was closed while the job ran. Nobody
+                # waits for the result, keep serving the other loops.
+                logger.debug("VAD job result dropped: event loop is closed")
+
+
+def _set_result(future: asyncio.Future, result: Any):
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_exception(future: asyncio.Future, exception: Exception):
+    if not future.done():
+        future.set_exception(exception)
+
+
+# Per process: threads do not survive a fork, so forked session workers
+# create their own.
+_vad_thread: Optional[VADThread] = None
+_vad_thread_pid = 0
+_shared_executor: Optional[ThreadPoolExecutor] = None
+_shared_executor_pid = 0
+
+
+def get_vad_thread() -> VADThread:
+    """Return the dedicated VAD thread of this process."""
+    global _vad_thread, _vad_thread_pid
+    if _vad_thread is None or _vad_thread_pid != os.getpid():
+        _vad_thread = VADThread()
+        _vad_thread_pid = os.getpid()
+    return _vad_thread
+
+
+def get_shared_vad_executor() -> ThreadPoolExecutor:
+    """Return the VAD thread pool shared by all transports of this process."""
+    global _shared_executor, _shared_executor_pid
+    if _shared_executor is None or _shared_executor_pid != os.getpid():
+        _shared_executor = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1, thread_name_prefix="vad"
+        )
+        _shared_executor_pid = os.getpid()
+    return _shared_executor
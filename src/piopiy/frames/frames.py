@@ -181,6 +181,54 @@ class AudioRawFrame:
         self.num_frames = int(len(self.audio) / (self.num_channels * 2))
 
 
+class LightweightFrame:
+    """Mixin for frames created at audio rate.
+
+    Audio frames are created for every 20 ms chunk of every call, so they
+    skip most of `Frame` initialization: the id is taken without a lock,
+    ``pts`` and transport names default to class attributes until set, and
+    ``name`` and ``metadata`` are only built when first accessed. The public
+    `Frame` API is unchanged; note that the instance count in ``name`` is
+    assigned on first access rather than at creation.
+
+    Must be listed after the `Frame` and data mixin bases, and subclasses
+    call `_init_lightweight()` instead of `Frame.__post_init__()`.
+    """
+
+    pts: Optional[int] = None
+    transport_source: Optional[str] = None
+    transport_destination: Optional[str] = None
+
+    def _init_lightweight(self):
+        self.id = obj_id()
+
+    @property
+    def name(self) -> str:
+        """Human-readable name combining class name and instance count."""
+        try:
+            return self._name
+        except AttributeError:
+            self._name = f"{self.__class__.__name__}#{obj_count(self)}"
+            return self._name
+
+    @name.setter
+    def name(self, name: str):
+        self._name = name
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Dictionary for arbitrary frame metadata."""
+        try:
+            return self._metadata
+        except AttributeError:
+            self._metadata = {}
+            return self._metadata
+
+    @metadata.setter
+    def metadata(self, metadata: Dict[str, Any]):
+        self._metadata = metadata
+
+
 @dataclass
 class ImageRawFrame:
     """A frame containing a raw image.
@@ -202,7 +250,7 @@ class ImageRawFrame:
 
 
 @dataclass
-class OutputAudioRawFrame(DataFrame, AudioRawFrame):
+class OutputAudioRawFrame(DataFrame, AudioRawFrame, LightweightFrame):
     """Audio data frame for output to transport.
 
     A chunk of raw audio that will be played by the output transport. If the
@@ -211,7 +259,7 @@ class OutputAudioRawFrame(DataFrame, AudioRawFrame):
     """
 
     def __post_init__(self):
-        super().__post_init__()
+        self._init_lightweight()
         self.num_frames = int(len(self.audio) / (self.num_channels * 2))
 
     def __str__(self):
@@ -936,6 +984,40 @@ class BotInterruptionFrame(SystemFrame):
     pass
 
 
+@dataclass
+class SpeculativeLLMCommitFrame(SystemFrame):
+    """Frame releasing the buffered output of a speculative LLM request.
+
+    Pushed downstream by the user context aggregator when the final
+    transcription matches the interim transcription a speculative LLM
+    request was started with. See `SpeculativeLLMStartFrame`.
+
+    Parameters:
+        speculation_id: Identifier of the speculative request to commit.
+    """
+
+    speculation_id: int
+
+
+@dataclass
+class SpeculativeLLMCancelFrame(SystemFrame):
+    """Frame discarding the output of a speculative LLM request.
+
+    Pushed downstream by the user context aggregator when the final
+    transcription doesn't match the interim transcription a speculative LLM
+    request was started with. The LLM service stops the request (running or
+    still queued) and `SpeculativeResponseGate` drops whatever it already
+    generated. Processors after the gate never see it, so unlike a
+    `StartInterruptionFrame` it doesn't affect audio being played. See
+    `SpeculativeLLMStartFrame`.
+
+    Parameters:
+        speculation_id: Identifier of the speculative request to cancel.
+    """
+
+    speculation_id: int
+
+
 @dataclass
 class BotStartedSpeakingFrame(SystemFrame):
     """Frame indicating the bot started speaking.
@@ -1054,10 +1136,13 @@ class FunctionCallResultProperties:
     Parameters:
         run_llm: Whether to run the LLM after receiving this result.
         on_context_updated: Callback to execute when context is updated.
+        cacheable: Whether the result can be reused by the function call
+            result cache. Set it to False when the result reports a failure.
     """
 
     run_llm: Optional[bool] = None
     on_context_updated: Optional[Callable[[], Awaitable[None]]] = None
+    cacheable: bool = True
 
 
 @dataclass
@@ -1133,7 +1218,7 @@ class UserImageRequestFrame(SystemFrame):
 
 
 @dataclass
-class InputAudioRawFrame(SystemFrame, AudioRawFrame):
+class InputAudioRawFrame(SystemFrame, AudioRawFrame, LightweightFrame):
     """Raw audio input frame from transport.
 
     A chunk of audio usually coming from an input transport. If the transport
@@ -1142,7 +1227,7 @@ class InputAudioRawFrame(SystemFrame, AudioRawFrame):
     """
 
     def __post_init__(self):
-        super().__post_init__()
+        self._init_lightweight()
         self.num_frames = int(len(self.audio) / (self.num_channels * 2))
 
     def __str__(self):
@@ -1379,6 +1464,23 @@ class LLMFullResponseEndFrame(ControlFrame):
         self.skip_tts = False
 
 
+@dataclass
+class SpeculativeLLMStartFrame(ControlFrame):
+    """Frame marking the start of a speculative LLM request.
+
+    Pushed by the user context aggregator right before the context frame of a
+    speculative request. A `SpeculativeResponseGate` after the LLM buffers the
+    response that follows until a `SpeculativeLLMCommitFrame` with the same
+    identifier arrives, or drops it on a `SpeculativeLLMCancelFrame` with the
+    same identifier or a `StartInterruptionFrame`.
+
+    Parameters:
+        speculation_id: Identifier of the speculative request.
+    """
+
+    speculation_id: int
+
+
 @dataclass
 class TTSStartedFrame(ControlFrame):
     """Frame indicating the beginning of a TTS response.
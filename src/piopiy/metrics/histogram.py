@@ -0,0 +1,184 @@
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Lightweight latency histograms for hot-path measurements.
+
+Recording a value is a bisect and an increment, cheap enough to do for every
+audio frame. Buckets are fixed (roughly logarithmic from 10 µs to 10 s), so
+histograms from different sessions or processes can be merged by adding
+counts.
+"""
+
+import asyncio
+import bisect
+import time
+import weakref
+from typing import Dict, List, Optional
+
+# Upper bounds of the buckets, in seconds.
+DEFAULT_BUCKETS: List[float] = [m * 10.0**e for e in range(-5, 1) for m in (1.0, 2.0, 5.0)] + [10.0]
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of durations in seconds."""
+
+    def __init__(self, buckets: Optional[List[float]] = None):
+        """Initialize the histogram.
+
+        Args:
+            buckets: Sorted bucket upper bounds in seconds. Values above the
+                last bound are counted in an overflow bucket.
+        """
+        self._buckets = buckets or DEFAULT_BUCKETS
+        self._counts = [0] * (len(self._buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+
+    @property
+    def count(self) -> int:
+        """Number of recorded values."""
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        """Mean of the recorded values."""
+        return self._sum / self._count if self._count else 0.0
+
+    @property
+    def max(self) -> float:
+        """Largest recorded value."""
+        return self._max
+
+    def record(self, value: float):
+        """Record a duration in seconds."""
+        self._counts[bisect.bisect_left(self._buckets, value)] += 1
+        self._count += 1
+        self._sum += value
+        if value > self._max:
+            self._max = value
+
+    def percentile(self, p: float) -> float:
+        """Return an upper bound for the ``p``-th percentile (0-100).
+
+        The result is the upper bound of the bucket containing the percentile
+        (or the maximum for the overflow bucket).
+        """
+        if not self._count:
+            return 0.0
+        target = self._count * p / 100.0
+        cumulative = 0
+        for i, n in enumerate(self._counts):
+            cumulative += n
+            if cumulative >= target and n:
+                return self._buckets[i] if i < len(self._buckets) else self._max
+        return self._max
+
+    def merge(self, other: "LatencyHistogram"):
+        """Add the counts of another histogram with the same buckets."""
+        if other._buckets != self._buckets:
+            raise ValueError("Cannot merge histograms with different buckets")
+        self._counts = [a + b for a, b in zip(self._counts, other._counts)]
+        self._count += other._count
+        self._sum += other._sum
+        self._max = max(self._max, other._max)
+
+    def reset(self):
+        """Clear all recorded values."""
+        self._counts = [0] * (len(self._buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+
+    def snapshot(self) -> Dict[str, float]:
+        """Return a summary (count, mean, p50, p95, p99, max) in seconds."""
+        return {
+            "count": self._count,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self._max,
+        }
+
+
+class LoopLagProbe:
+    """Records event loop lag into histograms.
+
+    A timer is scheduled every ``interval_secs``; how late it fires is the
+    time the loop was busy with other callbacks. Every measurement is
+    recorded into all subscribed histograms, and the timer only runs while
+    there is at least one of them.
+
+    Sessions share an event loop, so they should share its probe too (see
+    `get_loop_lag_probe()`) instead of each adding a timer to the loop they
+    are measuring.
+    """
+
+    def __init__(self, interval_secs: float = 0.1):
+        """Initialize the probe.
+
+        Args:
+            interval_secs: Time between probes.
+        """
+        self._interval_secs = interval_secs
+        self._histograms: List[LatencyHistogram] = []
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._expected = 0.0
+
+    @property
+    def running(self) -> bool:
+        """Whether the probe timer is scheduled."""
+        return self._handle is not None
+
+    def subscribe(self, histogram: LatencyHistogram):
+        """Record lag into ``histogram``, starting the probe if needed.
+
+        Must be called from the loop being probed.
+
+        Args:
+            histogram: Histogram receiving the lag measurements.
+        """
+        if histogram not in self._histograms:
+            self._histograms.append(histogram)
+        if not self._handle:
+            self._schedule(asyncio.get_running_loop())
+
+    def unsubscribe(self, histogram: LatencyHistogram):
+        """Stop recording into ``histogram``, stopping the probe if it was the last one.
+
+        Args:
+            histogram: Histogram previously passed to `subscribe()`.
+        """
+        if histogram in self._histograms:
+            self._histograms.remove(histogram)
+        if not self._histograms and self._handle:
+            self._handle.cancel()
+            self._handle = None
+
+    def _schedule(self, loop: asyncio.AbstractEventLoop):
+        self._expected = time.monotonic() + self._interval_secs
+        self._handle = loop.call_later(self._interval_secs, self._fire, loop)
+
+    def _fire(self, loop: asyncio.AbstractEventLoop):
+        lag = max(0.0, time.monotonic() - self._expected)
+        for histogram in self._histograms:
+            histogram.record(lag)
+        self._schedule(loop)
+
+
+_loop_lag_probes: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, LoopLagProbe]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_loop_lag_probe() -> LoopLagProbe:
+    """Return the lag probe shared by everything on the running event loop."""
+    loop = asyncio.get_running_loop()
+    probe = _loop_lag_probes.get(loop)
+    if probe is None:
+        probe = _loop_lag_probes[loop] = LoopLagProbe()
+    return probe
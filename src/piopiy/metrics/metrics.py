@@ -48,6 +48,73 @@ class ProcessingMetricsData(MetricsData):
     value: float
 
 
+class TTSFirstAudioMetricsData(MetricsData):
+    """Time from the first text of a response to the first TTS audio.
+
+    Unlike TTFB, which is measured per TTS request, this includes the time
+    spent aggregating text before the first request is sent.
+
+    Parameters:
+        value: Time to first audio in seconds.
+    """
+
+    value: float
+
+
+class InviteToFirstAudioMetricsData(MetricsData):
+    """Call answer latency metrics data.
+
+    Parameters:
+        value: Time in seconds from the session invite to the bot's first
+            audio.
+        prewarmed: Whether the session used a pre-warmed pipeline.
+    """
+
+    value: float
+    prewarmed: bool
+
+
+class TTSCacheMetricsData(MetricsData):
+    """TTS audio cache lookup metrics data.
+
+    Parameters:
+        hit: Whether the phrase was served from the cache.
+        hit_rate: Hit rate of the cache so far.
+    """
+
+    hit: bool
+    hit_rate: float
+
+
+class WebsocketPoolMetricsData(MetricsData):
+    """Websocket warm pool connection metrics data.
+
+    Parameters:
+        hit: Whether a pre-connected websocket was used.
+        wait_time: Time waited for the websocket in seconds.
+        idle_connections: Pre-connected websockets left for the same URL.
+    """
+
+    hit: bool
+    wait_time: float
+    idle_connections: int
+
+
+class FunctionCallCacheMetricsData(MetricsData):
+    """Function call result cache lookup metrics data.
+
+    Parameters:
+        function_name: Name of the function called.
+        hit: Whether the result came from the cache or an identical call
+            in flight.
+        hit_rate: Hit rate of the function's cache so far.
+    """
+
+    function_name: str
+    hit: bool
+    hit_rate: float
+
+
 class LLMTokenUsage(BaseModel):
     """Token usage statistics for LLM operations.
 
@@ -96,6 +163,8 @@ class SmartTurnMetricsData(MetricsData):
         inference_time_ms: Time taken for inference in milliseconds.
         server_total_time_ms: Total server processing time in milliseconds.
         e2e_processing_time_ms: End-to-end processing time in milliseconds.
+        queue_wait_time_ms: Time the prediction waited for an inference
+            worker in milliseconds (local inference engines only).
     """
 
     is_complete: bool
@@ -103,3 +172,4 @@ class SmartTurnMetricsData(MetricsData):
     inference_time_ms: float
     server_total_time_ms: float
     e2e_processing_time_ms: float
+    queue_wait_time_ms: float = 0.0
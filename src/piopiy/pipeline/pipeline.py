@@ -102,6 +102,7 @@ class Pipeline(BasePipeline):
         *,
         source: Optional[FrameProcessor] = None,
         sink: Optional[FrameProcessor] = None,
+        fuse_inline_processors: bool = True,
     ):
         """Initialize the pipeline with a list of processors.
 
@@ -109,9 +110,17 @@ class Pipeline(BasePipeline):
             processors: List of frame processors to connect in sequence.
             source: An optional pipeline source processor.
             sink: An optional pipeline sink processor.
+            fuse_inline_processors: Run processors that declare `inline_safe`
+                in direct mode, fused into the task of the processor before
+                them, instead of in their own tasks.
         """
         super().__init__(enable_direct_mode=True)
 
+        if fuse_inline_processors:
+            for p in processors:
+                if p.inline_safe and not p.direct_mode:
+                    p.enable_direct_mode()
+
         # Add a source and a sink queue so we can forward frames upstream and
         # downstream outside of the pipeline.
         self._source = source or PipelineSource(self.push_frame, name=f"{self}::Source")
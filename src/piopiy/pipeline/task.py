@@ -50,6 +50,7 @@ from piopiy.pipeline.pipeline import Pipeline, PipelineSink, PipelineSource
 from piopiy.pipeline.task_observer import TaskObserver
 from piopiy.processors.frame_processor import FrameDirection, FrameProcessor, FrameProcessorSetup
 from piopiy.utils.asyncio.task_manager import BaseTaskManager, TaskManager, TaskManagerParams
+from piopiy.utils.hot_path_logging import trace_enabled
 from piopiy.utils.tracing.setup import is_tracing_available
 from piopiy.utils.tracing.turn_trace_observer import TurnTraceObserver
 
@@ -707,7 +708,8 @@ class PipelineTask(BasePipelineTask):
             try:
                 frame = await asyncio.wait_for(self._heartbeat_queue.get(), timeout=wait_time)
                 process_time = (self._clock.get_time() - frame.timestamp) / 1_000_000_000
-                logger.trace(f"{self}: heartbeat frame processed in {process_time} seconds")
+                if __debug__ and trace_enabled():
+                    logger.trace("{}: heartbeat frame processed in {} seconds", self, process_time)
                 self._heartbeat_queue.task_done()
             except asyncio.TimeoutError:
                 logger.warning(
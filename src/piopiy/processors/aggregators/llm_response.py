@@ -12,6 +12,10 @@ LLM processing, and text-to-speech components in conversational AI pipelines.
 """
 
 import asyncio
+import copy
+import itertools
+import re
+import time
 import warnings
 from abc import abstractmethod
 from dataclasses import dataclass
@@ -47,6 +51,9 @@ from piopiy.frames.frames import (
     LLMSetToolsFrame,
     LLMTextFrame,
     OpenAILLMContextAssistantTimestampFrame,
+    SpeculativeLLMCancelFrame,
+    SpeculativeLLMCommitFrame,
+    SpeculativeLLMStartFrame,
     SpeechControlParamsFrame,
     StartFrame,
     StartInterruptionFrame,
@@ -78,11 +85,24 @@ class LLMUserAggregatorParams:
         enable_emulated_vad_interruptions: When True, allows emulated VAD events
             to interrupt the bot when it's speaking. When False, emulated speech
             is ignored while the bot is speaking.
+        enable_speculative_llm: When True, `LLMUserContextAggregator` starts
+            an LLM request with the latest interim transcription as soon as
+            the user stops speaking. The response is held by a
+            `SpeculativeResponseGate` after the LLM and released when the
+            final transcription matches, or discarded (and the request
+            re-issued) when it doesn't. Not used while the bot is speaking or
+            when the context has tools, since function calls would run before
+            the transcription is confirmed.
+        speculative_final_timeout: Maximum time in seconds to wait for the
+            final transcription of a speculative request. If only interim
+            transcriptions arrive by then, the latest one is taken as final.
     """
 
     aggregation_timeout: float = 0.5
     turn_emulated_vad_timeout: float = 0.8
     enable_emulated_vad_interruptions: bool = False
+    enable_speculative_llm: bool = False
+    speculative_final_timeout: float = 1.5
 
 
 @dataclass
@@ -393,6 +413,8 @@ class LLMUserContextAggregator(LLMContextResponseAggregator):
     - Interim vs final transcriptions
     - User interruptions during bot speech
     - Emulated VAD for whispered or short utterances
+    - Speculative LLM requests on interim transcriptions (see
+      `LLMUserAggregatorParams.enable_speculative_llm`)
 
     The aggregator uses timeouts to handle cases where transcriptions arrive
     after VAD events or when no VAD is available.
@@ -439,12 +461,21 @@ class LLMUserContextAggregator(LLMContextResponseAggregator):
         self._aggregation_event = asyncio.Event()
         self._aggregation_task = None
 
+        # Speculative LLM execution state.
+        self._interim_text = ""
+        self._speculation_ids = itertools.count(1)
+        self._speculation_id: Optional[int] = None
+        self._speculation_text = ""
+        self._speculation_messages: Optional[List[dict]] = None
+        self._speculation_started_at = 0.0
+
     async def reset(self):
         """Reset the aggregation state and interruption strategies."""
         await super().reset()
         self._was_bot_speaking = False
         self._seen_interim_results = False
         self._waiting_for_aggregation = False
+        self._interim_text = ""
         [await s.reset() for s in self._interruption_strategies]
 
     async def handle_aggregation(self, aggregation: str):
@@ -523,6 +554,19 @@ class LLMUserContextAggregator(LLMContextResponseAggregator):
 
     async def push_aggregation(self):
         """Push the current aggregation based on interruption strategies and conditions."""
+        if self._speculation_id is not None:
+            if self._seen_interim_results:
+                # Still waiting for the final transcription of the speculative
+                # text. Some STT services never finalize a transcription, so
+                # eventually take the latest interim one as final.
+                elapsed = time.monotonic() - self._speculation_started_at
+                if elapsed < self._params.speculative_final_timeout:
+                    return
+                logger.debug(f"{self}: no final transcription, using the interim one")
+                self._take_interim_transcription()
+            if await self._resolve_speculation():
+                return
+
         if len(self._aggregation) > 0:
             if self.interruption_strategies and self._bot_speaking:
                 should_interrupt = await self._should_interrupt_based_on_strategies()
@@ -595,6 +639,10 @@ class LLMUserContextAggregator(LLMContextResponseAggregator):
             await s.append_audio(frame.audio, frame.sample_rate)
 
     async def _handle_user_started_speaking(self, frame: UserStartedSpeakingFrame):
+        # The user kept talking, so the speculative request is outdated.
+        if self._speculation_id is not None:
+            await self._cancel_speculation()
+
         self._user_speaking = True
         self._waiting_for_aggregation = True
         self._was_bot_speaking = self._bot_speaking
@@ -613,6 +661,10 @@ class LLMUserContextAggregator(LLMContextResponseAggregator):
         if len(self._aggregation) > 0:
             if not self._seen_interim_results:
                 await self.push_aggregation()
+            else:
+                await self._maybe_start_speculation()
+        elif self._seen_interim_results:
+            await self._maybe_start_speculation()
         # Handles the case where both the user and the bot are not speaking,
         # and the bot was previously speaking before the user interruption.
         # So in this case we are resetting the aggregation timer
@@ -636,11 +688,93 @@ class LLMUserContextAggregator(LLMContextResponseAggregator):
         self._aggregation += f" {text}" if self._aggregation else text
         # We just got a final result, so let's reset interim results.
         self._seen_interim_results = False
+        self._interim_text = ""
+
+        # If the final transcription confirms the speculative request there
+        # is no need to wait for the aggregation timeout.
+        if (
+            self._speculation_id is not None
+            and not self._user_speaking
+            and _normalize_transcript(self._aggregation)
+            == _normalize_transcript(self._speculation_text)
+        ):
+            await self._resolve_speculation()
+            return
+
         # Reset aggregation timer.
         self._aggregation_event.set()
 
-    async def _handle_interim_transcription(self, _: InterimTranscriptionFrame):
+    async def _handle_interim_transcription(self, frame: InterimTranscriptionFrame):
         self._seen_interim_results = True
+        self._interim_text = frame.text
+
+    async def _maybe_start_speculation(self):
+        """Start a speculative LLM request with the latest interim transcription."""
+        if (
+            not self._params.enable_speculative_llm
+            or self._speculation_id is not None
+            or self._bot_speaking
+            or not self._interim_text.strip()
+            or self._context.tools
+        ):
+            return
+
+        text = f"{self._aggregation} {self._interim_text}".strip()
+
+        # Snapshot the messages so the speculative user message can be undone.
+        # Some contexts merge consecutive messages in place, so copy deeply.
+        self._speculation_messages = copy.deepcopy(self._context.get_messages())
+        self._speculation_id = next(self._speculation_ids)
+        self._speculation_text = text
+        self._speculation_started_at = time.monotonic()
+
+        logger.debug(f"{self}: starting speculative LLM request [{text}]")
+        await self.handle_aggregation(text)
+        await self.push_frame(SpeculativeLLMStartFrame(speculation_id=self._speculation_id))
+        await self.push_frame(OpenAILLMContextFrame(self._context))
+
+    async def _resolve_speculation(self) -> bool:
+        """Commit the speculative request if it matches the aggregation.
+
+        Returns:
+            True if the speculative request was committed, False if it was
+            cancelled and the aggregation still needs to be pushed.
+        """
+        if _normalize_transcript(self._aggregation) == _normalize_transcript(
+            self._speculation_text
+        ):
+            logger.debug(f"{self}: committing speculative LLM request")
+            speculation_id = self._speculation_id
+            self._clear_speculation()
+            await self.reset()
+            await self.push_frame(SpeculativeLLMCommitFrame(speculation_id=speculation_id))
+            return True
+
+        await self._cancel_speculation()
+        return False
+
+    async def _cancel_speculation(self):
+        """Discard the speculative request and restore the context."""
+        logger.debug(f"{self}: cancelling speculative LLM request")
+        speculation_id = self._speculation_id
+        self._context.set_messages(self._speculation_messages)
+        self._clear_speculation()
+        # The LLM stops the request and the gate drops its output. Unlike an
+        # interruption this doesn't reach the TTS or the transport.
+        await self.push_frame(SpeculativeLLMCancelFrame(speculation_id=speculation_id))
+
+    def _take_interim_transcription(self):
+        """Append the latest interim transcription to the aggregation."""
+        text = self._interim_text.strip()
+        if text:
+            self._aggregation += f" {text}" if self._aggregation else text
+        self._seen_interim_results = False
+        self._interim_text = ""
+
+    def _clear_speculation(self):
+        self._speculation_id = None
+        self._speculation_text = ""
+        self._speculation_messages = None
 
     def _create_aggregation_task(self):
         if not self._aggregation_task:
@@ -729,6 +863,11 @@ class LLMUserContextAggregator(LLMContextResponseAggregator):
                 self._emulating_vad = True
 
 
+def _normalize_transcript(text: str) -> List[str]:
+    """Return the words of a transcription, ignoring case and punctuation."""
+    return re.sub(r"[^\w\s]", "", text.lower()).split()
+
+
 class LLMAssistantContextAggregator(LLMContextResponseAggregator):
     """Assistant LLM aggregator that processes bot responses and function calls.
 
@@ -0,0 +1,159 @@
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Gate holding back the output of speculative LLM requests.
+
+This module provides the processor that sits right after the LLM when
+speculative execution is enabled in `LLMUserContextAggregator`. It buffers
+the response of a speculative request until the aggregator commits it.
+"""
+
+from typing import List, Optional, Set, Tuple
+
+from loguru import logger
+
+from piopiy.frames.frames import (
+    EndFrame,
+    Frame,
+    LLMFullResponseEndFrame,
+    SpeculativeLLMCancelFrame,
+    SpeculativeLLMCommitFrame,
+    SpeculativeLLMStartFrame,
+    StartInterruptionFrame,
+    SystemFrame,
+)
+from piopiy.processors.frame_processor import FrameDirection, FrameProcessor
+
+
+class SpeculativeResponseGate(FrameProcessor):
+    """Buffers speculative LLM output until it is committed.
+
+    After a `SpeculativeLLMStartFrame`, downstream non-system frames are
+    accumulated. A matching `SpeculativeLLMCommitFrame` releases them (and
+    lets the rest of the response through). A matching
+    `SpeculativeLLMCancelFrame` discards them and drops the rest of the
+    response, up to its `LLMFullResponseEndFrame` (the LLM service stops the
+    request when the same frame goes through it). Cancels are not passed on,
+    so the TTS and the transport are not interrupted. A
+    `StartInterruptionFrame` or an `EndFrame` discards them too.
+    System frames are never blocked. The gate is `inline_safe`, so pipelines
+    fuse it into the LLM task.
+
+    Place it between the LLM and the TTS service::
+
+        pipeline = Pipeline([
+            transport.input(),
+            stt,
+            context_aggregator.user(),
+            llm,
+            SpeculativeResponseGate(),
+            tts,
+            transport.output(),
+            context_aggregator.assistant(),
+        ])
+    """
+
+    inline_safe = True
+
+    def __init__(self, **kwargs):
+        """Initialize the speculative response gate.
+
+        Args:
+            **kwargs: Additional arguments passed to the parent FrameProcessor.
+        """
+        super().__init__(**kwargs)
+        self._speculation_id: Optional[int] = None
+        self._accumulator: List[Tuple[Frame, FrameDirection]] = []
+        # Whether the current speculative response is being dropped.
+        self._cancelled = False
+        # Commits and cancels can overtake their start frame, since system
+        # frames are not queued behind the LLM request being processed.
+        self._early_commits: Set[int] = set()
+        self._early_cancels: Set[int] = set()
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        """Process frames, buffering speculative output.
+
+        Args:
+            frame: The frame to process.
+            direction: The direction of the frame flow.
+        """
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, SpeculativeLLMStartFrame):
+            self._handle_start(frame)
+        elif isinstance(frame, SpeculativeLLMCommitFrame):
+            await self._handle_commit(frame)
+        elif isinstance(frame, SpeculativeLLMCancelFrame):
+            self._handle_cancel(frame)
+        elif isinstance(frame, (StartInterruptionFrame, EndFrame)):
+            # Never hold the end of the pipeline behind an uncommitted response.
+            self._discard()
+            await self.push_frame(frame, direction)
+        elif (
+            self._speculation_id is not None
+            and direction == FrameDirection.DOWNSTREAM
+            and not isinstance(frame, SystemFrame)
+        ):
+            if not self._cancelled:
+                self._accumulator.append((frame, direction))
+            elif isinstance(frame, LLMFullResponseEndFrame):
+                # The cancelled response is over, let the next one through.
+                self._speculation_id = None
+                self._cancelled = False
+        else:
+            await self.push_frame(frame, direction)
+
+    def _handle_start(self, frame: SpeculativeLLMStartFrame):
+        # Identifiers increase, so older early commits and cancels are for
+        # requests that will never start (e.g. dropped by the LLM).
+        self._early_commits = {i for i in self._early_commits if i >= frame.speculation_id}
+        self._early_cancels = {i for i in self._early_cancels if i >= frame.speculation_id}
+        if frame.speculation_id in self._early_commits:
+            self._early_commits.discard(frame.speculation_id)
+            return
+        self._speculation_id = frame.speculation_id
+        if frame.speculation_id in self._early_cancels:
+            self._early_cancels.discard(frame.speculation_id)
+            self._cancelled = True
+
+    async def _handle_commit(self, frame: SpeculativeLLMCommitFrame):
+        if frame.speculation_id != self._speculation_id:
+            self._early_commits.add(frame.speculation_id)
+            return
+
+        logger.debug(f"{self}: committing speculative response ({len(self._accumulator)} frames)")
+        # Frames can still arrive while we push, keep buffering them until
+        # the accumulator is empty so they are not released out of order.
+        while self._accumulator:
+            f, d = self._accumulator.pop(0)
+            await self.push_frame(f, d)
+        self._speculation_id = None
+
+    def _handle_cancel(self, frame: SpeculativeLLMCancelFrame):
+        if frame.speculation_id != self._speculation_id:
+            self._early_cancels.add(frame.speculation_id)
+            return
+
+        logger.debug(f"{self}: discarding speculative response ({len(self._accumulator)} frames)")
+        # Keep dropping until the end of the response, unless it already ended.
+        response_ended = any(isinstance(f, LLMFullResponseEndFrame) for f, _ in self._accumulator)
+        self._accumulator = []
+        if response_ended:
+            self._speculation_id = None
+        else:
+            self._cancelled = True
+
+    def _discard(self):
+        if self._speculation_id is not None:
+            logger.debug(
+                f"{self}: discarding speculative response ({len(self._accumulator)} frames)"
+            )
+        self._speculation_id = None
+        self._cancelled = False
+        self._accumulator = []
+        self._early_commits.clear()
+        self._early_cancels.clear()
@@ -51,8 +51,13 @@ class AudioBufferProcessor(FrameProcessor):
     - Automatic resampling of incoming audio to match desired sample_rate
     - Silence insertion for non-continuous audio streams
     - Buffer synchronization between user and bot audio
+
+    The processor is `inline_safe`, so pipelines run it in the task of the
+    processor before it instead of in its own tasks.
     """
 
+    inline_safe = True
+
     def __init__(
         self,
         *,
@@ -61,6 +66,7 @@ class AudioBufferProcessor(FrameProcessor):
         buffer_size: int = 0,
         user_continuous_stream: Optional[bool] = None,
         enable_turn_audio: bool = False,
+        resampler_quality: str = "VHQ",
         **kwargs,
     ):
         """Initialize the audio buffer processor.
@@ -76,6 +82,8 @@ class AudioBufferProcessor(FrameProcessor):
                     This parameter no longer has any effect and will be removed in a future version.
 
             enable_turn_audio: Whether turn audio event handlers should be triggered.
+            resampler_quality: Quality tier of the audio resamplers, see
+                `create_stream_resampler`.
             **kwargs: Additional arguments passed to parent class.
         """
         super().__init__(**kwargs)
@@ -110,8 +118,8 @@ class AudioBufferProcessor(FrameProcessor):
 
         self._recording = False
 
-        self._input_resampler = create_stream_resampler()
-        self._output_resampler = create_stream_resampler()
+        self._input_resampler = create_stream_resampler(resampler_quality)
+        self._output_resampler = create_stream_resampler(resampler_quality)
 
         self._register_event_handler("on_audio_data")
         self._register_event_handler("on_track_audio_data")
@@ -20,6 +20,8 @@ class FrameFilter(FrameProcessor):
     automatically allowed to pass through to maintain pipeline integrity.
     """
 
+    inline_safe = True
+
     def __init__(self, types: Tuple[Type[Frame], ...]):
         """Initialize the frame filter.
 
@@ -22,6 +22,8 @@ class IdentityFilter(FrameProcessor):
     create pipelines that pass through frames (no frames should be repeated).
     """
 
+    inline_safe = True
+
     def __init__(self, **kwargs):
         """Initialize the identity filter.
 
@@ -23,6 +23,8 @@ class NullFilter(FrameProcessor):
     frames to maintain proper pipeline operation.
     """
 
+    inline_safe = True
+
     def __init__(self, **kwargs):
         """Initialize the null filter.
 
@@ -14,7 +14,7 @@ management, and frame flow control mechanisms.
 import asyncio
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Awaitable, Callable, Coroutine, List, Optional, Sequence, Tuple
+from typing import Any, Awaitable, Callable, ClassVar, Coroutine, List, Optional, Sequence, Tuple
 
 from loguru import logger
 
@@ -38,6 +38,7 @@ from piopiy.observers.base_observer import BaseObserver, FrameProcessed, FramePu
 from piopiy.processors.metrics.frame_processor_metrics import FrameProcessorMetrics
 from piopiy.utils.asyncio.task_manager import BaseTaskManager
 from piopiy.utils.base_object import BaseObject
+from piopiy.utils.hot_path_logging import trace_enabled
 
 
 class FrameDirection(Enum):
@@ -136,8 +137,20 @@ class FrameProcessor(BaseObject):
     task. System frames are also processed in a separate task which guarantees
     frame priority.
 
+    Processors that set ``inline_safe`` are run by pipelines in direct mode:
+    their frames are handled inline, in the task of the processor pushing
+    them, which fuses chains of such processors and saves two queue hops per
+    processor and frame. Only set it when ``process_frame()`` is quick, never
+    blocks and needs no pause/resume. Its state must also cope with frames
+    arriving from the tasks of its neighbours, one task per direction and
+    frame kind, which is what the processor's own input and process tasks
+    already do. Filters, loggers, ``SpeculativeResponseGate`` (every LLM
+    token) and ``AudioBufferProcessor`` (every audio frame) qualify.
+
     """
 
+    inline_safe: ClassVar[bool] = False
+
     def __init__(
         self,
         *,
@@ -215,6 +228,27 @@ class FrameProcessor(BaseObject):
         self.__process_event: Optional[asyncio.Event] = None
         self.__process_frame_task: Optional[asyncio.Task] = None
 
+    @property
+    def direct_mode(self) -> bool:
+        """Check if frames are processed inline instead of through queues.
+
+        Returns:
+            True if direct mode is enabled.
+        """
+        return self._enable_direct_mode
+
+    def enable_direct_mode(self):
+        """Process frames inline, in the task of the caller, from now on.
+
+        Must be called before the processor is set up.
+
+        Raises:
+            Exception: If the processor is already set up.
+        """
+        if self._task_manager:
+            raise Exception(f"{self}: direct mode must be enabled before setup")
+        self._enable_direct_mode = True
+
     @property
     def id(self) -> int:
         """Get the unique identifier for this processor.
@@ -543,23 +577,23 @@ class FrameProcessor(BaseObject):
 
     async def pause_processing_frames(self):
         """Pause processing of queued frames."""
-        logger.trace(f"{self}: pausing frame processing")
+        logger.trace("{}: pausing frame processing", self)
         self.__should_block_frames = True
 
     async def pause_processing_system_frames(self):
         """Pause processing of queued system frames."""
-        logger.trace(f"{self}: pausing system frame processing")
+        logger.trace("{}: pausing system frame processing", self)
         self.__should_block_system_frames = True
 
     async def resume_processing_frames(self):
         """Resume processing of queued frames."""
-        logger.trace(f"{self}: resuming frame processing")
+        logger.trace("{}: resuming frame processing", self)
         if self.__process_event:
             self.__process_event.set()
 
     async def resume_processing_system_frames(self):
         """Resume processing of queued system frames."""
-        logger.trace(f"{self}: resuming system frame processing")
+        logger.trace("{}: resuming system frame processing", self)
         if self.__input_event:
             self.__input_event.set()
 
@@ -689,7 +723,8 @@ class FrameProcessor(BaseObject):
         try:
             timestamp = self._clock.get_time() if self._clock else 0
             if direction == FrameDirection.DOWNSTREAM and self._next:
-                logger.trace(f"Pushing {frame} from {self} to {self._next}")
+                if __debug__ and trace_enabled():
+                    logger.trace("Pushing {} from {} to {}", frame, self, self._next)
 
                 if self._observer:
                     data = FramePushed(
@@ -702,7 +737,8 @@ class FrameProcessor(BaseObject):
                     await self._observer.on_push_frame(data)
                 await self._next.queue_frame(frame, direction)
             elif direction == FrameDirection.UPSTREAM and self._prev:
-                logger.trace(f"Pushing {frame} upstream from {self} to {self._prev}")
+                if __debug__ and trace_enabled():
+                    logger.trace("Pushing {} upstream from {} to {}", frame, self, self._prev)
                 if self._observer:
                     data = FramePushed(
                         source=self,
@@ -785,11 +821,11 @@ class FrameProcessor(BaseObject):
         """
         while True:
             if self.__should_block_system_frames and self.__input_event:
-                logger.trace(f"{self}: system frame processing paused")
+                logger.trace("{}: system frame processing paused", self)
                 await self.__input_event.wait()
                 self.__input_event.clear()
                 self.__should_block_system_frames = False
-                logger.trace(f"{self}: system frame processing resumed")
+                logger.trace("{}: system frame processing resumed", self)
 
             (frame, direction, callback) = await self.__input_queue.get()
 
@@ -808,11 +844,11 @@ class FrameProcessor(BaseObject):
         """Handle non-system frames from the process queue."""
         while True:
             if self.__should_block_frames and self.__process_event:
-                logger.trace(f"{self}: frame processing paused")
+                logger.trace("{}: frame processing paused", self)
                 await self.__process_event.wait()
                 self.__process_event.clear()
                 self.__should_block_frames = False
-                logger.trace(f"{self}: frame processing resumed")
+                logger.trace("{}: frame processing resumed", self)
 
             (frame, direction, callback) = await self.__process_queue.get()
 
@@ -30,6 +30,8 @@ class FrameLogger(FrameProcessor):
     debugging frame flow and understanding pipeline behavior.
     """
 
+    inline_safe = True
+
     def __init__(
         self,
         prefix="Frame",
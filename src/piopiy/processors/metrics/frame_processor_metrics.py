@@ -18,6 +18,7 @@ from piopiy.metrics.metrics import (
     MetricsData,
     ProcessingMetricsData,
     TTFBMetricsData,
+    TTSFirstAudioMetricsData,
     TTSUsageMetricsData,
 )
 from piopiy.utils.asyncio.task_manager import BaseTaskManager
@@ -45,6 +46,7 @@ class FrameProcessorMetrics(BaseObject):
         self._start_processing_time = 0
         self._last_ttfb_time = 0
         self._should_report_ttfb = True
+        self._start_first_audio_time = 0
 
     async def setup(self, task_manager: BaseTaskManager):
         """Set up the metrics collector with a task manager.
@@ -135,6 +137,32 @@ class FrameProcessorMetrics(BaseObject):
         self._start_ttfb_time = 0
         return MetricsFrame(data=[ttfb])
 
+    async def start_first_audio_metrics(self):
+        """Start measuring time to first audio, unless already measuring."""
+        if self._start_first_audio_time == 0:
+            self._start_first_audio_time = time.time()
+
+    async def stop_first_audio_metrics(self):
+        """Stop time to first audio measurement and generate metrics frame.
+
+        Returns:
+            MetricsFrame containing time to first audio data, or None if not measuring.
+        """
+        if self._start_first_audio_time == 0:
+            return None
+
+        value = time.time() - self._start_first_audio_time
+        logger.debug(f"{self._processor_name()} time to first audio: {value}")
+        first_audio = TTSFirstAudioMetricsData(
+            processor=self._processor_name(), value=value, model=self._model_name()
+        )
+        self._start_first_audio_time = 0
+        return MetricsFrame(data=[first_audio])
+
+    def reset_first_audio_metrics(self):
+        """Discard an in-progress time to first audio measurement."""
+        self._start_first_audio_time = 0
+
     async def start_processing_metrics(self):
         """Start measuring processing time."""
         self._start_processing_time = time.time()
@@ -45,10 +45,13 @@ class ExotelFrameSerializer(FrameSerializer):
         Parameters:
             exotel_sample_rate: Sample rate used by Exotel, defaults to 8000 Hz.
             sample_rate: Optional override for pipeline input sample rate.
+            resampler_quality: Quality tier of the audio resamplers, see
+                `create_stream_resampler`.
         """
 
         exotel_sample_rate: int = 8000
         sample_rate: Optional[int] = None
+        resampler_quality: str = "VHQ"
 
     def __init__(
         self, stream_sid: str, call_sid: Optional[str] = None, params: Optional[InputParams] = None
@@ -67,8 +70,8 @@ class ExotelFrameSerializer(FrameSerializer):
         self._exotel_sample_rate = self._params.exotel_sample_rate
         self._sample_rate = 0  # Pipeline input rate
 
-        self._input_resampler = create_stream_resampler()
-        self._output_resampler = create_stream_resampler()
+        self._input_resampler = create_stream_resampler(self._params.resampler_quality)
+        self._output_resampler = create_stream_resampler(self._params.resampler_quality)
 
     @property
     def type(self) -> FrameSerializerType:
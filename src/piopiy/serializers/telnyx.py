@@ -14,13 +14,7 @@ import aiohttp
 from loguru import logger
 from pydantic import BaseModel
 
-from piopiy.audio.utils import (
-    alaw_to_pcm,
-    create_stream_resampler,
-    pcm_to_alaw,
-    pcm_to_ulaw,
-    ulaw_to_pcm,
-)
+from piopiy.audio.g711 import G711Decoder, G711Encoder
 from piopiy.frames.frames import (
     AudioRawFrame,
     CancelFrame,
@@ -53,6 +47,8 @@ class TelnyxFrameSerializer(FrameSerializer):
         Parameters:
             telnyx_sample_rate: Sample rate used by Telnyx, defaults to 8000 Hz.
             sample_rate: Optional override for pipeline input sample rate.
+            resampler_quality: Quality tier of the audio resamplers, see
+                `create_stream_resampler`.
             inbound_encoding: Audio encoding for data sent to Telnyx (e.g., "PCMU").
             outbound_encoding: Audio encoding for data received from Telnyx (e.g., "PCMU").
             auto_hang_up: Whether to automatically terminate call on EndFrame.
@@ -60,6 +56,7 @@ class TelnyxFrameSerializer(FrameSerializer):
 
         telnyx_sample_rate: int = 8000
         sample_rate: Optional[int] = None
+        resampler_quality: str = "VHQ"
         inbound_encoding: str = "PCMU"
         outbound_encoding: str = "PCMU"
         auto_hang_up: bool = True
@@ -82,6 +79,9 @@ class TelnyxFrameSerializer(FrameSerializer):
             call_control_id: The Call Control ID for the Telnyx call (optional, but required for auto hang-up).
             api_key: Your Telnyx API key (required for auto hang-up).
             params: Configuration parameters.
+
+        Raises:
+            ValueError: If an unsupported encoding is specified.
         """
         self._stream_id = stream_id
         self._call_control_id = call_control_id
@@ -93,8 +93,13 @@ class TelnyxFrameSerializer(FrameSerializer):
         self._telnyx_sample_rate = self._params.telnyx_sample_rate
         self._sample_rate = 0  # Pipeline input rate
 
-        self._input_resampler = create_stream_resampler()
-        self._output_resampler = create_stream_resampler()
+        # Telnyx sends audio in the outbound encoding and receives it in the inbound one.
+        self._decoder = G711Decoder(
+            outbound_encoding, self._telnyx_sample_rate, quality=self._params.resampler_quality
+        )
+        self._encoder = G711Encoder(
+            inbound_encoding, self._telnyx_sample_rate, quality=self._params.resampler_quality
+        )
         self._hangup_attempted = False
 
     @property
@@ -125,9 +130,6 @@ class TelnyxFrameSerializer(FrameSerializer):
 
         Returns:
             Serialized data as string or bytes, or None if the frame isn't handled.
-
-        Raises:
-            ValueError: If an unsupported encoding is specified.
         """
         if (
             self._params.auto_hang_up
@@ -144,16 +146,7 @@ class TelnyxFrameSerializer(FrameSerializer):
             data = frame.audio
 
             # Output: Convert PCM at frame's rate to 8kHz encoded for Telnyx
-            if self._params.inbound_encoding == "PCMU":
-                serialized_data = await pcm_to_ulaw(
-                    data, frame.sample_rate, self._telnyx_sample_rate, self._output_resampler
-                )
-            elif self._params.inbound_encoding == "PCMA":
-                serialized_data = await pcm_to_alaw(
-                    data, frame.sample_rate, self._telnyx_sample_rate, self._output_resampler
-                )
-            else:
-                raise ValueError(f"Unsupported encoding: {self._params.inbound_encoding}")
+            serialized_data = self._encoder.encode(data, frame.sample_rate)
 
             if serialized_data is None or len(serialized_data) == 0:
                 # Ignoring in case we don't have audio
@@ -238,9 +231,6 @@ class TelnyxFrameSerializer(FrameSerializer):
 
         Returns:
             A Pipecat frame corresponding to the Telnyx event, or None if unhandled.
-
-        Raises:
-            ValueError: If an unsupported encoding is specified.
         """
         message = json.loads(data)
 
@@ -249,22 +239,7 @@ class TelnyxFrameSerializer(FrameSerializer):
             payload = base64.b64decode(payload_base64)
 
             # Input: Convert Telnyx's 8kHz encoded audio to PCM at pipeline input rate
-            if self._params.outbound_encoding == "PCMU":
-                deserialized_data = await ulaw_to_pcm(
-                    payload,
-                    self._telnyx_sample_rate,
-                    self._sample_rate,
-                    self._input_resampler,
-                )
-            elif self._params.outbound_encoding == "PCMA":
-                deserialized_data = await alaw_to_pcm(
-                    payload,
-                    self._telnyx_sample_rate,
-                    self._sample_rate,
-                    self._input_resampler,
-                )
-            else:
-                raise ValueError(f"Unsupported encoding: {self._params.outbound_encoding}")
+            deserialized_data = self._decoder.decode(payload, self._sample_rate)
 
             if deserialized_data is None or len(deserialized_data) == 0:
                 # Ignoring in case we don't have audio
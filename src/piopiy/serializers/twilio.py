@@ -13,7 +13,7 @@ from typing import Optional
 from loguru import logger
 from pydantic import BaseModel
 
-from piopiy.audio.utils import create_stream_resampler, pcm_to_ulaw, ulaw_to_pcm
+from piopiy.audio.g711 import G711Decoder, G711Encoder
 from piopiy.frames.frames import (
     AudioRawFrame,
     CancelFrame,
@@ -48,11 +48,14 @@ class TwilioFrameSerializer(FrameSerializer):
         Parameters:
             twilio_sample_rate: Sample rate used by Twilio, defaults to 8000 Hz.
             sample_rate: Optional override for pipeline input sample rate.
+            resampler_quality: Quality tier of the audio resamplers, see
+                `create_stream_resampler`.
             auto_hang_up: Whether to automatically terminate call on EndFrame.
         """
 
         twilio_sample_rate: int = 8000
         sample_rate: Optional[int] = None
+        resampler_quality: str = "VHQ"
         auto_hang_up: bool = True
 
     def __init__(
@@ -81,8 +84,12 @@ class TwilioFrameSerializer(FrameSerializer):
         self._twilio_sample_rate = self._params.twilio_sample_rate
         self._sample_rate = 0  # Pipeline input rate
 
-        self._input_resampler = create_stream_resampler()
-        self._output_resampler = create_stream_resampler()
+        self._decoder = G711Decoder(
+            "PCMU", self._twilio_sample_rate, quality=self._params.resampler_quality
+        )
+        self._encoder = G711Encoder(
+            "PCMU", self._twilio_sample_rate, quality=self._params.resampler_quality
+        )
         self._hangup_attempted = False
 
     @property
@@ -129,9 +136,7 @@ class TwilioFrameSerializer(FrameSerializer):
             data = frame.audio
 
             # Output: Convert PCM at frame's rate to 8kHz μ-law for Twilio
-            serialized_data = await pcm_to_ulaw(
-                data, frame.sample_rate, self._twilio_sample_rate, self._output_resampler
-            )
+            serialized_data = self._encoder.encode(data, frame.sample_rate)
             if serialized_data is None or len(serialized_data) == 0:
                 # Ignoring in case we don't have audio
                 return None
@@ -236,9 +241,7 @@ class TwilioFrameSerializer(FrameSerializer):
             payload = base64.b64decode(payload_base64)
 
             # Input: Convert Twilio's 8kHz μ-law to PCM at pipeline input rate
-            deserialized_data = await ulaw_to_pcm(
-                payload, self._twilio_sample_rate, self._sample_rate, self._input_resampler
-            )
+            deserialized_data = self._decoder.decode(payload, self._sample_rate)
             if deserialized_data is None or len(deserialized_data) == 0:
                 # Ignoring in case we don't have audio
                 return None
@@ -40,7 +40,6 @@ warnings.filterwarnings("ignore", message="invalid escape sequence", category=Sy
 # See .env.example for Cartesia configuration needed
 try:
     from cartesia import AsyncCartesia
-    from websockets.asyncio.client import connect as websocket_connect
     from websockets.protocol import State
 except ModuleNotFoundError as e:
     logger.error(f"Exception: {e}")
@@ -343,7 +342,7 @@ class CartesiaTTSService(AudioContextWordTTSService):
             if self._websocket and self._websocket.state is State.OPEN:
                 return
             logger.debug("Connecting to Cartesia")
-            self._websocket = await websocket_connect(
+            self._websocket = await self._open_websocket(
                 f"{self._url}?api_key={self._api_key}&cartesia_version={self._cartesia_version}"
             )
         except Exception as e:
@@ -22,6 +22,7 @@ from piopiy.frames.frames import (
     TTSStoppedFrame,
 )
 from piopiy.services.tts_service import TTSService
+from piopiy.utils.http_clients import get_http_client_registry
 from piopiy.utils.tracing.service_decorators import traced_tts
 
 try:
@@ -67,8 +68,12 @@ class DeepgramTTSService(TTSService):
         }
         self.set_voice(voice)
 
-        client_options = DeepgramClientOptions(url=base_url)
-        self._deepgram_client = DeepgramClient(api_key, config=client_options)
+        self._deepgram_client = get_http_client_registry().shared_client(
+            "deepgram",
+            base_url,
+            api_key,
+            lambda: DeepgramClient(api_key, config=DeepgramClientOptions(url=base_url)),
+        )
 
     def can_generate_metrics(self) -> bool:
         """Check if the service can generate metrics.
@@ -34,7 +34,6 @@ from piopiy.utils.tracing.service_decorators import traced_tts
 
 try:
     import ormsgpack
-    from websockets.asyncio.client import connect as websocket_connect
     from websockets.protocol import State
 except ModuleNotFoundError as e:
     logger.error(f"Exception: {e}")
@@ -217,7 +216,7 @@ class FishAudioTTSService(InterruptibleTTSService):
             logger.debug("Connecting to Fish Audio")
             headers = {"Authorization": f"Bearer {self._api_key}"}
             headers["model"] = self.model_name
-            self._websocket = await websocket_connect(self._base_url, additional_headers=headers)
+            self._websocket = await self._open_websocket(self._base_url, additional_headers=headers)
 
             # Send initial start message with ormsgpack
             start_message = {"event": "start", "request": {"text": "", **self._settings}}
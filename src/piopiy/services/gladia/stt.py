@@ -16,7 +16,6 @@ import json
 import warnings
 from typing import Any, AsyncGenerator, Dict, Literal, Optional
 
-import aiohttp
 from loguru import logger
 
 from piopiy.frames.frames import (
@@ -31,6 +30,7 @@ from piopiy.frames.frames import (
 from piopiy.services.gladia.config import GladiaInputParams
 from piopiy.services.stt_service import STTService
 from piopiy.transcriptions.language import Language
+from piopiy.utils.http_clients import get_http_client_registry
 from piopiy.utils.time import time_now_iso8601
 from piopiy.utils.tracing.service_decorators import traced_stt
 
@@ -485,26 +485,26 @@ class GladiaSTTService(STTService):
             self._receive_task = None
 
     async def _setup_gladia(self, settings: Dict[str, Any]):
-        async with aiohttp.ClientSession() as session:
-            params = {}
-            if self._region:
-                params["region"] = self._region
-            async with session.post(
-                self._url,
-                headers={"X-Gladia-Key": self._api_key},
-                json=settings,
-                params=params,
-            ) as response:
-                if response.ok:
-                    return await response.json()
-                else:
-                    error_text = await response.text()
-                    logger.error(
-                        f"Gladia error: {response.status}: {error_text or response.reason}"
-                    )
-                    raise Exception(
-                        f"Failed to initialize Gladia session: {response.status} - {error_text}"
-                    )
+        session = get_http_client_registry().aiohttp_session()
+        params = {}
+        if self._region:
+            params["region"] = self._region
+        async with session.post(
+            self._url,
+            headers={"X-Gladia-Key": self._api_key},
+            json=settings,
+            params=params,
+        ) as response:
+            if response.ok:
+                return await response.json()
+            else:
+                error_text = await response.text()
+                logger.error(
+                    f"Gladia error: {response.status}: {error_text or response.reason}"
+                )
+                raise Exception(
+                    f"Failed to initialize Gladia session: {response.status} - {error_text}"
+                )
 
     @traced_stt
     async def _handle_transcription(
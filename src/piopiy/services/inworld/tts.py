@@ -74,6 +74,7 @@ from piopiy.frames.frames import (
     TTSStoppedFrame,
 )
 from piopiy.services.tts_service import TTSService
+from piopiy.utils.http_clients import get_http_client_registry
 from piopiy.utils.tracing.service_decorators import traced_tts
 
 
@@ -158,7 +159,7 @@ class InworldTTSService(TTSService):
         self,
         *,
         api_key: str,
-        aiohttp_session: aiohttp.ClientSession,
+        aiohttp_session: Optional[aiohttp.ClientSession] = None,
         voice_id: str = "Ashley",
         model: str = "inworld-tts-1",
         streaming: bool = True,
@@ -175,8 +176,9 @@ class InworldTTSService(TTSService):
         Args:
             api_key: Inworld API key for authentication (base64-encoded from Inworld Portal).
                     Get this from: Inworld Portal > Settings > API Keys > Runtime API Key
-            aiohttp_session: Shared aiohttp session for HTTP requests. Must be provided
-                           for proper connection pooling and resource management.
+            aiohttp_session: aiohttp session for HTTP requests. If None, uses the
+                           process-wide shared session, which keeps connections alive
+                           across sessions.
             voice_id: Voice selection for speech synthesis. Common options include:
                      - "Ashley": Clear, professional female voice (default)
                      - "Hades": Deep, authoritative male voice
@@ -200,10 +202,6 @@ class InworldTTSService(TTSService):
                    - temperature: Voice temperature control for variability (range: [0, 2], e.g., 0.8, optional)
                    Language is automatically inferred from input text.
             **kwargs: Additional arguments passed to the parent TTSService class.
-
-        Note:
-            The aiohttp_session parameter is required because Inworld's HTTP API
-            benefits from connection reuse and proper async session management.
         """
         # Initialize parent TTSService with audio configuration
         super().__init__(sample_rate=sample_rate, **kwargs)
@@ -355,7 +353,8 @@ class InworldTTSService(TTSService):
             # ================================================================================
             # Use aiohttp to make request to Inworld's endpoint
             # Behavior differs based on streaming mode
-            async with self._session.post(
+            session = self._session or get_http_client_registry().aiohttp_session()
+            async with session.post(
                 self._base_url, json=payload, headers=headers
             ) as response:
                 # ================================================================================
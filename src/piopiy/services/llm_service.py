@@ -8,12 +8,16 @@
 
 import asyncio
 import inspect
-from dataclasses import dataclass
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import (
     Any,
     Awaitable,
     Callable,
     Dict,
+    Hashable,
     Mapping,
     Optional,
     Protocol,
@@ -40,10 +44,14 @@ from piopiy.frames.frames import (
     LLMFullResponseEndFrame,
     LLMFullResponseStartFrame,
     LLMTextFrame,
+    MetricsFrame,
+    SpeculativeLLMCancelFrame,
+    SpeculativeLLMStartFrame,
     StartFrame,
     StartInterruptionFrame,
     UserImageRequestFrame,
 )
+from piopiy.metrics.metrics import FunctionCallCacheMetricsData
 from piopiy.processors.aggregators.llm_context import LLMContext
 from piopiy.processors.aggregators.llm_response import (
     LLMAssistantAggregatorParams,
@@ -97,6 +105,102 @@ class FunctionCallParams:
     result_callback: FunctionCallResultCallback
 
 
+@dataclass
+class FunctionCallCacheParams:
+    """Result caching configuration of a registered function.
+
+    Identical calls (same function name and arguments) made while the result
+    is cached get the cached result without running the handler, and
+    identical calls made while one is running wait for its result. Only
+    successful calls are cached: a handler reports a failure by passing
+    `FunctionCallResultProperties(cacheable=False)` to the result callback
+    (as MCP tools do), and calls that raise or never call it are not cached
+    either. Only enable it for functions without side effects whose results
+    can be reused.
+
+    Parameters:
+        ttl_secs: How long a result is reused. None keeps results until
+            they are evicted.
+        max_entries: Maximum number of cached results. Least recently used
+            results are evicted first.
+        key_fn: Function computing the cache key from the call arguments,
+            e.g. to ignore some arguments. Defaults to the arguments
+            serialized as JSON.
+    """
+
+    ttl_secs: Optional[float] = 60.0
+    max_entries: int = 128
+    key_fn: Optional[Callable[[Mapping[str, Any]], Hashable]] = None
+
+
+@dataclass
+class CachedFunctionCallResult:
+    """A function call result stored in a `FunctionCallResultCache`.
+
+    Parameters:
+        result: The result passed to the result callback.
+        properties: The properties passed to the result callback.
+        timestamp: When the result was stored (monotonic clock).
+    """
+
+    result: Any
+    properties: Optional[FunctionCallResultProperties]
+    timestamp: float
+
+
+class FunctionCallResultCache:
+    """LRU cache of function call results with in-flight call tracking."""
+
+    def __init__(self, params: FunctionCallCacheParams):
+        """Initialize the cache.
+
+        Args:
+            params: Caching configuration.
+        """
+        self._params = params
+        self._entries: "OrderedDict[Hashable, CachedFunctionCallResult]" = OrderedDict()
+        # Futures of running calls, resolved with their result (or None if
+        # they finished without one).
+        self.in_flight: Dict[Hashable, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of calls answered without running the handler."""
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+    def make_key(self, function_name: str, arguments: Mapping[str, Any]) -> Hashable:
+        """Return the cache key of a call."""
+        if self._params.key_fn:
+            return (function_name, self._params.key_fn(arguments))
+        return (function_name, json.dumps(arguments, sort_keys=True, default=str))
+
+    def get(self, key: Hashable) -> Optional[CachedFunctionCallResult]:
+        """Return the cached result of a call, None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        ttl_secs = self._params.ttl_secs
+        if ttl_secs is not None and time.monotonic() - entry.timestamp > ttl_secs:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: Hashable, entry: CachedFunctionCallResult):
+        """Store the result of a call."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._params.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached results."""
+        self._entries.clear()
+
+
 @dataclass
 class FunctionCallRegistryItem:
     """Represents an entry in the function call registry.
@@ -107,12 +211,14 @@ class FunctionCallRegistryItem:
         function_name: The name of the function (None for catch-all handler).
         handler: The handler for processing function call parameters.
         cancel_on_interruption: Whether to cancel the call on interruption.
+        cache: Result cache of the function, if caching is enabled.
     """
 
     function_name: Optional[str]
     handler: FunctionCallHandler | "DirectFunctionWrapper"
     cancel_on_interruption: bool
     handler_deprecated: bool
+    cache: Optional[FunctionCallResultCache] = field(default=None)
 
 
 @dataclass
@@ -151,6 +257,10 @@ class LLMService(AIService):
     - on_function_calls_started: Called when function calls are received and
       execution is about to start
 
+    A `SpeculativeLLMCancelFrame` stops the speculative request it refers to,
+    whether it is running or still queued, without interrupting anything
+    after the LLM.
+
     Example::
 
         @task.event_handler("on_completion_timeout")
@@ -183,6 +293,9 @@ class LLMService(AIService):
         self._sequential_runner_task: Optional[asyncio.Task] = None
         self._tracing_enabled: bool = False
         self._skip_tts: bool = False
+        # Speculative request being generated, and the last one started.
+        self._speculation_id: Optional[int] = None
+        self._last_speculation_id = 0
 
         self._register_event_handler("on_function_calls_started")
         self._register_event_handler("on_completion_timeout")
@@ -278,6 +391,11 @@ class LLMService(AIService):
             await self._handle_interruptions(frame)
         elif isinstance(frame, LLMConfigureOutputFrame):
             self._skip_tts = frame.skip_tts
+        elif isinstance(frame, SpeculativeLLMStartFrame):
+            self._speculation_id = frame.speculation_id
+            self._last_speculation_id = frame.speculation_id
+        elif isinstance(frame, SpeculativeLLMCancelFrame):
+            await self._cancel_speculation(frame)
 
     async def push_frame(self, frame: Frame, direction: FrameDirection = FrameDirection.DOWNSTREAM):
         """Pushes a frame.
@@ -288,9 +406,26 @@ class LLMService(AIService):
         """
         if isinstance(frame, (LLMTextFrame, LLMFullResponseStartFrame, LLMFullResponseEndFrame)):
             frame.skip_tts = self._skip_tts
+        if isinstance(frame, LLMFullResponseEndFrame):
+            self._speculation_id = None
 
         await super().push_frame(frame, direction)
 
+    async def _cancel_speculation(self, frame: SpeculativeLLMCancelFrame):
+        # Nothing to stop if the speculative response is already complete.
+        running = frame.speculation_id == self._speculation_id
+        queued = frame.speculation_id > self._last_speculation_id
+        if not running and not queued:
+            return
+
+        logger.debug(f"{self}: stopping speculative LLM request")
+        # Restart frame processing, like an interruption does, dropping the
+        # request. Unlike a StartInterruptionFrame this stays in the LLM, so
+        # audio already playing is not affected.
+        await self._start_interruption()
+        await self.stop_all_metrics()
+        self._speculation_id = None
+
     async def _handle_interruptions(self, _: StartInterruptionFrame):
         for function_name, entry in self._functions.items():
             if entry.cancel_on_interruption:
@@ -303,6 +438,7 @@ class LLMService(AIService):
         start_callback=None,
         *,
         cancel_on_interruption: bool = True,
+        cache: Optional[FunctionCallCacheParams] = None,
     ):
         """Register a function handler for LLM function calls.
 
@@ -319,6 +455,8 @@ class LLMService(AIService):
 
             cancel_on_interruption: Whether to cancel this function call when an
                 interruption occurs. Defaults to True.
+            cache: Enables caching and coalescing of identical calls. Only
+                for functions without side effects (e.g. lookups).
         """
         signature = inspect.signature(handler)
         handler_deprecated = len(signature.parameters) > 1
@@ -339,6 +477,7 @@ class LLMService(AIService):
             handler=handler,
             cancel_on_interruption=cancel_on_interruption,
             handler_deprecated=handler_deprecated,
+            cache=FunctionCallResultCache(cache) if cache else None,
         )
 
         # Start callbacks are now deprecated.
@@ -359,6 +498,7 @@ class LLMService(AIService):
         handler: DirectFunction,
         *,
         cancel_on_interruption: bool = True,
+        cache: Optional[FunctionCallCacheParams] = None,
     ):
         """Register a direct function handler for LLM function calls.
 
@@ -370,6 +510,8 @@ class LLMService(AIService):
             handler: The direct function to register. Must follow DirectFunction protocol.
             cancel_on_interruption: Whether to cancel this function call when an
                 interruption occurs. Defaults to True.
+            cache: Enables caching and coalescing of identical calls. Only
+                for functions without side effects (e.g. lookups).
         """
         wrapper = DirectFunctionWrapper(handler)
         self._functions[wrapper.name] = FunctionCallRegistryItem(
@@ -377,6 +519,7 @@ class LLMService(AIService):
             handler=wrapper,
             cancel_on_interruption=cancel_on_interruption,
             handler_deprecated=False,
+            cache=FunctionCallResultCache(cache) if cache else None,
         )
 
     def unregister_function(self, function_name: Optional[str]):
@@ -591,6 +734,94 @@ class LLMService(AIService):
             await self.push_frame(result_frame_downstream, FrameDirection.DOWNSTREAM)
             await self.push_frame(result_frame_upstream, FrameDirection.UPSTREAM)
 
+        if item.cache:
+            await self._run_cached_function_call(item, runner_item, function_call_result_callback)
+        else:
+            await self._invoke_function_handler(item, runner_item, function_call_result_callback)
+
+    async def _run_cached_function_call(
+        self,
+        item: FunctionCallRegistryItem,
+        runner_item: FunctionCallRunnerItem,
+        result_callback: FunctionCallResultCallback,
+    ):
+        cache = item.cache
+        key = cache.make_key(runner_item.function_name, runner_item.arguments)
+
+        entry = cache.get(key)
+        # Wait for an identical call in flight. If it ends without a result
+        # (e.g. cancelled) we run the handler ourselves.
+        while entry is None and key in cache.in_flight:
+            leader = cache.in_flight[key]
+            await asyncio.wait({leader})
+            if leader.cancelled() or leader.exception() or leader.result() is None:
+                if cache.in_flight.get(key) is leader:
+                    del cache.in_flight[key]
+                break
+            entry = leader.result()
+
+        hit = entry is not None
+        if hit:
+            cache.hits += 1
+        else:
+            cache.misses += 1
+        await self._push_function_call_cache_metrics(runner_item.function_name, cache, hit)
+
+        if hit:
+            logger.debug(f"{self} Using cached result of [{runner_item.function_name}]")
+            # on_context_updated belongs to the call that produced the result.
+            properties = (
+                FunctionCallResultProperties(run_llm=entry.properties.run_llm)
+                if entry.properties
+                else None
+            )
+            await result_callback(entry.result, properties=properties)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        cache.in_flight[key] = future
+
+        async def caching_result_callback(
+            result: Any, *, properties: Optional[FunctionCallResultProperties] = None
+        ):
+            # Only successful results are reused. Waiters of a failed call
+            # get None and run the handler themselves.
+            if properties is None or properties.cacheable:
+                entry = CachedFunctionCallResult(
+                    result=result, properties=properties, timestamp=time.monotonic()
+                )
+                cache.put(key, entry)
+                if not future.done():
+                    future.set_result(entry)
+            await result_callback(result, properties=properties)
+
+        try:
+            await self._invoke_function_handler(item, runner_item, caching_result_callback)
+        finally:
+            if not future.done():
+                future.set_result(None)
+            if cache.in_flight.get(key) is future:
+                del cache.in_flight[key]
+
+    async def _push_function_call_cache_metrics(
+        self, function_name: str, cache: FunctionCallResultCache, hit: bool
+    ):
+        if self.can_generate_metrics() and self.metrics_enabled:
+            data = FunctionCallCacheMetricsData(
+                processor=self.name,
+                model=self.model_name,
+                function_name=function_name,
+                hit=hit,
+                hit_rate=cache.hit_rate,
+            )
+            await self.push_frame(MetricsFrame(data=[data]))
+
+    async def _invoke_function_handler(
+        self,
+        item: FunctionCallRegistryItem,
+        runner_item: FunctionCallRunnerItem,
+        function_call_result_callback: FunctionCallResultCallback,
+    ):
         if isinstance(item.handler, DirectFunctionWrapper):
             # Handler is a DirectFunctionWrapper
             await item.handler.invoke(
@@ -6,17 +6,23 @@
 
 """MCP (Model Context Protocol) client for integrating external tools with LLMs."""
 
+import asyncio
 import json
-from typing import Any, Dict, List, Tuple
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional, Tuple
 
 from loguru import logger
 
 from piopiy.adapters.schemas.function_schema import FunctionSchema
 from piopiy.adapters.schemas.tools_schema import ToolsSchema
+from piopiy.frames.frames import FunctionCallResultProperties
 from piopiy.services.llm_service import FunctionCallParams
 from piopiy.utils.base_object import BaseObject
 
 try:
+    import anyio
     from mcp import ClientSession, StdioServerParameters
     from mcp.client.session import ClientSession
     from mcp.client.session_group import SseServerParameters, StreamableHttpParameters
@@ -36,6 +42,11 @@ class MCPClient(BaseObject):
     to LLMs. Supports both stdio and SSE server connections with automatic tool
     registration and schema conversion.
 
+    Tool calls go through an `MCPSessionPool`, so they reuse a long-lived,
+    already initialized session instead of connecting (or, for stdio,
+    spawning the server) on every call. By default the pool is shared by all
+    clients of the process with the same server parameters.
+
     Raises:
         TypeError: If server_params is not a supported parameter type.
     """
@@ -43,29 +54,26 @@ class MCPClient(BaseObject):
     def __init__(
         self,
         server_params: Tuple[StdioServerParameters, SseServerParameters, StreamableHttpParameters],
+        *,
+        pool: Optional["MCPSessionPool"] = None,
         **kwargs,
     ):
         """Initialize the MCP client with server parameters.
 
         Args:
             server_params: Server connection parameters (stdio or SSE).
+            pool: Session pool used for tool calls. Defaults to the pool of
+                the process for `server_params` (see `get_mcp_session_pool`).
             **kwargs: Additional arguments passed to the parent BaseObject.
         """
         super().__init__(**kwargs)
         self._server_params = server_params
-        self._session = ClientSession
+        self._pool = pool
         self._needs_alternate_schema = False
 
-        if isinstance(server_params, StdioServerParameters):
-            self._client = stdio_client
-            self._register_tools = self._stdio_register_tools
-        elif isinstance(server_params, SseServerParameters):
-            self._client = sse_client
-            self._register_tools = self._sse_register_tools
-        elif isinstance(server_params, StreamableHttpParameters):
-            self._client = streamablehttp_client
-            self._register_tools = self._streamable_http_register_tools
-        else:
+        if not isinstance(
+            server_params, (StdioServerParameters, SseServerParameters, StreamableHttpParameters)
+        ):
             raise TypeError(
                 f"{self} invalid argument type: `server_params` must be either StdioServerParameters, SseServerParameters, or StreamableHttpParameters."
             )
@@ -84,7 +92,21 @@ class MCPClient(BaseObject):
         """
         # Check once if the LLM needs alternate strict schema
         self._needs_alternate_schema = llm and llm.needs_mcp_alternate_schema()
-        tools_schema = await self._register_tools(llm)
+
+        pool = self._pool or get_mcp_session_pool(self._server_params)
+
+        async def mcp_tool_wrapper(params: FunctionCallParams) -> None:
+            """Wrapper for mcp tool calls to match Pipecat's function call interface."""
+            logger.debug(
+                f"Executing tool '{params.function_name}' with call ID: {params.tool_call_id}"
+            )
+            logger.trace(f"Tool arguments: {json.dumps(params.arguments, indent=2)}")
+            await self._call_tool(
+                pool, params.function_name, params.arguments, params.result_callback
+            )
+
+        logger.debug(f"Starting registration of mcp tools ({self._server_params})")
+        tools_schema = await self._list_tools(pool, mcp_tool_wrapper, llm)
         return tools_schema
 
     def _get_alternate_schema_for_strict_validation(self, schema: Dict[str, Any]) -> Dict[str, Any]:
@@ -157,130 +179,18 @@ class MCPClient(BaseObject):
 
         return schema
 
-    async def _sse_register_tools(self, llm) -> ToolsSchema:
-        """Register all available mcp tools with the LLM service.
-
-        Args:
-            llm: The Pipecat LLM service to register tools with
-        Returns:
-            A ToolsSchema containing all registered tools
-        """
-
-        async def mcp_tool_wrapper(params: FunctionCallParams) -> None:
-            """Wrapper for mcp tool calls to match Pipecat's function call interface."""
-            logger.debug(
-                f"Executing tool '{params.function_name}' with call ID: {params.tool_call_id}"
-            )
-            logger.trace(f"Tool arguments: {json.dumps(params.arguments, indent=2)}")
-            try:
-                async with self._client(**self._server_params.model_dump()) as (read, write):
-                    async with self._session(read, write) as session:
-                        await session.initialize()
-                        await self._call_tool(
-                            session, params.function_name, params.arguments, params.result_callback
-                        )
-            except Exception as e:
-                error_msg = f"Error calling mcp tool {params.function_name}: {str(e)}"
-                logger.error(error_msg)
-                logger.exception("Full exception details:")
-                await params.result_callback(error_msg)
-
-        logger.debug(f"SSE server parameters: {self._server_params}")
-        logger.debug("Starting registration of mcp tools")
-
-        async with self._client(**self._server_params.model_dump()) as (read, write):
-            async with self._session(read, write) as session:
-                await session.initialize()
-                tools_schema = await self._list_tools(session, mcp_tool_wrapper, llm)
-                return tools_schema
-
-    async def _stdio_register_tools(self, llm) -> ToolsSchema:
-        """Register all available mcp tools with the LLM service.
-
-        Args:
-            llm: The Pipecat LLM service to register tools with
-        Returns:
-            A ToolsSchema containing all registered tools
-        """
-
-        async def mcp_tool_wrapper(params: FunctionCallParams) -> None:
-            """Wrapper for mcp tool calls to match Pipecat's function call interface."""
-            logger.debug(
-                f"Executing tool '{params.function_name}' with call ID: {params.tool_call_id}"
-            )
-            logger.trace(f"Tool arguments: {json.dumps(params.arguments, indent=2)}")
-            try:
-                async with self._client(self._server_params) as streams:
-                    async with self._session(streams[0], streams[1]) as session:
-                        await session.initialize()
-                        await self._call_tool(
-                            session, params.function_name, params.arguments, params.result_callback
-                        )
-            except Exception as e:
-                error_msg = f"Error calling mcp tool {params.function_name}: {str(e)}"
-                logger.error(error_msg)
-                logger.exception("Full exception details:")
-                await params.result_callback(error_msg)
-
-        logger.debug("Starting registration of mcp tools")
-
-        async with self._client(self._server_params) as streams:
-            async with self._session(streams[0], streams[1]) as session:
-                await session.initialize()
-                tools_schema = await self._list_tools(session, mcp_tool_wrapper, llm)
-                return tools_schema
-
-    async def _streamable_http_register_tools(self, llm) -> ToolsSchema:
-        """Register all available mcp tools with the LLM service using streamable HTTP.
-
-        Args:
-            llm: The Pipecat LLM service to register tools with
-        Returns:
-            A ToolsSchema containing all registered tools
-        """
-
-        async def mcp_tool_wrapper(params: FunctionCallParams) -> None:
-            """Wrapper for mcp tool calls to match Pipecat's function call interface."""
-            logger.debug(
-                f"Executing tool '{params.function_name}' with call ID: {params.tool_call_id}"
-            )
-            logger.trace(f"Tool arguments: {json.dumps(params.arguments, indent=2)}")
-            try:
-                async with self._client(**self._server_params.model_dump()) as (
-                    read_stream,
-                    write_stream,
-                    _,
-                ):
-                    async with self._session(read_stream, write_stream) as session:
-                        await session.initialize()
-                        await self._call_tool(
-                            session, params.function_name, params.arguments, params.result_callback
-                        )
-            except Exception as e:
-                error_msg = f"Error calling mcp tool {params.function_name}: {str(e)}"
-                logger.error(error_msg)
-                logger.exception("Full exception details:")
-                await params.result_callback(error_msg)
-
-        logger.debug("Starting registration of mcp tools using streamable HTTP")
-
-        async with self._client(**self._server_params.model_dump()) as (
-            read_stream,
-            write_stream,
-            _,
-        ):
-            async with self._session(read_stream, write_stream) as session:
-                await session.initialize()
-                tools_schema = await self._list_tools(session, mcp_tool_wrapper, llm)
-                return tools_schema
-
-    async def _call_tool(self, session, function_name, arguments, result_callback):
+    async def _call_tool(self, pool: "MCPSessionPool", function_name, arguments, result_callback):
         logger.debug(f"Calling mcp tool '{function_name}'")
+        results = None
         try:
-            results = await session.call_tool(function_name, arguments=arguments)
+            results = await pool.call_tool(function_name, arguments)
         except Exception as e:
             error_msg = f"Error calling mcp tool {function_name}: {str(e)}"
             logger.error(error_msg)
+            await result_callback(
+                error_msg, properties=FunctionCallResultProperties(cacheable=False)
+            )
+            return
 
         response = ""
         if results:
@@ -292,16 +202,28 @@ class MCPClient(BaseObject):
                     else:
                         # logger.debug(f"Non-text result content: '{content}'")
                         pass
+                if getattr(results, "isError", False):
+                    error_msg = f"Error calling mcp tool {function_name}: {response}"
+                    logger.error(error_msg)
+                    await result_callback(
+                        error_msg, properties=FunctionCallResultProperties(cacheable=False)
+                    )
+                    return
                 logger.info(f"Tool '{function_name}' completed successfully")
                 logger.debug(f"Final response: {response}")
             else:
                 logger.error(f"Error getting content from {function_name} results.")
 
-        final_response = response if len(response) else "Sorry, could not call the mcp tool"
-        await result_callback(final_response)
+        if not response:
+            await result_callback(
+                "Sorry, could not call the mcp tool",
+                properties=FunctionCallResultProperties(cacheable=False),
+            )
+            return
+        await result_callback(response)
 
-    async def _list_tools(self, session, mcp_tool_wrapper, llm):
-        available_tools = await session.list_tools()
+    async def _list_tools(self, pool: "MCPSessionPool", mcp_tool_wrapper, llm):
+        available_tools = await pool.list_tools()
         tool_schemas: List[FunctionSchema] = []
 
         try:
@@ -338,3 +260,316 @@ class MCPClient(BaseObject):
         tools_schema = ToolsSchema(standard_tools=tool_schemas)
 
         return tools_schema
+
+
+# Errors meaning the session transport is gone (server process exited,
+# connection dropped), as opposed to errors returned by the server.
+_CONNECTION_ERRORS = (
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    anyio.EndOfStream,
+    ConnectionError,
+)
+
+
+class _PooledSession:
+    """An initialized MCP session owned by a background task.
+
+    The MCP transports are anyio context managers that must be entered and
+    exited from the same task, so a task holds them open for the lifetime of
+    the session.
+    """
+
+    def __init__(self, pool: "MCPSessionPool"):
+        self._pool = pool
+        self._closing = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.session: Optional[ClientSession] = None
+        self.in_flight = 0
+
+    @property
+    def alive(self) -> bool:
+        return self.session is not None
+
+    async def open(self):
+        ready = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(self._run(ready))
+        await ready
+
+    async def close(self):
+        self._closing.set()
+        if self._task:
+            try:
+                await self._task
+            except Exception:
+                pass
+            self._task = None
+
+    async def _run(self, ready: asyncio.Future):
+        try:
+            async with self._pool._open_streams() as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    self.session = session
+                    ready.set_result(None)
+                    await self._closing.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            elif not self._closing.is_set():
+                logger.warning(f"MCP session closed unexpectedly: {e}")
+        finally:
+            self.session = None
+            if not ready.done():
+                ready.set_exception(ConnectionError("MCP session closed during initialization"))
+
+
+class MCPSessionPool:
+    """Pool of long-lived MCP sessions for one server.
+
+    Sessions are opened on demand (up to ``max_sessions``) and reused by all
+    tool calls. Idle sessions are pinged periodically and dropped when the
+    ping fails; a call failing because its session's transport is gone is
+    retried once on a new session. The result of ``list_tools`` is cached.
+
+    Pools are bound to the event loop they are first used in.
+    """
+
+    def __init__(
+        self,
+        server_params: Tuple[StdioServerParameters, SseServerParameters, StreamableHttpParameters],
+        *,
+        max_sessions: int = 1,
+        max_concurrent_calls: int = 16,
+        health_check_interval_secs: Optional[float] = 30.0,
+        health_check_timeout_secs: float = 5.0,
+        list_tools_ttl_secs: Optional[float] = None,
+    ):
+        """Initialize the session pool.
+
+        Args:
+            server_params: Server connection parameters (stdio, SSE or
+                streamable HTTP).
+            max_sessions: Maximum number of sessions (for stdio, server
+                processes). MCP sessions handle concurrent requests, so one
+                is usually enough.
+            max_concurrent_calls: Maximum number of tool calls in flight
+                across all sessions. Further calls wait.
+            health_check_interval_secs: Time between pings of idle sessions.
+                None disables health checks.
+            health_check_timeout_secs: Time to wait for a ping response.
+            list_tools_ttl_secs: How long the ``list_tools`` result is cached.
+                None caches it until the pool is closed.
+        """
+        if not isinstance(
+            server_params, (StdioServerParameters, SseServerParameters, StreamableHttpParameters)
+        ):
+            raise TypeError(
+                "invalid argument type: `server_params` must be either StdioServerParameters, SseServerParameters, or StreamableHttpParameters."
+            )
+        self._server_params = server_params
+        self._max_sessions = max_sessions
+        self._semaphore = asyncio.Semaphore(max_concurrent_calls)
+        self._health_check_interval_secs = health_check_interval_secs
+        self._health_check_timeout_secs = health_check_timeout_secs
+        self._list_tools_ttl_secs = list_tools_ttl_secs
+
+        self._sessions: List[_PooledSession] = []
+        self._open_lock = asyncio.Lock()
+        self._list_tools_lock = asyncio.Lock()
+        self._tools = None
+        self._tools_time = 0.0
+        self._health_check_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """Event loop the pool is bound to, None if not used yet."""
+        return self._loop
+
+    @property
+    def num_sessions(self) -> int:
+        """Number of open sessions."""
+        return sum(1 for s in self._sessions if s.alive)
+
+    async def call_tool(self, name: str, arguments: Optional[Dict[str, Any]] = None):
+        """Call a tool on a pooled session.
+
+        Args:
+            name: Tool name.
+            arguments: Tool arguments.
+
+        Returns:
+            The ``CallToolResult`` returned by the server.
+        """
+        async with self._semaphore:
+            return await self._with_session(lambda s: s.call_tool(name, arguments=arguments))
+
+    async def list_tools(self):
+        """List the server tools, from cache when possible.
+
+        Returns:
+            The ``ListToolsResult`` returned by the server.
+        """
+        async with self._list_tools_lock:
+            expired = (
+                self._list_tools_ttl_secs is not None
+                and time.monotonic() - self._tools_time > self._list_tools_ttl_secs
+            )
+            if self._tools is None or expired:
+                self._tools = await self._with_session(lambda s: s.list_tools())
+                self._tools_time = time.monotonic()
+            return self._tools
+
+    async def close(self):
+        """Close all sessions and stop health checks."""
+        if self._health_check_task:
+            self._health_check_task.cancel()
+            try:
+                await self._health_check_task
+            except asyncio.CancelledError:
+                pass
+            self._health_check_task = None
+        sessions, self._sessions = self._sessions, []
+        for s in sessions:
+            await s.close()
+        self._tools = None
+
+    async def _with_session(self, fn):
+        # A second attempt is made on a new session if the first one is lost.
+        for attempt in range(2):
+            session = await self._acquire()
+            try:
+                if not session.alive:
+                    raise ConnectionError("MCP session closed")
+                return await fn(session.session)
+            except _CONNECTION_ERRORS as e:
+                if attempt:
+                    raise
+                logger.warning(f"MCP session lost ({e!r}), reconnecting")
+            finally:
+                session.in_flight -= 1
+            await self._discard(session)
+
+    async def _acquire(self) -> _PooledSession:
+        self._bind_loop()
+        self._sessions = [s for s in self._sessions if s.alive]
+        session = min(self._sessions, key=lambda s: s.in_flight, default=None)
+
+        if not session or (session.in_flight > 0 and len(self._sessions) < self._max_sessions):
+            async with self._open_lock:
+                self._sessions = [s for s in self._sessions if s.alive]
+                if len(self._sessions) < self._max_sessions:
+                    new_session = _PooledSession(self)
+                    await new_session.open()
+                    self._sessions.append(new_session)
+                    logger.debug(f"Opened MCP session ({len(self._sessions)} open)")
+                    session = new_session
+                else:
+                    session = min(self._sessions, key=lambda s: s.in_flight)
+
+        session.in_flight += 1
+        return session
+
+    async def _discard(self, session: _PooledSession):
+        if session in self._sessions:
+            self._sessions.remove(session)
+        await session.close()
+
+    def _bind_loop(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+        elif self._loop is not loop:
+            raise RuntimeError("MCPSessionPool used from a different event loop")
+
+        if self._health_check_interval_secs and not self._health_check_task:
+            self._health_check_task = asyncio.create_task(self._health_check_handler())
+
+    async def _health_check_handler(self):
+        while True:
+            await asyncio.sleep(self._health_check_interval_secs)
+            for session in list(self._sessions):
+                if session.in_flight or not session.alive:
+                    continue
+                try:
+                    await asyncio.wait_for(
+                        session.session.send_ping(), timeout=self._health_check_timeout_secs
+                    )
+                except Exception as e:
+                    logger.warning(f"MCP session failed health check ({e!r}), closing")
+                    await self._discard(session)
+
+    @asynccontextmanager
+    async def _open_streams(self):
+        params = self._server_params
+        if isinstance(params, StdioServerParameters):
+            async with stdio_client(params) as (read, write):
+                yield read, write
+        elif isinstance(params, SseServerParameters):
+            async with sse_client(**params.model_dump()) as (read, write):
+                yield read, write
+        else:
+            async with streamablehttp_client(**params.model_dump()) as (read, write, _):
+                yield read, write
+
+
+# Pools are per process (forked session workers open their own sessions) and
+# per event loop.
+_pools: Dict[str, MCPSessionPool] = {}
+_pools_pid = 0
+
+
+def get_mcp_session_pool(
+    server_params: Tuple[StdioServerParameters, SseServerParameters, StreamableHttpParameters],
+    **kwargs,
+) -> MCPSessionPool:
+    """Return the session pool of this process for the given server.
+
+    Args:
+        server_params: Server connection parameters.
+        **kwargs: `MCPSessionPool` arguments, used when the pool is created.
+
+    Returns:
+        The shared pool for ``server_params``.
+    """
+    global _pools, _pools_pid
+    if _pools_pid != os.getpid():
+        _pools = {}
+        _pools_pid = os.getpid()
+
+    key = json.dumps(
+        [type(server_params).__name__, server_params.model_dump()], sort_keys=True, default=str
+    )
+    pool = _pools.get(key)
+    loop = asyncio.get_running_loop()
+    if pool is None or (pool.loop is not None and pool.loop is not loop):
+        if pool is not None:
+            _close_pool_of_other_loop(pool)
+        pool = MCPSessionPool(server_params, **kwargs)
+        _pools[key] = pool
+    return pool
+
+
+def _close_pool_of_other_loop(pool: MCPSessionPool):
+    # A pool's sessions are tasks of its own loop, so they can only be closed
+    # there.
+    if pool.loop.is_running():
+        asyncio.run_coroutine_threadsafe(pool.close(), pool.loop)
+    elif not pool.loop.is_closed():
+        logger.warning("Unable to close MCP session pool of a stopped event loop")
+
+
+async def close_mcp_session_pools():
+    """Close all the session pools of this process."""
+    if _pools_pid != os.getpid():
+        # Pools inherited through a fork belong to the parent.
+        return
+    pools = list(_pools.values())
+    _pools.clear()
+    loop = asyncio.get_running_loop()
+    for pool in pools:
+        if pool.loop is None or pool.loop is loop:
+            await pool.close()
+        else:
+            _close_pool_of_other_loop(pool)
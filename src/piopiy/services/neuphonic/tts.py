@@ -39,7 +39,6 @@ from piopiy.transcriptions.language import Language
 from piopiy.utils.tracing.service_decorators import traced_tts
 
 try:
-    from websockets.asyncio.client import connect as websocket_connect
     from websockets.protocol import State
 except ModuleNotFoundError as e:
     logger.error(f"Exception: {e}")
@@ -292,7 +291,7 @@ class NeuphonicTTSService(InterruptibleTTSService):
 
             headers = {"x-api-key": self._api_key}
 
-            self._websocket = await websocket_connect(url, additional_headers=headers)
+            self._websocket = await self._open_websocket(url, additional_headers=headers)
         except Exception as e:
             logger.error(f"{self} initialization error: {e}")
             self._websocket = None
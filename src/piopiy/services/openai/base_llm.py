@@ -18,7 +18,6 @@ from openai import (
     APITimeoutError,
     AsyncOpenAI,
     AsyncStream,
-    DefaultAsyncHttpxClient,
 )
 from openai.types.chat import ChatCompletionChunk, ChatCompletionMessageParam
 from pydantic import BaseModel, Field
@@ -42,6 +41,7 @@ from piopiy.processors.aggregators.openai_llm_context import (
 )
 from piopiy.processors.frame_processor import FrameDirection
 from piopiy.services.llm_service import FunctionCallFromLLM, LLMService
+from piopiy.utils.http_clients import get_http_client_registry
 from piopiy.utils.tracing.service_decorators import traced_llm
 
 
@@ -159,19 +159,17 @@ class BaseOpenAILLMService(LLMService):
             default_headers: Additional HTTP headers.
             **kwargs: Additional client configuration arguments.
 
+        Clients are shared by services with the same base URL and
+        credentials, so keep-alive connections are reused across sessions.
+
         Returns:
             Configured AsyncOpenAI client instance.
         """
-        return AsyncOpenAI(
+        return get_http_client_registry().openai_client(
             api_key=api_key,
             base_url=base_url,
             organization=organization,
             project=project,
-            http_client=DefaultAsyncHttpxClient(
-                limits=httpx.Limits(
-                    max_keepalive_connections=100, max_connections=1000, keepalive_expiry=None
-                )
-            ),
             default_headers=default_headers,
         )
 
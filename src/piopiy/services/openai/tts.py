@@ -13,7 +13,7 @@ generating high-quality synthetic speech from text input.
 from typing import AsyncGenerator, Dict, Literal, Optional
 
 from loguru import logger
-from openai import AsyncOpenAI, BadRequestError
+from openai import BadRequestError
 
 from piopiy.frames.frames import (
     ErrorFrame,
@@ -24,6 +24,7 @@ from piopiy.frames.frames import (
     TTSStoppedFrame,
 )
 from piopiy.services.tts_service import TTSService
+from piopiy.utils.http_clients import get_http_client_registry
 from piopiy.utils.tracing.service_decorators import traced_tts
 
 ValidVoice = Literal[
@@ -87,7 +88,9 @@ class OpenAITTSService(TTSService):
         self.set_model_name(model)
         self.set_voice(voice)
         self._instructions = instructions
-        self._client = AsyncOpenAI(api_key=api_key, base_url=base_url)
+        self._client = get_http_client_registry().openai_client(
+            api_key=api_key, base_url=base_url
+        )
 
     def can_generate_metrics(self) -> bool:
         """Check if this service can generate processing metrics.
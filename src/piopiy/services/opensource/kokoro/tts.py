@@ -20,6 +20,7 @@ from piopiy.frames.frames import (
 from piopiy.processors.frame_processor import FrameDirection
 from piopiy.services.ai_services import TTSService
 from piopiy.transcriptions.language import Language
+from piopiy.utils.model_registry import model_registry
 
 
 
@@ -71,6 +72,16 @@ def get_kokoro_model_paths(model_type: str):
     return model_path, voices_path
 
 
+def load_shared_kokoro(model_type: str, preload: bool = False) -> Kokoro:
+    """Return the process-wide Kokoro model for ``model_type``, loading it once."""
+    model_path, voices_path = get_kokoro_model_paths(model_type)
+    key = ("kokoro", model_path, voices_path)
+    loader = lambda: Kokoro(model_path, voices_path)
+    if preload:
+        return model_registry.preload(key, loader)
+    return model_registry.get(key, loader)
+
+
 
 
 def language_to_kokoro_language(language: Language) -> Optional[str]:
@@ -126,11 +137,8 @@ class KokoroTTSService(TTSService):
         """
         super().__init__(sample_rate=sample_rate, **kwargs)
 
-        # Fetch paths based on type
-        model_path, voices_path = get_kokoro_model_paths(model_type)
-        logger.info(f"Initializing Kokoro TTS service with model_path: {model_path} and voices_path: {voices_path}")
-
-        self._kokoro = Kokoro(model_path, voices_path)
+        # The model is shared by every service in the process.
+        self._kokoro = load_shared_kokoro(model_type)
         self.is_phonemes = is_phonemes
         logger.info(f"Kokoro initialized")
         self._settings = {
@@ -143,6 +151,11 @@ class KokoroTTSService(TTSService):
         
         logger.info("Kokoro TTS service initialized")
 
+    @classmethod
+    def preload(cls, model_type: str = "normal"):
+        """Load the shared Kokoro model ahead of the first session."""
+        load_shared_kokoro(model_type, preload=True)
+
     def can_generate_metrics(self) -> bool:
         return True
 
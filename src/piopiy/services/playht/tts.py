@@ -17,7 +17,6 @@ import uuid
 import warnings
 from typing import AsyncGenerator, Optional
 
-import aiohttp
 from loguru import logger
 from pydantic import BaseModel
 
@@ -35,6 +34,7 @@ from piopiy.frames.frames import (
 from piopiy.processors.frame_processor import FrameDirection
 from piopiy.services.tts_service import InterruptibleTTSService, TTSService
 from piopiy.transcriptions.language import Language
+from piopiy.utils.http_clients import get_http_client_registry
 from piopiy.utils.tracing.service_decorators import traced_tts
 
 try:
@@ -280,32 +280,32 @@ class PlayHTTTSService(InterruptibleTTSService):
 
     async def _get_websocket_url(self):
         """Retrieve WebSocket URL from PlayHT API."""
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                "https://api.play.ht/api/v4/websocket-auth",
-                headers={
-                    "Authorization": f"Bearer {self._api_key}",
-                    "X-User-Id": self._user_id,
-                    "Content-Type": "application/json",
-                },
-            ) as response:
-                if response.status in (200, 201):
-                    data = await response.json()
-                    # Handle the new response format with multiple URLs
-                    if "websocket_urls" in data:
-                        # Select URL based on voice_engine
-                        if self._settings["voice_engine"] in data["websocket_urls"]:
-                            self._websocket_url = data["websocket_urls"][
-                                self._settings["voice_engine"]
-                            ]
-                        else:
-                            raise ValueError(
-                                f"Unsupported voice engine: {self._settings['voice_engine']}"
-                            )
+        session = get_http_client_registry().aiohttp_session()
+        async with session.post(
+            "https://api.play.ht/api/v4/websocket-auth",
+            headers={
+                "Authorization": f"Bearer {self._api_key}",
+                "X-User-Id": self._user_id,
+                "Content-Type": "application/json",
+            },
+        ) as response:
+            if response.status in (200, 201):
+                data = await response.json()
+                # Handle the new response format with multiple URLs
+                if "websocket_urls" in data:
+                    # Select URL based on voice_engine
+                    if self._settings["voice_engine"] in data["websocket_urls"]:
+                        self._websocket_url = data["websocket_urls"][
+                            self._settings["voice_engine"]
+                        ]
                     else:
-                        raise ValueError("Invalid response: missing websocket_urls")
+                        raise ValueError(
+                            f"Unsupported voice engine: {self._settings['voice_engine']}"
+                        )
                 else:
-                    raise Exception(f"Failed to get WebSocket URL: {response.status}")
+                    raise ValueError("Invalid response: missing websocket_urls")
+            else:
+                raise Exception(f"Failed to get WebSocket URL: {response.status}")
 
     def _get_websocket(self):
         """Get the WebSocket connection if available."""
@@ -556,48 +556,48 @@ class PlayHTHttpTTSService(TTSService):
 
             yield TTSStartedFrame()
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    "https://api.play.ht/api/v2/tts/stream",
-                    headers=headers,
-                    json=payload,
-                ) as response:
-                    if response.status not in (200, 201):
-                        error_text = await response.text()
-                        raise Exception(f"PlayHT API error {response.status}: {error_text}")
+            session = get_http_client_registry().aiohttp_session()
+            async with session.post(
+                "https://api.play.ht/api/v2/tts/stream",
+                headers=headers,
+                json=payload,
+            ) as response:
+                if response.status not in (200, 201):
+                    error_text = await response.text()
+                    raise Exception(f"PlayHT API error {response.status}: {error_text}")
+
+                in_header = True
+                buffer = b""
 
-                    in_header = True
-                    buffer = b""
+                CHUNK_SIZE = self.chunk_size
 
-                    CHUNK_SIZE = self.chunk_size
+                async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                    if len(chunk) == 0:
+                        continue
 
-                    async for chunk in response.content.iter_chunked(CHUNK_SIZE):
-                        if len(chunk) == 0:
+                    # Skip the RIFF header
+                    if in_header:
+                        buffer += chunk
+                        if len(buffer) <= 36:
                             continue
-
-                        # Skip the RIFF header
-                        if in_header:
-                            buffer += chunk
-                            if len(buffer) <= 36:
-                                continue
-                            else:
-                                fh = io.BytesIO(buffer)
-                                fh.seek(36)
+                        else:
+                            fh = io.BytesIO(buffer)
+                            fh.seek(36)
+                            (data, size) = struct.unpack("<4sI", fh.read(8))
+                            while data != b"data":
+                                fh.read(size)
                                 (data, size) = struct.unpack("<4sI", fh.read(8))
-                                while data != b"data":
-                                    fh.read(size)
-                                    (data, size) = struct.unpack("<4sI", fh.read(8))
-                                # Extract audio data after header
-                                audio_data = buffer[fh.tell() :]
-                                if len(audio_data) > 0:
-                                    await self.stop_ttfb_metrics()
-                                    frame = TTSAudioRawFrame(audio_data, self.sample_rate, 1)
-                                    yield frame
-                                in_header = False
-                        elif len(chunk) > 0:
-                            await self.stop_ttfb_metrics()
-                            frame = TTSAudioRawFrame(chunk, self.sample_rate, 1)
-                            yield frame
+                            # Extract audio data after header
+                            audio_data = buffer[fh.tell() :]
+                            if len(audio_data) > 0:
+                                await self.stop_ttfb_metrics()
+                                frame = TTSAudioRawFrame(audio_data, self.sample_rate, 1)
+                                yield frame
+                            in_header = False
+                    elif len(chunk) > 0:
+                        await self.stop_ttfb_metrics()
+                        frame = TTSAudioRawFrame(chunk, self.sample_rate, 1)
+                        yield frame
 
         except Exception as e:
             logger.error(f"{self} error generating TTS: {e}")
@@ -39,7 +39,6 @@ from piopiy.utils.text.skip_tags_aggregator import SkipTagsAggregator
 from piopiy.utils.tracing.service_decorators import traced_tts
 
 try:
-    from websockets.asyncio.client import connect as websocket_connect
     from websockets.protocol import State
 except ModuleNotFoundError as e:
     logger.error(f"Exception: {e}")
@@ -255,7 +254,7 @@ class RimeTTSService(AudioContextWordTTSService):
             params = "&".join(f"{k}={v}" for k, v in self._settings.items())
             url = f"{self._url}?{params}"
             headers = {"Authorization": f"Bearer {self._api_key}"}
-            self._websocket = await websocket_connect(url, additional_headers=headers)
+            self._websocket = await self._open_websocket(url, additional_headers=headers)
         except Exception as e:
             logger.error(f"{self} initialization error: {e}")
             self._websocket = None
@@ -0,0 +1,292 @@
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Cache of synthesized TTS audio.
+
+Agents say the same greeting and canned phrases on every call. This module
+provides a two-tier cache of the PCM audio generated for them: an in-memory
+LRU tier for entries synthesized by this process, and an optional disk tier
+whose files are memory-mapped, so forked session workers share a single copy
+through the page cache and entries survive restarts.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional, Union
+
+from loguru import logger
+
+# Disk entry header: magic, sample rate, number of channels, chunk size.
+_HEADER = struct.Struct("<4sIII")
+_MAGIC = b"PTTS"
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@dataclass
+class CachedAudio:
+    """Audio of a cached phrase.
+
+    Parameters:
+        audio: PCM audio. Memory-mapped for entries read from disk.
+        sample_rate: Sample rate of the audio.
+        num_channels: Number of audio channels.
+        chunk_size: Size in bytes of the frames the provider produced, used
+            to replay the audio with the same chunking.
+    """
+
+    audio: Union[bytes, "_MappedAudio"]
+    sample_rate: int
+    num_channels: int
+    chunk_size: int
+
+    def __len__(self) -> int:
+        """Return the audio size in bytes."""
+        return len(self.audio)
+
+
+@dataclass
+class TTSAudioCacheStats:
+    """Counters of a `TTSAudioCache`.
+
+    Parameters:
+        memory_hits: Lookups served from the memory tier.
+        disk_hits: Lookups served from the disk tier.
+        misses: Lookups not found in any tier.
+        memory_entries: Entries in the memory tier.
+        memory_bytes: Audio bytes held by the memory tier.
+    """
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    memory_entries: int = 0
+    memory_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0
+
+
+class TTSAudioCache:
+    """Two-tier (memory LRU and memory-mapped disk) cache of TTS audio.
+
+    A cache instance can be shared by every TTS service of a process, keys
+    include the service class, model, voice and settings. Only whole phrases
+    are cached: audio is stored once synthesis of a phrase completes.
+
+    Example::
+
+        cache = TTSAudioCache(disk_dir="/var/cache/piopiy/tts")
+        tts = OpenAITTSService(api_key=..., audio_cache=cache)
+    """
+
+    def __init__(
+        self,
+        *,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        disk_dir: Optional[str] = None,
+        max_mapped_entries: int = 256,
+    ):
+        """Initialize the TTS audio cache.
+
+        Args:
+            max_memory_bytes: Size limit of the memory tier. Least recently
+                used entries are evicted first.
+            disk_dir: Directory of the disk tier. Created if needed. None
+                disables the disk tier.
+            max_mapped_entries: Number of disk entries kept memory-mapped.
+        """
+        self._max_memory_bytes = max_memory_bytes
+        self._disk_dir = disk_dir
+        self._max_mapped_entries = max_mapped_entries
+        self._memory: "OrderedDict[str, CachedAudio]" = OrderedDict()
+        self._mapped: "OrderedDict[str, CachedAudio]" = OrderedDict()
+        self._memory_bytes = 0
+        self._stats = TTSAudioCacheStats()
+
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(
+        *,
+        service: str,
+        model: Optional[str],
+        voice: Optional[str],
+        settings: Mapping[str, Any],
+        sample_rate: int,
+        text: str,
+    ) -> str:
+        """Build the cache key of a phrase.
+
+        Text is normalized by stripping it and collapsing whitespace, which
+        doesn't change the synthesized audio.
+
+        Returns:
+            A hex digest identifying the phrase and synthesis parameters.
+        """
+        normalized = _WHITESPACE_RE.sub(" ", text.strip())
+        data = json.dumps(
+            [service, model, voice, settings, sample_rate, normalized],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedAudio]:
+        """Look up a phrase in the memory tier, then the disk tier.
+
+        Returns:
+            The cached audio, or None on a miss.
+        """
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+            self._stats.memory_hits += 1
+            return entry
+
+        entry = self._get_mapped(key)
+        if entry is not None:
+            self._stats.disk_hits += 1
+            return entry
+
+        self._stats.misses += 1
+        return None
+
+    def put(self, key: str, entry: CachedAudio):
+        """Add a phrase to the memory tier.
+
+        Use `write_to_disk()` (from a thread) to also store it in the disk tier.
+        """
+        if len(entry) > self._max_memory_bytes:
+            return
+
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= len(old)
+        self._memory[key] = entry
+        self._memory_bytes += len(entry)
+
+        while self._memory_bytes > self._max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def write_to_disk(self, key: str, entry: CachedAudio):
+        """Store a phrase in the disk tier. Blocking, run it in a thread.
+
+        The file is written to a temporary name and renamed, so concurrent
+        readers (other processes) never see partial entries.
+        """
+        if not self._disk_dir:
+            return
+
+        header = _HEADER.pack(_MAGIC, entry.sample_rate, entry.num_channels, entry.chunk_size)
+        fd, tmp_path = tempfile.mkstemp(dir=self._disk_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(header)
+                f.write(entry.audio)
+            os.replace(tmp_path, self._disk_path(key))
+        except OSError as e:
+            logger.warning(f"Unable to write TTS cache entry {key}: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def contains(self, key: str) -> bool:
+        """Return whether a phrase is cached, without updating statistics."""
+        if key in self._memory or key in self._mapped:
+            return True
+        return bool(self._disk_dir) and os.path.exists(self._disk_path(key))
+
+    def stats(self) -> TTSAudioCacheStats:
+        """Return a snapshot of the cache counters."""
+        return TTSAudioCacheStats(
+            memory_hits=self._stats.memory_hits,
+            disk_hits=self._stats.disk_hits,
+            misses=self._stats.misses,
+            memory_entries=len(self._memory),
+            memory_bytes=self._memory_bytes,
+        )
+
+    def clear(self):
+        """Drop the memory tier and the memory-mapped entries.
+
+        Files of the disk tier are kept.
+        """
+        self._memory.clear()
+        self._mapped.clear()
+        self._memory_bytes = 0
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self._disk_dir, f"{key}.pcm")
+
+    def _get_mapped(self, key: str) -> Optional[CachedAudio]:
+        entry = self._mapped.get(key)
+        if entry is not None:
+            self._mapped.move_to_end(key)
+            return entry
+
+        if not self._disk_dir:
+            return None
+
+        try:
+            with open(self._disk_path(key), "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Missing or empty file.
+            return None
+
+        if len(mapped) < _HEADER.size:
+            return None
+        magic, sample_rate, num_channels, chunk_size = _HEADER.unpack_from(mapped)
+        if magic != _MAGIC:
+            logger.warning(f"Ignoring invalid TTS cache entry {key}")
+            return None
+
+        # Frames are sliced out of the map, so the header is skipped by
+        # replaying from an offset rather than copying the audio.
+        entry = CachedAudio(
+            audio=_MappedAudio(mapped, _HEADER.size),
+            sample_rate=sample_rate,
+            num_channels=num_channels,
+            chunk_size=chunk_size,
+        )
+        self._mapped[key] = entry
+        while len(self._mapped) > self._max_mapped_entries:
+            # Maps are closed when the last replay using them finishes.
+            self._mapped.popitem(last=False)
+        return entry
+
+
+class _MappedAudio:
+    """Audio stored in a memory map after a header.
+
+    Supports `len()` and slicing like `bytes`, slices are copied out of the
+    map.
+    """
+
+    def __init__(self, mapped: mmap.mmap, offset: int):
+        self._mapped = mapped
+        self._offset = offset
+
+    def __len__(self) -> int:
+        return len(self._mapped) - self._offset
+
+    def __getitem__(self, item: slice) -> bytes:
+        start, stop, _ = item.indices(len(self))
+        return self._mapped[self._offset + start : self._offset + stop]
@@ -22,6 +22,7 @@ from piopiy.frames.frames import (
     InterimTranscriptionFrame,
     LLMFullResponseEndFrame,
     LLMFullResponseStartFrame,
+    MetricsFrame,
     StartFrame,
     StartInterruptionFrame,
     TextFrame,
@@ -33,8 +34,10 @@ from piopiy.frames.frames import (
     TTSTextFrame,
     TTSUpdateSettingsFrame,
 )
+from piopiy.metrics.metrics import TTSCacheMetricsData
 from piopiy.processors.frame_processor import FrameDirection
 from piopiy.services.ai_service import AIService
+from piopiy.services.tts_audio_cache import CachedAudio, TTSAudioCache
 from piopiy.services.websocket_service import WebsocketService
 from piopiy.transcriptions.language import Language
 from piopiy.utils.text.base_text_aggregator import BaseTextAggregator
@@ -77,6 +80,10 @@ class TTSService(AIService):
         text_filter: Optional[BaseTextFilter] = None,
         # Audio transport destination of the generated frames.
         transport_destination: Optional[str] = None,
+        # Cache of synthesized audio, replayed instead of calling the provider.
+        audio_cache: Optional[TTSAudioCache] = None,
+        # Phrases synthesized into the audio cache when the service starts.
+        audio_cache_prewarm: Optional[Sequence[str]] = None,
         **kwargs,
     ):
         """Initialize the TTS service.
@@ -98,6 +105,12 @@ class TTSService(AIService):
                     Use `text_filters` instead, which allows multiple filters.
 
             transport_destination: Destination for generated audio frames.
+            audio_cache: Cache of synthesized audio. Phrases found in the
+                cache are replayed without calling the provider. Only used by
+                services whose `run_tts` yields the audio (not websocket or
+                word timestamp services).
+            audio_cache_prewarm: Phrases (e.g. greetings) synthesized into the
+                audio cache in the background when the service starts.
             **kwargs: Additional arguments passed to the parent AIService.
         """
         super().__init__(**kwargs)
@@ -116,6 +129,9 @@ class TTSService(AIService):
         self._text_filters: Sequence[BaseTextFilter] = text_filters or []
         self._transport_destination: Optional[str] = transport_destination
         self._tracing_enabled: bool = False
+        self._audio_cache: Optional[TTSAudioCache] = audio_cache
+        self._audio_cache_prewarm: Sequence[str] = audio_cache_prewarm or []
+        self._audio_cache_prewarm_task: Optional[asyncio.Task] = None
 
         if text_filter:
             import warnings
@@ -132,6 +148,11 @@ class TTSService(AIService):
         self._stop_frame_queue: asyncio.Queue = asyncio.Queue()
 
         self._processing_text: bool = False
+        # Whether the next text is the first of a response, which starts the
+        # time to first audio measurement.
+        self._first_audio_pending: bool = False
+        # Whether the current LLM response sent any text to the TTS.
+        self._response_spoken: bool = False
 
     @property
     def sample_rate(self) -> int:
@@ -236,6 +257,7 @@ class TTSService(AIService):
         if self._stop_frame_task:
             await self.cancel_task(self._stop_frame_task)
             self._stop_frame_task = None
+        await self._cancel_audio_cache_prewarm_task()
 
     async def cancel(self, frame: CancelFrame):
         """Cancel the TTS service.
@@ -247,6 +269,7 @@ class TTSService(AIService):
         if self._stop_frame_task:
             await self.cancel_task(self._stop_frame_task)
             self._stop_frame_task = None
+        await self._cancel_audio_cache_prewarm_task()
 
     async def _update_settings(self, settings: Mapping[str, Any]):
         for key, value in settings.items():
@@ -296,6 +319,10 @@ class TTSService(AIService):
         """
         await super().process_frame(frame, direction)
 
+        # Prewarm once subclasses are fully started (e.g. HTTP sessions created).
+        if isinstance(frame, StartFrame):
+            self._maybe_start_audio_cache_prewarm()
+
         if (
             isinstance(frame, (TextFrame, LLMFullResponseStartFrame, LLMFullResponseEndFrame))
             and frame.skip_tts
@@ -310,6 +337,10 @@ class TTSService(AIService):
         elif isinstance(frame, StartInterruptionFrame):
             await self._handle_interruption(frame, direction)
             await self.push_frame(frame, direction)
+        elif isinstance(frame, LLMFullResponseStartFrame):
+            self._first_audio_pending = True
+            self._response_spoken = False
+            await self.push_frame(frame, direction)
         elif isinstance(frame, (LLMFullResponseEndFrame, EndFrame)):
             # We pause processing incoming frames if the LLM response included
             # text (it might be that it's only a function calling response). We
@@ -319,7 +350,13 @@ class TTSService(AIService):
             sentence = self._text_aggregator.text
             await self._text_aggregator.reset()
             self._processing_text = False
-            await self._push_tts_frames(sentence)
+            if await self._push_tts_frames(sentence):
+                self._response_spoken = True
+            if not self._response_spoken:
+                # Nothing to speak (e.g. a function call response): don't let
+                # the next response inherit this start time.
+                self._first_audio_pending = False
+                self._metrics.reset_first_audio_metrics()
             if isinstance(frame, LLMFullResponseEndFrame):
                 if self._push_text_frames:
                     await self.push_frame(frame, direction)
@@ -328,7 +365,9 @@ class TTSService(AIService):
         elif isinstance(frame, TTSSpeakFrame):
             # Store if we were processing text or not so we can set it back.
             processing_text = self._processing_text
-            await self._push_tts_frames(frame.text)
+            await self._start_first_audio_metrics()
+            if not await self._push_tts_frames(frame.text) and not processing_text:
+                self._metrics.reset_first_audio_metrics()
             # We pause processing incoming frames because we are sending data to
             # the TTS. We pause to avoid audio overlapping.
             await self._maybe_pause_frame_processing()
@@ -364,6 +403,9 @@ class TTSService(AIService):
 
         await super().push_frame(frame, direction)
 
+        if isinstance(frame, TTSAudioRawFrame):
+            await self._stop_first_audio_metrics()
+
         if self._push_stop_frames and (
             isinstance(frame, StartInterruptionFrame)
             or isinstance(frame, TTSStartedFrame)
@@ -374,6 +416,8 @@ class TTSService(AIService):
 
     async def _handle_interruption(self, frame: StartInterruptionFrame, direction: FrameDirection):
         self._processing_text = False
+        self._first_audio_pending = False
+        self._metrics.reset_first_audio_metrics()
         await self._text_aggregator.handle_interruption()
         for filter in self._text_filters:
             await filter.handle_interruption()
@@ -386,24 +430,40 @@ class TTSService(AIService):
         if self._pause_frame_processing:
             await self.resume_processing_frames()
 
+    async def _start_first_audio_metrics(self):
+        if self.can_generate_metrics() and self.metrics_enabled:
+            await self._metrics.start_first_audio_metrics()
+
+    async def _stop_first_audio_metrics(self):
+        if self.can_generate_metrics() and self.metrics_enabled:
+            frame = await self._metrics.stop_first_audio_metrics()
+            if frame:
+                await self.push_frame(frame)
+
     async def _process_text_frame(self, frame: TextFrame):
+        if self._first_audio_pending:
+            self._first_audio_pending = False
+            await self._start_first_audio_metrics()
+
         text: Optional[str] = None
         if not self._aggregate_sentences:
             text = frame.text
         else:
             text = await self._text_aggregator.aggregate(frame.text)
 
-        if text:
-            await self._push_tts_frames(text)
+        if text and await self._push_tts_frames(text):
+            self._response_spoken = True
+
+    async def _push_tts_frames(self, text: str) -> bool:
+        # Returns whether any text was sent to the TTS.
 
-    async def _push_tts_frames(self, text: str):
         # Remove leading newlines only
         text = text.lstrip("\n")
 
         # Don't send only whitespace. This causes problems for some TTS models. But also don't
         # strip all whitespace, as whitespace can influence prosody.
         if not text.strip():
-            return
+            return False
 
         # This is just a flag that indicates if we sent something to the TTS
         # service. It will be cleared if we sent text because of a TTSSpeakFrame
@@ -418,7 +478,10 @@ class TTSService(AIService):
             text = await filter.filter(text)
 
         if text:
-            await self.process_generator(self.run_tts(text))
+            if self._audio_cache_enabled():
+                await self._push_cached_tts_frames(text)
+            else:
+                await self.process_generator(self.run_tts(text))
 
         await self.stop_processing_metrics()
 
@@ -427,6 +490,148 @@ class TTSService(AIService):
             # interrupted, the text is not added to the assistant context.
             await self.push_frame(TTSTextFrame(text))
 
+        return bool(text)
+
+    async def prewarm_audio_cache(self, phrases: Sequence[str]):
+        """Synthesize phrases into the audio cache without pushing any audio.
+
+        Phrases already cached are skipped. Must be called after the service
+        has started, since the cache key includes the output sample rate.
+
+        Args:
+            phrases: Phrases to synthesize, e.g. greetings and canned prompts.
+        """
+        if not self._audio_cache_enabled():
+            logger.warning(f"{self}: audio cache not available, skipping prewarm")
+            return
+
+        for phrase in phrases:
+            key = self._audio_cache_key(phrase)
+            if self._audio_cache.contains(key):
+                continue
+            try:
+                entry = await self._synthesize_for_cache(phrase)
+            except Exception as e:
+                logger.warning(f"{self}: unable to prewarm [{phrase}]: {e}")
+                continue
+            if entry:
+                await self._store_cached_audio(key, entry)
+        logger.debug(f"{self}: audio cache prewarmed with {len(phrases)} phrases")
+
+    def _audio_cache_enabled(self) -> bool:
+        # Websocket services push audio from a receive task and word timestamp
+        # services push word frames along with the audio, so what run_tts()
+        # yields is not the whole output.
+        return self._audio_cache is not None and not isinstance(
+            self, (WebsocketService, WordTTSService)
+        )
+
+    def _audio_cache_key(self, text: str) -> str:
+        return TTSAudioCache.make_key(
+            service=type(self).__name__,
+            model=self.model_name,
+            voice=self._voice_id,
+            settings=self._settings,
+            sample_rate=self.sample_rate,
+            text=text,
+        )
+
+    def _maybe_start_audio_cache_prewarm(self):
+        if (
+            self._audio_cache_prewarm
+            and self._audio_cache_enabled()
+            and not self._audio_cache_prewarm_task
+        ):
+            self._audio_cache_prewarm_task = self.create_task(
+                self.prewarm_audio_cache(self._audio_cache_prewarm)
+            )
+
+    async def _cancel_audio_cache_prewarm_task(self):
+        if self._audio_cache_prewarm_task:
+            await self.cancel_task(self._audio_cache_prewarm_task)
+            self._audio_cache_prewarm_task = None
+
+    async def _push_cached_tts_frames(self, text: str):
+        key = self._audio_cache_key(text)
+        entry = self._audio_cache.get(key)
+
+        if self.can_generate_metrics() and self.metrics_enabled:
+            stats = self._audio_cache.stats()
+            data = TTSCacheMetricsData(
+                processor=self.name,
+                model=self.model_name,
+                hit=entry is not None,
+                hit_rate=stats.hit_rate,
+            )
+            await self.push_frame(MetricsFrame(data=[data]))
+
+        if entry is not None:
+            logger.debug(f"{self}: playing cached TTS [{text}]")
+            await self.push_frame(TTSStartedFrame())
+            audio = entry.audio
+            for i in range(0, len(audio), entry.chunk_size):
+                await self.push_frame(
+                    TTSAudioRawFrame(
+                        audio=audio[i : i + entry.chunk_size],
+                        sample_rate=entry.sample_rate,
+                        num_channels=entry.num_channels,
+                    )
+                )
+            await self.push_frame(TTSStoppedFrame())
+            return
+
+        chunks: List[bytes] = []
+        audio_format: Optional[Tuple[int, int]] = None
+        complete = True
+        async for f in self.run_tts(text):
+            if not f:
+                continue
+            if isinstance(f, ErrorFrame):
+                complete = False
+                await self.push_error(f)
+                continue
+            if isinstance(f, TTSAudioRawFrame):
+                if audio_format is None:
+                    audio_format = (f.sample_rate, f.num_channels)
+                elif audio_format != (f.sample_rate, f.num_channels):
+                    complete = False
+                chunks.append(f.audio)
+            await self.push_frame(f)
+
+        # Only store phrases that were synthesized completely. An interruption
+        # cancels this coroutine and never gets here.
+        if complete and chunks and audio_format:
+            entry = CachedAudio(
+                audio=b"".join(chunks),
+                sample_rate=audio_format[0],
+                num_channels=audio_format[1],
+                chunk_size=max(len(c) for c in chunks),
+            )
+            await self._store_cached_audio(key, entry)
+
+    async def _synthesize_for_cache(self, text: str) -> Optional[CachedAudio]:
+        chunks: List[bytes] = []
+        audio_format: Optional[Tuple[int, int]] = None
+        async for f in self.run_tts(text):
+            if isinstance(f, ErrorFrame):
+                logger.warning(f"{self}: unable to prewarm [{text}]: {f.error}")
+                return None
+            if isinstance(f, TTSAudioRawFrame):
+                audio_format = audio_format or (f.sample_rate, f.num_channels)
+                chunks.append(f.audio)
+        if not chunks:
+            return None
+        return CachedAudio(
+            audio=b"".join(chunks),
+            sample_rate=audio_format[0],
+            num_channels=audio_format[1],
+            chunk_size=max(len(c) for c in chunks),
+        )
+
+    async def _store_cached_audio(self, key: str, entry: CachedAudio):
+        self._audio_cache.put(key, entry)
+        await asyncio.to_thread(self._audio_cache.write_to_disk, key, entry)
+
     async def _stop_frame_handler(self):
         has_started = False
         while True:
@@ -0,0 +1,278 @@
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Pool of pre-connected provider websockets.
+
+Websocket TTS services open their provider socket when the pipeline starts,
+so every answered call waits on a TCP, TLS and websocket handshake before the
+greeting can play. A `WebsocketWarmPool` keeps a few authenticated sockets
+open per provider URL and hands one out when a service connects.
+
+Sockets are never returned to the pool: providers keep per-connection state
+(contexts, end-of-stream) and some close sockets after a period of
+inactivity, so a session closes its socket when it ends and the pool opens a
+fresh one in the background. Idle sockets older than ``max_idle_secs`` are
+replaced for the same reason.
+
+Only TTS services use the pool. Websocket STT services are left out on
+purpose:
+
+- Their sessions start on connect. Some providers bill streaming sessions
+  by duration, so idle pooled sockets would be billed.
+- Their sockets time out without audio, often faster than the pool would
+  replace them.
+- Some connect to a per-session URL (Gladia's session URL, AWS presigned
+  URLs) that cannot be opened in advance, or connect through a provider
+  SDK (Deepgram).
+- None of them derive from `WebsocketService`, which provides
+  ``_open_websocket()``.
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Optional, Set, Tuple
+
+from loguru import logger
+from websockets.asyncio.client import ClientConnection
+from websockets.asyncio.client import connect as websocket_connect
+from websockets.protocol import State
+
+from piopiy.utils.network import exponential_backoff_time
+
+
+@dataclass
+class WebsocketPoolStats:
+    """Counters of a `WebsocketWarmPool`.
+
+    Parameters:
+        hits: Connections served with a pre-connected socket.
+        misses: Connections that had to wait for a handshake.
+        idle_connections: Pre-connected sockets currently available.
+        total_wait_secs: Time spent waiting for sockets by all connections.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    idle_connections: int = 0
+    total_wait_secs: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of connections served with a pre-connected socket."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class _WarmSlot:
+    url: str
+    connect_kwargs: Dict[str, Any]
+    idle: Deque[Tuple[ClientConnection, float]] = field(default_factory=deque)
+    last_used: float = field(default_factory=time.monotonic)
+    wakeup: asyncio.Event = field(default_factory=asyncio.Event)
+    task: Optional[asyncio.Task] = None
+
+
+class WebsocketWarmPool:
+    """Keeps pre-connected websockets per provider URL and credentials.
+
+    A URL (with its connection arguments, e.g. authentication headers) is
+    kept warm after its first use or after `warm()`, and dropped once unused
+    for ``key_ttl_secs``. Create one pool per process and pass it to websocket
+    TTS services::
+
+        pool = WebsocketWarmPool(size=2)
+        tts = CartesiaTTSService(api_key=..., voice_id=..., websocket_pool=pool)
+
+    The pool detects forks, so it can be created before session workers are
+    forked: each worker keeps its own sockets.
+    """
+
+    def __init__(
+        self,
+        *,
+        size: int = 2,
+        max_idle_secs: float = 15.0,
+        key_ttl_secs: float = 600.0,
+        connect_timeout_secs: float = 10.0,
+    ):
+        """Initialize the warm pool.
+
+        Args:
+            size: Pre-connected sockets to keep per URL.
+            max_idle_secs: Replace idle sockets older than this, before
+                providers close them for inactivity.
+            key_ttl_secs: Stop keeping sockets for a URL unused for this long.
+            connect_timeout_secs: Time limit of background connections.
+        """
+        self._size = size
+        self._max_idle_secs = max_idle_secs
+        self._key_ttl_secs = key_ttl_secs
+        self._connect_timeout_secs = connect_timeout_secs
+        self._slots: Dict[str, _WarmSlot] = {}
+        self._stats = WebsocketPoolStats()
+        self._closing: Set[asyncio.Task] = set()
+        self._pid = os.getpid()
+
+    async def acquire(self, url: str, **connect_kwargs) -> Tuple[ClientConnection, bool, float]:
+        """Return an open websocket to ``url``.
+
+        Args:
+            url: Websocket URL.
+            **connect_kwargs: Arguments of ``websockets.asyncio.client.connect``.
+
+        Returns:
+            The websocket, whether it was pre-connected, and the time waited
+            in seconds.
+        """
+        start_time = time.monotonic()
+        slot = self._slot(url, connect_kwargs)
+        slot.last_used = start_time
+
+        websocket = None
+        while slot.idle:
+            candidate, opened_at = slot.idle.popleft()
+            if candidate.state is State.OPEN and start_time - opened_at < self._max_idle_secs:
+                websocket = candidate
+                break
+            self._close_in_background(candidate)
+
+        # Wake the maintenance task up to replace the socket taken.
+        slot.wakeup.set()
+        self._ensure_maintained(slot)
+
+        hit = websocket is not None
+        if not hit:
+            websocket = await websocket_connect(url, **connect_kwargs)
+
+        wait_time = time.monotonic() - start_time
+        if hit:
+            self._stats.hits += 1
+        else:
+            self._stats.misses += 1
+        self._stats.total_wait_secs += wait_time
+        return websocket, hit, wait_time
+
+    def warm(self, url: str, **connect_kwargs):
+        """Start keeping pre-connected sockets to ``url``.
+
+        Must be called from the event loop. Useful at startup, so the first
+        session does not wait on a handshake either.
+        """
+        slot = self._slot(url, connect_kwargs)
+        slot.last_used = time.monotonic()
+        self._ensure_maintained(slot)
+
+    def idle_connections(self, url: str, **connect_kwargs) -> int:
+        """Return the number of pre-connected sockets to ``url``."""
+        slot = self._slots.get(_slot_key(url, connect_kwargs))
+        return len(slot.idle) if slot else 0
+
+    def stats(self) -> WebsocketPoolStats:
+        """Return a snapshot of the pool counters."""
+        return WebsocketPoolStats(
+            hits=self._stats.hits,
+            misses=self._stats.misses,
+            idle_connections=sum(len(s.idle) for s in self._slots.values()),
+            total_wait_secs=self._stats.total_wait_secs,
+        )
+
+    async def close(self):
+        """Stop maintaining sockets and close the idle ones."""
+        slots = list(self._slots.values())
+        self._slots.clear()
+        for slot in slots:
+            if slot.task:
+                slot.task.cancel()
+        await asyncio.gather(*(s.task for s in slots if s.task), return_exceptions=True)
+        for slot in slots:
+            await asyncio.gather(
+                *(websocket.close() for websocket, _ in slot.idle), return_exceptions=True
+            )
+            slot.idle.clear()
+
+    def _slot(self, url: str, connect_kwargs: Dict[str, Any]) -> _WarmSlot:
+        if self._pid != os.getpid():
+            # Forked: sockets and tasks belong to the parent.
+            self._slots = {}
+            self._stats = WebsocketPoolStats()
+            self._closing = set()
+            self._pid = os.getpid()
+
+        key = _slot_key(url, connect_kwargs)
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._slots[key] = _WarmSlot(url=url, connect_kwargs=connect_kwargs)
+        return slot
+
+    def _ensure_maintained(self, slot: _WarmSlot):
+        if not slot.task or slot.task.done():
+            slot.task = asyncio.create_task(self._maintain(slot), name="websocket-warm-pool")
+
+    async def _maintain(self, slot: _WarmSlot):
+        attempt = 0
+        while True:
+            now = time.monotonic()
+            if now - slot.last_used >= self._key_ttl_secs:
+                # URLs may hold credentials, so they are not logged.
+                logger.debug("Websocket warm pool: dropping an unused URL")
+                self._slots.pop(_slot_key(slot.url, slot.connect_kwargs), None)
+                for websocket, _ in slot.idle:
+                    self._close_in_background(websocket)
+                slot.idle.clear()
+                return
+
+            while slot.idle and (
+                slot.idle[0][0].state is not State.OPEN
+                or now - slot.idle[0][1] >= self._max_idle_secs
+            ):
+                websocket, _ = slot.idle.popleft()
+                self._close_in_background(websocket)
+
+            if len(slot.idle) < self._size:
+                try:
+                    websocket = await asyncio.wait_for(
+                        websocket_connect(slot.url, **slot.connect_kwargs),
+                        timeout=self._connect_timeout_secs,
+                    )
+                    slot.idle.append((websocket, time.monotonic()))
+                    attempt = 0
+                except Exception as e:
+                    attempt += 1
+                    logger.warning(f"Websocket warm pool: unable to connect: {e}")
+                    await asyncio.sleep(exponential_backoff_time(attempt))
+                continue
+
+            # Sleep until the oldest socket has to be replaced, a socket is
+            # taken, or the URL expires.
+            timeout = (
+                min(slot.idle[0][1] + self._max_idle_secs, slot.last_used + self._key_ttl_secs)
+                - time.monotonic()
+            )
+            slot.wakeup.clear()
+            try:
+                await asyncio.wait_for(slot.wakeup.wait(), timeout=max(0.0, timeout))
+            except asyncio.TimeoutError:
+                pass
+
+    def _close_in_background(self, websocket: ClientConnection):
+        async def close():
+            try:
+                await websocket.close()
+            except Exception:
+                pass
+
+        task = asyncio.create_task(close())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+
+def _slot_key(url: str, connect_kwargs: Dict[str, Any]) -> str:
+    return json.dumps([url, connect_kwargs], sort_keys=True, default=str)
@@ -12,10 +12,14 @@ from typing import Awaitable, Callable, Optional
 
 import websockets
 from loguru import logger
+from websockets.asyncio.client import connect as websocket_connect
 from websockets.exceptions import ConnectionClosedOK
 from websockets.protocol import State
 
-from piopiy.frames.frames import ErrorFrame
+from piopiy.frames.frames import ErrorFrame, MetricsFrame
+from piopiy.metrics.metrics import WebsocketPoolMetricsData
+from piopiy.processors.frame_processor import FrameProcessor
+from piopiy.services.websocket_pool import WebsocketWarmPool
 from piopiy.utils.network import exponential_backoff_time
 
 
@@ -27,15 +31,51 @@ class WebsocketService(ABC):
     Subclasses implement service-specific connection and message handling logic.
     """
 
-    def __init__(self, *, reconnect_on_error: bool = True, **kwargs):
+    def __init__(
+        self,
+        *,
+        reconnect_on_error: bool = True,
+        websocket_pool: Optional[WebsocketWarmPool] = None,
+        **kwargs,
+    ):
         """Initialize the websocket service.
 
         Args:
             reconnect_on_error: Whether to automatically reconnect on connection errors.
+            websocket_pool: Pool of pre-connected websockets used by
+                `_open_websocket()`. None opens a new connection every time.
             **kwargs: Additional arguments (unused, for compatibility).
         """
         self._websocket: Optional[websockets.WebSocketClientProtocol] = None
         self._reconnect_on_error = reconnect_on_error
+        self._websocket_pool = websocket_pool
+
+    async def _open_websocket(self, url: str, **kwargs):
+        """Open a websocket, taking a pre-connected one from the warm pool if set.
+
+        Args:
+            url: Websocket URL.
+            **kwargs: Arguments of ``websockets.asyncio.client.connect``.
+
+        Returns:
+            The open websocket.
+        """
+        if not self._websocket_pool:
+            return await websocket_connect(url, **kwargs)
+
+        websocket, hit, wait_time = await self._websocket_pool.acquire(url, **kwargs)
+        source = "warm pool" if hit else "new connection"
+        logger.debug(f"{self} websocket from {source} in {wait_time:.3f}s")
+        if isinstance(self, FrameProcessor) and self.can_generate_metrics() and self.metrics_enabled:
+            data = WebsocketPoolMetricsData(
+                processor=self.name,
+                model=getattr(self, "model_name", None),
+                hit=hit,
+                wait_time=wait_time,
+                idle_connections=self._websocket_pool.idle_connections(url, **kwargs),
+            )
+            await self.push_frame(MetricsFrame(data=[data]))
+        return websocket
 
     async def _verify_connection(self) -> bool:
         """Verify the websocket connection is active and responsive.
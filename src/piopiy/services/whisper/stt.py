@@ -21,6 +21,7 @@ from typing_extensions import TYPE_CHECKING, override
 from piopiy.frames.frames import ErrorFrame, Frame, TranscriptionFrame
 from piopiy.services.stt_service import SegmentedSTTService
 from piopiy.transcriptions.language import Language
+from piopiy.utils.model_registry import model_registry
 from piopiy.utils.time import time_now_iso8601
 from piopiy.utils.tracing.service_decorators import traced_stt
 
@@ -332,9 +333,35 @@ class WhisperSTTService(SegmentedSTTService):
         logger.info(f"Switching STT language to: [{language}]")
         self._settings["language"] = language
 
+    @classmethod
+    def preload(
+        cls,
+        *,
+        model: str | Model = Model.DISTIL_MEDIUM_EN,
+        device: str = "auto",
+        compute_type: str = "default",
+    ):
+        """Load a shared Whisper model ahead of the first session.
+
+        Args:
+            model: The Whisper model to load. Can be a Model enum or string.
+            device: The device to run inference on ('cpu', 'cuda', or 'auto').
+            compute_type: The compute type for inference.
+        """
+        from faster_whisper import WhisperModel
+
+        model_name = model if isinstance(model, str) else model.value
+        model_registry.preload(
+            ("faster_whisper", model_name, device, compute_type),
+            lambda: WhisperModel(model_name, device=device, compute_type=compute_type),
+        )
+
     def _load(self):
         """Loads the Whisper model.
 
+        The model is shared by every service in the process using the same
+        model, device and compute type.
+
         Note:
             If this is the first time this model is being run,
             it will take time to download from the Hugging Face model hub.
@@ -342,11 +369,12 @@ class WhisperSTTService(SegmentedSTTService):
         try:
             from faster_whisper import WhisperModel
 
-            logger.debug("Loading Whisper model...")
-            self._model = WhisperModel(
-                self.model_name, device=self._device, compute_type=self._compute_type
+            self._model = model_registry.get(
+                ("faster_whisper", self.model_name, self._device, self._compute_type),
+                lambda: WhisperModel(
+                    self.model_name, device=self._device, compute_type=self._compute_type
+                ),
             )
-            logger.debug("Loaded Whisper model")
         except ModuleNotFoundError as e:
             logger.error(f"Exception: {e}")
             logger.error("In order to use Whisper, you need to `pip install pipecat-ai[whisper]`.")
@@ -11,8 +11,9 @@ input processing, including VAD, turn analysis, and interruption management.
 """
 
 import asyncio
+import time
 from concurrent.futures import ThreadPoolExecutor
-from typing import Optional
+from typing import Dict, Optional
 
 from loguru import logger
 
@@ -21,6 +22,11 @@ from piopiy.audio.turn.base_turn_analyzer import (
     EndOfTurnState,
 )
 from piopiy.audio.vad.vad_analyzer import VADAnalyzer, VADState
+from piopiy.audio.vad.vad_executor import (
+    VADExecutionMode,
+    get_shared_vad_executor,
+    get_vad_thread,
+)
 from piopiy.frames.frames import (
     BotInterruptionFrame,
     BotStartedSpeakingFrame,
@@ -46,6 +52,7 @@ from piopiy.frames.frames import (
     VADUserStartedSpeakingFrame,
     VADUserStoppedSpeakingFrame,
 )
+from piopiy.metrics.histogram import LatencyHistogram, get_loop_lag_probe
 from piopiy.metrics.metrics import MetricsData
 from piopiy.processors.frame_processor import FrameDirection, FrameProcessor
 from piopiy.transports.base_transport import TransportParams
@@ -82,8 +89,18 @@ class BaseInputTransport(FrameProcessor):
         self._user_speaking = False
 
         # We read audio from a single queue one at a time and we then run VAD in
-        # a thread. Therefore, only one thread should be necessary.
-        self._executor = ThreadPoolExecutor(max_workers=1)
+        # a thread. Therefore, only one thread should be necessary. Other
+        # execution modes don't need a thread per transport.
+        self._executor = (
+            ThreadPoolExecutor(max_workers=1)
+            if self._params.vad_execution_mode == VADExecutionMode.EXECUTOR
+            else None
+        )
+
+        # Time spent analyzing each audio frame (including any thread hand-off)
+        # and event loop lag, to help choosing the VAD execution mode.
+        self._vad_latency = LatencyHistogram()
+        self._loop_lag = LatencyHistogram()
 
         # Task to process incoming audio (VAD) and push audio frames downstream
         # if passthrough is enabled.
@@ -168,6 +185,32 @@ class BaseInputTransport(FrameProcessor):
         """
         return self._params.vad_analyzer
 
+    @property
+    def vad_latency(self) -> LatencyHistogram:
+        """Get the histogram of VAD analysis time per audio frame.
+
+        Returns:
+            Latency histogram in seconds.
+        """
+        return self._vad_latency
+
+    @property
+    def loop_lag(self) -> LatencyHistogram:
+        """Get the histogram of event loop lag observed by this transport.
+
+        Returns:
+            Lag histogram in seconds.
+        """
+        return self._loop_lag
+
+    def vad_stats(self) -> Dict[str, Dict[str, float]]:
+        """Get a summary of VAD latency and loop lag.
+
+        Returns:
+            Dictionary with ``vad_latency`` and ``loop_lag`` snapshots.
+        """
+        return {"vad_latency": self._vad_latency.snapshot(), "loop_lag": self._loop_lag.snapshot()}
+
     @property
     def turn_analyzer(self) -> Optional[BaseTurnAnalyzer]:
         """Get the turn-taking analyzer.
@@ -397,20 +440,45 @@ class BaseInputTransport(FrameProcessor):
         if not self._audio_task and self._params.audio_in_enabled:
             self._audio_in_queue = asyncio.Queue()
             self._audio_task = self.create_task(self._audio_task_handler())
+            if self._params.vad_analyzer:
+                get_loop_lag_probe().subscribe(self._loop_lag)
 
     async def _cancel_audio_task(self):
         """Cancel and cleanup the audio processing task."""
         if self._audio_task:
             await self.cancel_task(self._audio_task)
             self._audio_task = None
+            get_loop_lag_probe().unsubscribe(self._loop_lag)
+            if self._vad_latency.count:
+                logger.opt(lazy=True).debug("{} VAD stats: {}", lambda: self, self.vad_stats)
 
     async def _vad_analyze(self, audio_frame: InputAudioRawFrame) -> VADState:
         """Analyze audio frame for voice activity."""
         state = VADState.QUIET
-        if self.vad_analyzer:
+        if not self.vad_analyzer:
+            return state
+
+        start_time = time.perf_counter()
+        mode = self._params.vad_execution_mode
+        if self.vad_analyzer.supports_async_analysis:
+            # Inference happens in a shared (batched) engine, no thread needed.
+            state = await self.vad_analyzer.analyze_audio_async(audio_frame.audio)
+        elif mode == VADExecutionMode.INLINE:
+            state = self.vad_analyzer.analyze_audio(audio_frame.audio)
+        elif mode == VADExecutionMode.THREAD:
+            state = await get_vad_thread().submit(
+                self.vad_analyzer.analyze_audio, audio_frame.audio
+            )
+        else:
+            executor = (
+                get_shared_vad_executor()
+                if mode == VADExecutionMode.SHARED_EXECUTOR
+                else self._executor
+            )
             state = await self.get_event_loop().run_in_executor(
-                self._executor, self.vad_analyzer.analyze_audio, audio_frame.audio
+                executor, self.vad_analyzer.analyze_audio, audio_frame.audio
             )
+        self._vad_latency.record(time.perf_counter() - start_time)
         return state
 
     async def _handle_vad(self, audio_frame: InputAudioRawFrame, vad_state: VADState):
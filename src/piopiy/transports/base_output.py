@@ -20,6 +20,7 @@ from loguru import logger
 from PIL import Image
 
 from piopiy.audio.mixers.base_audio_mixer import BaseAudioMixer
+from piopiy.audio.ring_buffer import AudioChunker
 from piopiy.audio.utils import create_stream_resampler, is_silence
 from piopiy.frames.frames import (
     BotSpeakingFrame,
@@ -357,11 +358,13 @@ class BaseOutputTransport(FrameProcessor):
             # This is to resize images. We only need to resize one image at a time.
             self._executor = ThreadPoolExecutor(max_workers=1)
 
-            # Buffer to keep track of incoming audio.
-            self._audio_buffer = bytearray()
+            # Cuts incoming audio into output chunks.
+            self._audio_chunker = AudioChunker(
+                audio_chunk_size, zero_copy=params.audio_out_zero_copy
+            )
 
             # This will be used to resample incoming audio to the output sample rate.
-            self._resampler = create_stream_resampler()
+            self._resampler = create_stream_resampler(params.audio_resampler_quality)
 
             # The user can provide a single mixer, to be used by the default
             # destination, or a destination/mixer mapping.
@@ -401,7 +404,7 @@ class BaseOutputTransport(FrameProcessor):
             Args:
                 frame: The start frame containing initialization parameters.
             """
-            self._audio_buffer = bytearray()
+            self._audio_chunker.clear()
 
             # Create all tasks.
             self._create_video_task()
@@ -493,16 +496,14 @@ class BaseOutputTransport(FrameProcessor):
             )
 
             cls = type(frame)
-            self._audio_buffer.extend(resampled)
-            while len(self._audio_buffer) >= self._audio_chunk_size:
+            for audio in self._audio_chunker.write(resampled):
                 chunk = cls(
-                    bytes(self._audio_buffer[: self._audio_chunk_size]),
+                    audio,
                     sample_rate=self._sample_rate,
                     num_channels=frame.num_channels,
                 )
                 chunk.transport_destination = self._destination
                 await self._audio_queue.put(chunk)
-                self._audio_buffer = self._audio_buffer[self._audio_chunk_size :]
 
         async def handle_image_frame(self, frame: OutputImageRawFrame | SpriteFrame):
             """Handle incoming image frames for video output.
@@ -564,9 +565,10 @@ class BaseOutputTransport(FrameProcessor):
         async def _bot_started_speaking(self):
             """Handle bot started speaking event."""
             if not self._bot_speaking:
-                logger.debug(
-                    f"Bot{f' [{self._destination}]' if self._destination else ''} started speaking"
-                )
+                if self._destination:
+                    logger.debug("Bot [{}] started speaking", self._destination)
+                else:
+                    logger.debug("Bot started speaking")
 
                 downstream_frame = BotStartedSpeakingFrame()
                 downstream_frame.transport_destination = self._destination
@@ -580,9 +582,10 @@ class BaseOutputTransport(FrameProcessor):
         async def _bot_stopped_speaking(self):
             """Handle bot stopped speaking event."""
             if self._bot_speaking:
-                logger.debug(
-                    f"Bot{f' [{self._destination}]' if self._destination else ''} stopped speaking"
-                )
+                if self._destination:
+                    logger.debug("Bot [{}] stopped speaking", self._destination)
+                else:
+                    logger.debug("Bot stopped speaking")
 
                 downstream_frame = BotStoppedSpeakingFrame()
                 downstream_frame.transport_destination = self._destination
@@ -595,7 +598,7 @@ class BaseOutputTransport(FrameProcessor):
 
                 # Clean audio buffer (there could be tiny left overs if not multiple
                 # to our output chunk size).
-                self._audio_buffer = bytearray()
+                self._audio_chunker.clear()
 
         async def _handle_frame(self, frame: Frame):
             """Handle various frame types with appropriate processing.
@@ -20,6 +20,7 @@ from piopiy.audio.filters.base_audio_filter import BaseAudioFilter
 from piopiy.audio.mixers.base_audio_mixer import BaseAudioMixer
 from piopiy.audio.turn.base_turn_analyzer import BaseTurnAnalyzer
 from piopiy.audio.vad.vad_analyzer import VADAnalyzer
+from piopiy.audio.vad.vad_executor import VADExecutionMode
 from piopiy.processors.frame_processor import FrameProcessor
 from piopiy.utils.base_object import BaseObject
 
@@ -83,7 +84,12 @@ class TransportParams(BaseModel):
         audio_out_10ms_chunks: Number of 10ms chunks to buffer for output.
         audio_out_mixer: Audio mixer instance or destination mapping.
         audio_out_destinations: List of audio output destination identifiers.
+        audio_out_zero_copy: Emit output audio chunks as read-only memoryviews
+            of the incoming audio instead of copies. Only enable it if the
+            transport and the processors after it accept any bytes-like audio.
         audio_in_enabled: Enable audio input streaming.
+        audio_resampler_quality: SoX quality tier of the transport's stream
+            resamplers, see `create_stream_resampler`.
         audio_in_sample_rate: Input audio sample rate in Hz.
         audio_in_channels: Number of input audio channels.
         audio_in_filter: Audio filter to apply to input audio.
@@ -111,6 +117,8 @@ class TransportParams(BaseModel):
                 instead.
 
         vad_analyzer: Voice Activity Detection analyzer instance.
+        vad_execution_mode: Where VAD analysis runs (per-transport executor,
+            shared executor, dedicated per-process thread or inline on the loop).
         turn_analyzer: Turn-taking analyzer instance for conversation management.
     """
 
@@ -131,7 +139,9 @@ class TransportParams(BaseModel):
     audio_out_10ms_chunks: int = 4
     audio_out_mixer: Optional[BaseAudioMixer | Mapping[Optional[str], BaseAudioMixer]] = None
     audio_out_destinations: List[str] = Field(default_factory=list)
+    audio_out_zero_copy: bool = False
     audio_in_enabled: bool = False
+    audio_resampler_quality: str = "VHQ"
     audio_in_sample_rate: Optional[int] = None
     audio_in_channels: int = 1
     audio_in_filter: Optional[BaseAudioFilter] = None
@@ -149,6 +159,7 @@ class TransportParams(BaseModel):
     vad_enabled: bool = False
     vad_audio_passthrough: bool = False
     vad_analyzer: Optional[VADAnalyzer] = None
+    vad_execution_mode: VADExecutionMode = VADExecutionMode.EXECUTOR
     turn_analyzer: Optional[BaseTurnAnalyzer] = None
 
 
@@ -101,9 +101,9 @@ class TelecmiTransportClient:
 
     def __init__(
         self,
-        url: str,
-        token: str,
-        room_name: str,
+        url: Optional[str],
+        token: Optional[str],
+        room_name: Optional[str],
         params: TelecmiParams,
         callbacks: TelecmiCallbacks,
         transport_name: str,
@@ -111,7 +111,8 @@ class TelecmiTransportClient:
         """Initialize the TeleCMI transport client.
 
         Args:
-            url: TeleCMI server URL to connect to.
+            url: TeleCMI server URL to connect to. None defers the room until
+                `bind()` is called.
             token: Authentication token for the room.
             room_name: Name of the TeleCMI room to join.
             params: Configuration parameters for the transport.
@@ -135,6 +136,9 @@ class TelecmiTransportClient:
         self._other_participant_has_joined = False
         self._task_manager: Optional[BaseTaskManager] = None
 
+        # Connections requested before the room was bound, replayed by bind().
+        self._pending_connects = 0
+
         # NEW: serialize connect/disconnect to avoid double connects
         self._conn_lock = asyncio.Lock()
 
@@ -181,10 +185,35 @@ class TelecmiTransportClient:
         """Start the client and initialize audio components."""
         self._out_sample_rate = self._params.audio_out_sample_rate or frame.audio_out_sample_rate
 
+    @property
+    def bound(self) -> bool:
+        """Whether the room to join is known."""
+        return bool(self._url and self._token and self._room_name)
+
+    async def bind(self, url: str, token: str, room_name: str):
+        """Set the room of a client created without one and join it.
+
+        Connections requested by the input and output transports while the
+        room was unknown are made now.
+        """
+        async with self._conn_lock:
+            if self.bound:
+                raise Exception(f"{self}: already bound to {self._room_name}")
+            self._url = url
+            self._token = token
+            self._room_name = room_name
+            pending, self._pending_connects = self._pending_connects, 0
+        for _ in range(pending):
+            await self.connect()
+
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
     async def connect(self):
         """Connect to the TeleCMI room with retry logic (race-safe)."""
         async with self._conn_lock:
+            if not self.bound:
+                self._pending_connects += 1
+                return
+
             if self._connected:
                 # Increment disconnect counter if already connected (ref-counting)
                 self._disconnect_counter += 1
@@ -229,6 +258,10 @@ class TelecmiTransportClient:
     async def disconnect(self):
         """Disconnect from the TeleCMI room (race-safe)."""
         async with self._conn_lock:
+            if not self.bound:
+                self._pending_connects = max(0, self._pending_connects - 1)
+                return
+
             # Decrement leave counter when leaving.
             self._disconnect_counter -= 1
 
@@ -480,7 +513,7 @@ class TelecmiInputTransport(BaseInputTransport):
 
         self._audio_in_task: Optional[asyncio.Task] = None
         self._vad_analyzer: Optional[VADAnalyzer] = params.vad_analyzer
-        self._resampler = create_stream_resampler()
+        self._resampler = create_stream_resampler(params.audio_resampler_quality)
 
         # Whether we have seen a StartFrame already.
         self._initialized = False
@@ -650,27 +683,36 @@ class TelecmiTransport(BaseTransport):
         params: Optional[TelecmiParams] = None,
         input_name: Optional[str] = None,
         output_name: Optional[str] = None,
+        defer_room: bool = False,
     ):
+        """Initialize the TeleCMI transport.
+
+        With defer_room=True and no room given, the pipeline can be started
+        before a call arrives: the room is joined when `bind()` is called.
+        """
         super().__init__(input_name=input_name, output_name=output_name)
 
-        # If any of these are missing, read from task-local ContextVars.
-        if url is None:
-            try:
-                url = URL_CTX.get()
-            except LookupError:
-                pass
-        if token is None:
-            try:
-                token = TOKEN_CTX.get()
-            except LookupError:
-                pass
-        if room_name is None:
-            try:
-                room_name = ROOM_CTX.get()
-            except LookupError:
-                pass
+        # If any of these are missing, read from task-local ContextVars. A
+        # deferred transport gets its room from bind(), not from whichever
+        # session's context it happens to be created in.
+        if not defer_room:
+            if url is None:
+                try:
+                    url = URL_CTX.get()
+                except LookupError:
+                    pass
+            if token is None:
+                try:
+                    token = TOKEN_CTX.get()
+                except LookupError:
+                    pass
+            if room_name is None:
+                try:
+                    room_name = ROOM_CTX.get()
+                except LookupError:
+                    pass
 
-        if not (url and token and room_name):
+        if not (url and token and room_name) and not defer_room:
             raise RuntimeError(
                 "TelecmiTransport: missing url/token/room_name and no agent ContextVars set. "
                 "Either pass them explicitly or ensure Agent set ContextVars before creating transport."
@@ -723,6 +765,10 @@ class TelecmiTransport(BaseTransport):
     def participant_id(self) -> str:
         return self._client.participant_id
 
+    async def bind(self, url: str, token: str, room_name: str):
+        """Join a room with a transport created with defer_room=True."""
+        await self._client.bind(url, token, room_name)
+
     async def send_audio(self, frame: OutputAudioRawFrame):
         if self._output:
             await self._output.queue_frame(frame, FrameDirection.DOWNSTREAM)
@@ -0,0 +1,53 @@
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Logging helpers for per-frame hot paths.
+
+Frame processors push every audio frame (50 per second per call) through
+each processor, and logging there used to build f-strings for
+``logger.trace()`` even though trace messages are almost never emitted.
+Hot-path log sites check the level first and let loguru format the message
+only when it is emitted::
+
+    if __debug__ and trace_enabled():
+        logger.trace("Pushing {} from {} to {}", frame, self, self._next)
+
+``trace_enabled()`` compares against the minimum level of the installed
+loguru handlers, so handlers added or removed at runtime are honored.
+
+Hot-path logging can be stripped entirely: running Python with ``-O`` removes
+the guarded blocks at compile time, and setting the environment variable
+``PIOPIY_HOT_PATH_LOGGING=0`` makes ``trace_enabled()`` return False without
+looking at handlers.
+"""
+
+import os
+
+from loguru import logger
+
+HOT_PATH_LOGGING = os.getenv("PIOPIY_HOT_PATH_LOGGING", "1").lower() not in (
+    "0",
+    "false",
+    "no",
+    "off",
+)
+
+_TRACE_LEVEL_NO = logger.level("TRACE").no
+
+# loguru keeps the minimum level of all handlers up to date on its core.
+_core = getattr(logger, "_core", None)
+
+
+def trace_enabled() -> bool:
+    """Check if hot-path trace messages would be emitted.
+
+    Returns:
+        True if hot-path logging is enabled and a handler accepts TRACE.
+    """
+    if not HOT_PATH_LOGGING:
+        return False
+    min_level = getattr(_core, "min_level", None)
+    return min_level is None or min_level <= _TRACE_LEVEL_NO
@@ -0,0 +1,310 @@
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Process-wide registry of shared, keep-alive HTTP clients.
+
+Provider services used to create their own HTTP client (or an
+``aiohttp.ClientSession`` per request), so every call paid new TCP and TLS
+handshakes to the same hosts. Services get their clients from this registry
+instead, and connections are reused across sessions of the same process.
+
+The registry is per process: forked session workers must not share sockets,
+so each worker builds its own. It assumes a single event loop per process,
+which is how agents run.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+import httpx
+from loguru import logger
+
+DEFAULT_OPENAI_BASE_URL = "https://api.openai.com/v1"
+
+
+@dataclass
+class HTTPClientLimits:
+    """Connection pool limits of the shared HTTP clients.
+
+    The clients are shared by every session of a process, so the defaults
+    are sized for many concurrent streaming sessions: they match what each
+    OpenAI service used to get on its own client.
+
+    Parameters:
+        max_connections: Maximum connections of each httpx client and of the
+            aiohttp session.
+        max_keepalive_connections: Idle connections kept open by each httpx
+            client.
+        max_connections_per_host: Maximum connections per host of the aiohttp
+            session.
+        keepalive_expiry_secs: How long idle connections are kept open.
+            ``None`` keeps httpx connections open until the server closes
+            them; the aiohttp session then uses aiohttp's default.
+        dns_cache_ttl_secs: How long the aiohttp session caches DNS results.
+    """
+
+    max_connections: int = 1000
+    max_keepalive_connections: int = 100
+    max_connections_per_host: int = 1000
+    keepalive_expiry_secs: Optional[float] = None
+    dns_cache_ttl_secs: int = 300
+
+
+@dataclass
+class HostConnectionStats:
+    """Connection counters of a host.
+
+    Parameters:
+        requests: Requests sent to the host.
+        new_connections: Connections opened to the host. Requests minus new
+            connections is the number of requests served by a kept-alive
+            connection.
+    """
+
+    requests: int = 0
+    new_connections: int = 0
+
+    @property
+    def reused_connections(self) -> int:
+        """Requests sent over an already open connection."""
+        return max(0, self.requests - self.new_connections)
+
+
+class HTTPClientRegistry:
+    """Hands out shared HTTP clients with bounded keep-alive pools.
+
+    - ``httpx_client(url)``: an ``httpx.AsyncClient`` per origin.
+    - ``aiohttp_session()``: one ``aiohttp.ClientSession`` for all hosts.
+    - ``openai_client(...)``: an ``AsyncOpenAI`` client per base URL and
+      credentials, on top of the shared ``httpx`` client of its origin.
+    - ``shared_client(...)``: any other SDK client, per base URL and
+      credentials.
+    """
+
+    def __init__(self, limits: Optional[HTTPClientLimits] = None):
+        """Initialize the registry.
+
+        Args:
+            limits: Connection pool limits. Defaults to `HTTPClientLimits()`.
+        """
+        self._limits = limits or HTTPClientLimits()
+
+        self._httpx_clients: Dict[str, httpx.AsyncClient] = {}
+        self._aiohttp_session: Optional[aiohttp.ClientSession] = None
+        self._shared_clients: Dict[Tuple[str, str, str], Any] = {}
+        self._stats: Dict[str, HostConnectionStats] = {}
+
+    def httpx_client(self, url: str) -> httpx.AsyncClient:
+        """Return the shared httpx client for the origin of ``url``."""
+        origin = _origin(url)
+        client = self._httpx_clients.get(origin)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self._limits.max_connections,
+                    max_keepalive_connections=self._limits.max_keepalive_connections,
+                    keepalive_expiry=self._limits.keepalive_expiry_secs,
+                ),
+                timeout=httpx.Timeout(timeout=600.0, connect=5.0),
+                follow_redirects=True,
+                event_hooks={"request": [self._on_httpx_request]},
+            )
+            self._httpx_clients[origin] = client
+        return client
+
+    def aiohttp_session(self) -> aiohttp.ClientSession:
+        """Return the shared aiohttp session. Must be called from the event loop."""
+        if self._aiohttp_session is None or self._aiohttp_session.closed:
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_request_start.append(self._on_aiohttp_request_start)
+            trace_config.on_connection_create_end.append(self._on_aiohttp_connection_create)
+            keepalive = {}
+            if self._limits.keepalive_expiry_secs is not None:
+                keepalive["keepalive_timeout"] = self._limits.keepalive_expiry_secs
+            connector = aiohttp.TCPConnector(
+                limit=self._limits.max_connections,
+                limit_per_host=self._limits.max_connections_per_host,
+                ttl_dns_cache=self._limits.dns_cache_ttl_secs,
+                **keepalive,
+            )
+            self._aiohttp_session = aiohttp.ClientSession(
+                connector=connector, trace_configs=[trace_config]
+            )
+        return self._aiohttp_session
+
+    def openai_client(
+        self,
+        *,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        organization: Optional[str] = None,
+        project: Optional[str] = None,
+        default_headers: Optional[Dict[str, str]] = None,
+    ):
+        """Return a shared ``AsyncOpenAI`` client.
+
+        Clients are shared by services with the same base URL and
+        credentials, and clients of the same origin share connections.
+        """
+        from openai import AsyncOpenAI
+
+        url = str(base_url or os.getenv("OPENAI_BASE_URL") or DEFAULT_OPENAI_BASE_URL)
+        return self.shared_client(
+            "openai",
+            url,
+            [api_key, organization, project, default_headers],
+            lambda: AsyncOpenAI(
+                api_key=api_key,
+                base_url=base_url,
+                organization=organization,
+                project=project,
+                default_headers=default_headers,
+                http_client=self.httpx_client(url),
+            ),
+        )
+
+    def shared_client(
+        self, kind: str, base_url: str, credentials: Any, factory: Callable[[], Any]
+    ) -> Any:
+        """Return the client of ``kind`` for a base URL and credentials.
+
+        Args:
+            kind: Client type (e.g. "openai", "deepgram").
+            base_url: Base URL the client talks to.
+            credentials: Anything identifying the credentials (API key,
+                headers...). Only a hash is kept.
+            factory: Creates the client if there is none yet.
+
+        Returns:
+            The shared client.
+        """
+        digest = hashlib.sha256(
+            json.dumps(credentials, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        key = (kind, base_url, digest)
+        client = self._shared_clients.get(key)
+        if client is None:
+            client = factory()
+            self._shared_clients[key] = client
+        return client
+
+    def stats(self) -> Dict[str, HostConnectionStats]:
+        """Return connection counters per host."""
+        return {
+            host: HostConnectionStats(s.requests, s.new_connections)
+            for host, s in self._stats.items()
+        }
+
+    async def prewarm(self, urls: Sequence[str], *, timeout_secs: float = 5.0):
+        """Open connections (DNS, TCP and TLS) to the given hosts.
+
+        A ``HEAD`` request is sent to each URL with the shared httpx client of
+        its origin and with the shared aiohttp session. Any response (even an
+        error status) leaves a kept-alive connection behind.
+
+        Args:
+            urls: URLs of the hosts to connect to, e.g. provider base URLs.
+            timeout_secs: Time limit of each request.
+        """
+
+        async def warm_httpx(url: str):
+            await self.httpx_client(url).head(url, timeout=timeout_secs)
+
+        async def warm_aiohttp(url: str):
+            timeout = aiohttp.ClientTimeout(total=timeout_secs)
+            async with self.aiohttp_session().head(url, timeout=timeout):
+                pass
+
+        jobs = [(url, warm) for url in urls for warm in (warm_httpx, warm_aiohttp)]
+        results = await asyncio.gather(*(warm(url) for url, warm in jobs), return_exceptions=True)
+        for (url, _), result in zip(jobs, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Unable to prewarm connection to {url}: {result!r}")
+        logger.debug(f"Prewarmed connections to {len(urls)} hosts")
+
+    async def close(self):
+        """Close all clients."""
+        clients = list(self._httpx_clients.values())
+        self._httpx_clients.clear()
+        self._shared_clients.clear()
+        for client in clients:
+            await client.aclose()
+        if self._aiohttp_session:
+            await self._aiohttp_session.close()
+            self._aiohttp_session = None
+
+    def _host_stats(self, host: Optional[str]) -> HostConnectionStats:
+        host = host or ""
+        stats = self._stats.get(host)
+        if stats is None:
+            stats = self._stats[host] = HostConnectionStats()
+        return stats
+
+    async def _on_httpx_request(self, request: httpx.Request):
+        stats = self._host_stats(request.url.host)
+        stats.requests += 1
+
+        # httpcore reports connection events through the "trace" extension.
+        async def trace(event_name: str, info: Dict[str, Any]):
+            if event_name == "connection.connect_tcp.complete":
+                stats.new_connections += 1
+
+        request.extensions["trace"] = trace
+
+    async def _on_aiohttp_request_start(
+        self,
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceRequestStartParams,
+    ):
+        context.host = params.url.host
+        self._host_stats(context.host).requests += 1
+
+    async def _on_aiohttp_connection_create(
+        self,
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceConnectionCreateEndParams,
+    ):
+        self._host_stats(getattr(context, "host", None)).new_connections += 1
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+_registry: Optional[HTTPClientRegistry] = None
+_registry_pid = 0
+_registry_limits: Optional[HTTPClientLimits] = None
+
+
+def set_http_client_limits(limits: HTTPClientLimits):
+    """Set the connection pool limits of the shared HTTP clients.
+
+    Clients created before the call keep their limits, so call it before
+    creating services. Forked session workers inherit the limits.
+    """
+    global _registry_limits
+    _registry_limits = limits
+    if _registry is not None:
+        _registry._limits = limits
+
+
+def get_http_client_registry() -> HTTPClientRegistry:
+    """Return the HTTP client registry of this process."""
+    global _registry, _registry_pid
+    if _registry is None or _registry_pid != os.getpid():
+        _registry = HTTPClientRegistry(_registry_limits)
+        _registry_pid = os.getpid()
+    return _registry
@@ -0,0 +1,153 @@
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Process-wide registry of shared local models.
+
+Local models (Silero VAD, Kokoro, Faster Whisper, ...) are expensive to load
+but safe to share between sessions, as long as per-session state is kept
+outside the model. Services look up their model in the registry by a key
+describing how it was loaded, so the first session (or an explicit preload at
+agent startup) pays the load cost and every later session reuses it.
+
+Preloading before :meth:`piopiy.agent.Agent.connect` also shares the loaded
+weights copy-on-write with forked session workers.
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+
+
+@dataclass
+class ModelStats:
+    """Load statistics for a registered model.
+
+    Parameters:
+        load_time_secs: Time it took to load the model.
+        rss_bytes: Growth of the process resident set size while loading.
+            This is an estimate; it is 0 when RSS is not available.
+        lookups: Number of times the model has been handed out.
+    """
+
+    load_time_secs: float
+    rss_bytes: int
+    lookups: int = 0
+
+
+def _current_rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+class ModelRegistry:
+    """Loads each model once and hands out the shared instance.
+
+    Loading is serialized per key, so concurrent sessions asking for the same
+    model wait for a single load instead of loading it several times.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._models: Dict[Hashable, Any] = {}
+        self._stats: Dict[Hashable, ModelStats] = {}
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+
+    def get(self, key: Hashable, loader: Callable[[], T]) -> T:
+        """Return the model registered under ``key``, loading it if needed.
+
+        Args:
+            key: Hashable description of the model (name, path, device...).
+            loader: Function that loads the model. Only called once per key.
+
+        Returns:
+            The shared model instance.
+        """
+        model = self._get_or_load(key, loader)
+        with self._lock:
+            # The model may have been unloaded meanwhile.
+            stats = self._stats.get(key)
+            if stats:
+                stats.lookups += 1
+        return model
+
+    def preload(self, key: Hashable, loader: Callable[[], T]) -> T:
+        """Load a model ahead of time (e.g. at agent startup).
+
+        Args:
+            key: Hashable description of the model.
+            loader: Function that loads the model.
+
+        Returns:
+            The shared model instance.
+        """
+        return self._get_or_load(key, loader)
+
+    def is_loaded(self, key: Hashable) -> bool:
+        """Check whether a model is already loaded."""
+        return key in self._models
+
+    def stats(self) -> Dict[Hashable, ModelStats]:
+        """Return load statistics for every loaded model."""
+        return dict(self._stats)
+
+    def total_rss_bytes(self) -> int:
+        """Return the estimated memory used by all loaded models."""
+        return sum(s.rss_bytes for s in self._stats.values())
+
+    def unload(self, key: Hashable) -> Optional[Any]:
+        """Drop a model from the registry.
+
+        Sessions that still hold a reference keep working; new sessions will
+        load the model again.
+        """
+        with self._lock:
+            self._stats.pop(key, None)
+            self._key_locks.pop(key, None)
+            return self._models.pop(key, None)
+
+    def clear(self):
+        """Drop every model from the registry."""
+        with self._lock:
+            self._models.clear()
+            self._stats.clear()
+            self._key_locks.clear()
+
+    def _get_or_load(self, key: Hashable, loader: Callable[[], T]) -> T:
+        model = self._models.get(key)
+        if model is None:
+            with self._lock:
+                key_lock = self._key_locks.setdefault(key, threading.Lock())
+            with key_lock:
+                model = self._models.get(key)
+                if model is None:
+                    model = self._load(key, loader)
+        return model
+
+    def _load(self, key: Hashable, loader: Callable[[], T]) -> T:
+        logger.debug(f"Loading shared model {key}...")
+        rss_before = _current_rss_bytes()
+        start = time.perf_counter()
+        model = loader()
+        load_time = time.perf_counter() - start
+        rss = max(0, _current_rss_bytes() - rss_before)
+        with self._lock:
+            self._stats[key] = ModelStats(load_time_secs=load_time, rss_bytes=rss)
+            self._models[key] = model
+        logger.debug(f"Loaded shared model {key} in {load_time:.3f}s (~{rss / 2**20:.1f} MiB)")
+        return model
+
+
+model_registry = ModelRegistry()
@@ -76,6 +76,12 @@ SENTENCE_ENDING_PUNCTUATION: FrozenSet[str] = frozenset(
     }
 )
 
+# Matches any sentence-ending character. NLTK only splits sentences at
+# these characters, so text without them can't contain a sentence boundary.
+_SENTENCE_ENDING_RE = re.compile(
+    "[" + "".join(re.escape(c) for c in sorted(SENTENCE_ENDING_PUNCTUATION)) + "]"
+)
+
 StartEndTags = Tuple[str, str]
 
 
@@ -116,6 +122,11 @@ def match_endofsentence(text: str) -> int:
     if not text:
         return 0
 
+    # Cheap pre-filter: without sentence-ending punctuation there can't be a
+    # boundary, so don't run the tokenizer.
+    if not _SENTENCE_ENDING_RE.search(text):
+        return 0
+
     # Use NLTK's sentence tokenizer to find sentence boundaries
     sentences = sent_tokenize(text)
 
@@ -142,6 +153,53 @@ def match_endofsentence(text: str) -> int:
     return 0
 
 
+class IncrementalSentenceMatcher:
+    """Finds sentence boundaries in a growing text buffer.
+
+    LLM output arrives a few characters at a time. Running
+    `match_endofsentence` on the whole buffer for every token makes long
+    responses quadratic. This matcher remembers how much of the buffer has
+    already been checked and only runs the sentence tokenizer when the new
+    characters contain a sentence-ending punctuation mark, so most tokens only
+    cost a regex scan of the new characters.
+
+    Sentence-ending punctuation that isn't a boundary yet (e.g. ``"stop."``
+    followed by a closing quote, or an abbreviation) can become one when more
+    text arrives, so the scan resumes from the first such character until a
+    boundary is found.
+    """
+
+    def __init__(self):
+        """Initialize the matcher with nothing scanned."""
+        self._scanned = 0
+
+    def match(self, text: str) -> int:
+        """Find the end of the first sentence in ``text``.
+
+        ``text`` must be the previous buffer with new characters appended
+        (call `reset` after removing text from the front of the buffer).
+
+        Args:
+            text: The whole aggregated text buffer.
+
+        Returns:
+            The position of the end of the sentence if found, otherwise 0.
+        """
+        start = self._scanned if self._scanned <= len(text) else 0
+        ending = _SENTENCE_ENDING_RE.search(text, start)
+        if not ending:
+            self._scanned = len(text)
+            return 0
+        end = match_endofsentence(text)
+        # Not a boundary yet: check again from this punctuation next time.
+        self._scanned = len(text) if end else ending.start()
+        return end
+
+    def reset(self):
+        """Forget what was scanned, e.g. after consuming part of the buffer."""
+        self._scanned = 0
+
+
 def parse_start_end_tags(
     text: str,
     tags: Sequence[StartEndTags],
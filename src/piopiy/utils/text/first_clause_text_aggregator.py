@@ -0,0 +1,154 @@
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""First-clause text aggregator for lower time-to-first-audio.
+
+This module provides a text aggregator that releases the first chunk of each
+response early, at a clause boundary or after a number of words or
+milliseconds, and then falls back to sentence aggregation. A long first
+sentence no longer delays the bot's first audio by its whole generation time.
+"""
+
+import bisect
+import re
+import time
+from typing import List, Optional
+
+from piopiy.utils.text.simple_text_aggregator import SimpleTextAggregator
+
+# Clause separators followed by whitespace (so "1,000" is not split) and
+# full-width separators, which are not followed by spaces.
+_CLAUSE_BOUNDARY_RE = re.compile(r"[,:–—،](?=\s)|[，、：]")
+
+# A word is complete once whitespace follows it, so words end where
+# whitespace runs start.
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class FirstClauseTextAggregator(SimpleTextAggregator):
+    """Text aggregator that flushes the first chunk of a response early.
+
+    The first chunk is released as soon as one of these happens:
+
+    - A sentence is complete (same as `SimpleTextAggregator`).
+    - A clause boundary (comma, colon, dash...) is found after at least
+      ``min_clause_words`` words.
+    - ``max_words`` complete words have been aggregated.
+    - ``max_delay_ms`` have passed since the first token of the response and
+      at least one word is complete.
+
+    After the first chunk, text is aggregated into sentences until the
+    aggregator is reset (at the end of each LLM response) or interrupted.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_clause_words: int = 3,
+        max_words: Optional[int] = 12,
+        max_delay_ms: Optional[float] = None,
+    ):
+        """Initialize the first-clause text aggregator.
+
+        Args:
+            min_clause_words: Minimum number of words before a clause boundary
+                can end the first chunk.
+            max_words: Release the first chunk after this many words. None
+                disables the word limit.
+            max_delay_ms: Release the first chunk once this much time has
+                passed since the first token of the response. Checked when
+                new text arrives. None disables the time limit.
+        """
+        super().__init__()
+        self._min_clause_words = min_clause_words
+        self._max_words = max_words
+        self._max_delay_ms = max_delay_ms
+        self._first_chunk_pending = True
+        self._first_text_time: Optional[float] = None
+
+        # While the first chunk is pending the buffer only grows, so it is
+        # scanned incrementally: complete words found so far and where to
+        # resume looking for words and clause boundaries.
+        self._word_ends: List[int] = []
+        self._word_scan_pos = 0
+        self._clause_scan_pos = 0
+
+    async def aggregate(self, text: str) -> Optional[str]:
+        """Aggregate text, releasing the first chunk of a response early.
+
+        Args:
+            text: New text to add to the aggregation buffer.
+
+        Returns:
+            The first clause of the response, a complete sentence, or None if
+            more text is needed.
+        """
+        if not self._first_chunk_pending:
+            return await super().aggregate(text)
+
+        if self._first_text_time is None:
+            self._first_text_time = time.monotonic()
+
+        result = await super().aggregate(text)
+        if not result:
+            end = self._first_chunk_end()
+            if end:
+                result = self._text[:end]
+                self._text = self._text[end:]
+                self._matcher.reset()
+
+        if result:
+            self._first_chunk_pending = False
+
+        return result
+
+    async def handle_interruption(self):
+        """Handle interruptions by clearing the buffer and re-arming early flush."""
+        await super().handle_interruption()
+        self._rearm()
+
+    async def reset(self):
+        """Clear the buffer and re-arm early flush for the next response."""
+        await super().reset()
+        self._rearm()
+
+    def _rearm(self):
+        self._first_chunk_pending = True
+        self._first_text_time = None
+        self._word_ends = []
+        self._word_scan_pos = 0
+        self._clause_scan_pos = 0
+
+    def _first_chunk_end(self) -> int:
+        """Return where the first chunk ends in the buffer, or 0 to keep waiting."""
+        text = self._text
+        for match in _WHITESPACE_RE.finditer(text, self._word_scan_pos):
+            start = match.start()
+            if start > 0 and not text[start - 1].isspace():
+                self._word_ends.append(start)
+            self._word_scan_pos = match.end()
+
+        words = self._word_ends
+        if not words:
+            return 0
+
+        for match in _CLAUSE_BOUNDARY_RE.finditer(text, self._clause_scan_pos):
+            end = match.end()
+            if bisect.bisect_right(words, end) >= self._min_clause_words:
+                return end
+        # Boundaries before the last character are settled (their word count
+        # can no longer grow); the last one may still be followed by a space.
+        self._clause_scan_pos = max(0, len(text) - 1)
+
+        if self._max_words and len(words) >= self._max_words:
+            return words[self._max_words - 1]
+
+        if self._max_delay_ms is not None:
+            elapsed_ms = (time.monotonic() - self._first_text_time) * 1000
+            if elapsed_ms >= self._max_delay_ms:
+                return words[-1]
+
+        return 0
@@ -13,7 +13,7 @@ text processing scenarios.
 
 from typing import Optional
 
-from piopiy.utils.string import match_endofsentence
+from piopiy.utils.string import IncrementalSentenceMatcher
 from piopiy.utils.text.base_text_aggregator import BaseTextAggregator
 
 
@@ -31,6 +31,7 @@ class SimpleTextAggregator(BaseTextAggregator):
         Creates an empty text buffer ready to begin accumulating text tokens.
         """
         self._text = ""
+        self._matcher = IncrementalSentenceMatcher()
 
     @property
     def text(self) -> str:
@@ -59,10 +60,12 @@ class SimpleTextAggregator(BaseTextAggregator):
 
         self._text += text
 
-        eos_end_marker = match_endofsentence(self._text)
+        eos_end_marker = self._matcher.match(self._text)
         if eos_end_marker:
             result = self._text[:eos_end_marker]
             self._text = self._text[eos_end_marker:]
+            # The remaining text may hold more sentences, scan it again.
+            self._matcher.reset()
 
         return result
 
@@ -73,6 +76,7 @@ class SimpleTextAggregator(BaseTextAggregator):
         discarding any partially accumulated text.
         """
         self._text = ""
+        self._matcher.reset()
 
     async def reset(self):
         """Clear the internally aggregated text.
@@ -81,3 +85,4 @@ class SimpleTextAggregator(BaseTextAggregator):
         any accumulated text content.
         """
         self._text = ""
+        self._matcher.reset()
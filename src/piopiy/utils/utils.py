@@ -12,6 +12,7 @@ and maintaining per-class instance counts across the Pipecat framework.
 
 import collections
 import itertools
+import sys
 import threading
 
 _COUNTS = collections.defaultdict(itertools.count)
@@ -19,6 +20,11 @@ _COUNTS_LOCK = threading.Lock()
 _ID = itertools.count()
 _ID_LOCK = threading.Lock()
 
+# With the GIL, advancing an `itertools.count` (and creating a missing
+# counter in a defaultdict) is a single C call and therefore atomic, so ids
+# can be generated without a lock. Free-threaded builds keep the locks.
+_LOCK_FREE = getattr(sys, "_is_gil_enabled", lambda: True)()
+
 
 def obj_id() -> int:
     """Generate a unique id for an object.
@@ -26,6 +32,8 @@ def obj_id() -> int:
     Returns:
         A unique integer identifier that increments globally across all objects.
     """
+    if _LOCK_FREE:
+        return next(_ID)
     with _ID_LOCK:
         return next(_ID)
 
@@ -39,5 +47,7 @@ def obj_count(obj) -> int:
     Returns:
         A unique integer count that increments per class type.
     """
+    if _LOCK_FREE:
+        return next(_COUNTS[obj.__class__.__name__])
     with _COUNTS_LOCK:
         return next(_COUNTS[obj.__class__.__name__])
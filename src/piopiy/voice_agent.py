@@ -1,20 +1,35 @@
 from __future__ import annotations
 import asyncio
+import contextvars
+import os
+import time
 from asyncio.log import logger
-from typing import Any, Awaitable, Callable, List, Optional
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, List, Optional, Set, Tuple
 
 from piopiy.adapters.schemas.function_schema import FunctionSchema
 from piopiy.adapters.schemas.tools_schema import ToolsSchema
 from piopiy.audio.vad.silero import SileroVADAnalyzer
-from piopiy.frames.frames import TTSSpeakFrame, BotSpeakingFrame, LLMFullResponseEndFrame
+from piopiy.agent import INVITE_TIME_CTX, ROOM_CTX, TOKEN_CTX, URL_CTX
+from piopiy.frames.frames import (
+    BotSpeakingFrame,
+    BotStartedSpeakingFrame,
+    LLMFullResponseEndFrame,
+    MetricsFrame,
+    TTSSpeakFrame,
+)
+from piopiy.metrics.metrics import InviteToFirstAudioMetricsData
 from piopiy.pipeline.pipeline import Pipeline
 from piopiy.pipeline.runner import PipelineRunner
 from piopiy.pipeline.task import PipelineParams, PipelineTask
+from piopiy.processors.aggregators.llm_response import LLMUserAggregatorParams
+from piopiy.processors.aggregators.speculative_gate import SpeculativeResponseGate
 from piopiy.processors.frame_processor import FrameProcessor
 from piopiy.audio.interruptions.base_interruption_strategy import BaseInterruptionStrategy
 from piopiy.audio.interruptions.min_words_interruption_strategy import MinWordsInterruptionStrategy
 from piopiy.transports.base_transport import BaseTransport
 from piopiy.transports.services.telecmi import TelecmiParams, TelecmiTransport
+from piopiy.utils.network import exponential_backoff_time
 
 try:
     from piopiy.processors.aggregators.openai_llm_context import OpenAILLMContext
@@ -41,7 +56,8 @@ class VoiceAgent:
         self._tool_handlers: dict[str, Callable[..., Awaitable[Any]]] = {}
         self._tool_schemas: dict[str, FunctionSchema] = {}
 
-        # Components (populated by AgentAction)
+        # Components (populated by AgentAction, transport by _build_task)
+        self._telecmi_params: Optional[TelecmiParams] = None
         self._transport: Optional[BaseTransport] = None
         self._stt: Optional[FrameProcessor] = None
         self._llm: Optional[FrameProcessor] = None
@@ -53,6 +69,7 @@ class VoiceAgent:
         self._enable_usage_metrics = False
         self._allow_interruptions = False
         self._interruption_strategy: Optional[BaseInterruptionStrategy] = None
+        self._speculative_llm = False
 
         # Runtime
         self._task: Optional[PipelineTask] = None
@@ -60,6 +77,10 @@ class VoiceAgent:
         self.context_aggregator = None
         self._processors: List[FrameProcessor] = []
         self._pipe: Optional[Pipeline] = None
+        # Set by prewarm(): the pipeline runs before the room is known.
+        self._run_task: Optional[asyncio.Task] = None
+        self._invited_at: Optional[float] = None
+        self._first_audio_reported = False
 
     # ---- Tool APIs ----
     def add_tool(self, schema: FunctionSchema, handler: Callable[..., Awaitable[Any]]) -> None:
@@ -85,6 +106,7 @@ class VoiceAgent:
         allow_interruptions: bool = True,
         interruption_strategy: Optional[BaseInterruptionStrategy] = None,
         telecmi_params: Optional[TelecmiParams] = None,
+        speculative_llm: bool = False,  # start the LLM on interim transcripts when VAD stops
     ) -> None:
         """Store components and toggles; pipeline is built in start()."""
         self._stt = stt
@@ -95,26 +117,47 @@ class VoiceAgent:
         self._enable_usage_metrics = enable_usage_metrics
         self._allow_interruptions = allow_interruptions
         self._interruption_strategy = interruption_strategy
+        self._speculative_llm = speculative_llm
 
         self._mcp_client = mcp_tools or None
 
-        # Build transport now (VAD goes into TelecmiParams.vad_analyzer)
+        # Transport is built with the pipeline (VAD goes into TelecmiParams.vad_analyzer)
         if telecmi_params is None:
             telecmi_params = TelecmiParams(
                 audio_in_enabled=True,
                 audio_out_enabled=True,
                 audio_out_sample_rate=8000,
+                # Unlike TransportParams' default, output chunks are read-only
+                # memoryviews, not bytes copies. TeleCMI accepts them as is;
+                # agents passing telecmi_params keep bytes unless they opt in.
+                audio_out_zero_copy=True,
                 audio_in_sample_rate=16000,
                 vad_analyzer=(self._vad if isinstance(self._vad, SileroVADAnalyzer) else None),
             )
-        self._transport = TelecmiTransport(params=telecmi_params)
+        self._telecmi_params = telecmi_params
 
     # ---- Pipeline build & run ----
-    async def _build_task(self) -> None:
+    async def _build_task(
+        self,
+        *,
+        url: Optional[str] = None,
+        token: Optional[str] = None,
+        room_name: Optional[str] = None,
+        defer_room: bool = False,
+    ) -> None:
         """Assemble Pipeline + Task (must be awaited before run)."""
-        if not (self._transport and self._stt and self._llm and self._tts):
+        if not (self._telecmi_params and self._stt and self._llm and self._tts):
             raise RuntimeError("Call AgentAction(...) before start(). Missing components.")
 
+        # Room comes from the arguments, the agent ContextVars, or bind() later.
+        self._transport = TelecmiTransport(
+            url=url,
+            token=token,
+            room_name=room_name,
+            params=self._telecmi_params,
+            defer_room=defer_room,
+        )
+
         self._processors = [self._transport.input(), self._stt]
 
         # Consolidate tool schemas from add_tool() and (optionally) ctor tools=[...]
@@ -129,7 +172,12 @@ class VoiceAgent:
             ctx = OpenAILLMContext(self._messages, tools_schema) if tools_schema else OpenAILLMContext(self._messages)
             if self._mcp_client:
                 ctx = OpenAILLMContext(self._messages, tools=self._mcp_client) if self._mcp_client else OpenAILLMContext(self._messages)
-            self.context_aggregator = self._llm.create_context_aggregator(ctx)
+            if self._speculative_llm:
+                self.context_aggregator = self._llm.create_context_aggregator(
+                    ctx, user_params=LLMUserAggregatorParams(enable_speculative_llm=True)
+                )
+            else:
+                self.context_aggregator = self._llm.create_context_aggregator(ctx)
             self._processors.append(self.context_aggregator.user())
 
         # Register runtime handlers with the LLM service
@@ -163,7 +211,10 @@ class VoiceAgent:
         
 
         # Finish processor chain
-        self._processors.extend([self._llm, self._tts, self._transport.output()])
+        self._processors.append(self._llm)
+        if self._speculative_llm and self.context_aggregator:
+            self._processors.append(SpeculativeResponseGate())
+        self._processors.extend([self._tts, self._transport.output()])
         if self.context_aggregator:
             self._processors.append(self.context_aggregator.assistant())
 
@@ -185,12 +236,19 @@ class VoiceAgent:
         self._task = PipelineTask(self._pipe, params=params)
         self._runner = PipelineRunner(handle_sigint=False)
 
+        # The output transport reports its first audio upstream.
+        self._task.set_reached_upstream_filter((BotStartedSpeakingFrame,))
+
+        @self._task.event_handler("on_frame_reached_upstream")
+        async def _first_audio(_, __):
+            await self._report_first_audio()
+
         # ---- Transport events ----
         @self._transport.event_handler("on_first_participant_joined")
         async def _greet(_, _pid):
+            # The audio track is published before this event, no need to wait.
             if self._greeting and self._task:
-                await asyncio.sleep(0.5)
-                logger.error(f"Greeting: {self._greeting}")
+                logger.info(f"Greeting: {self._greeting}")
                 await self._task.queue_frame(TTSSpeakFrame(self._greeting))
 
         @self._transport.event_handler("on_participant_disconnected")
@@ -198,8 +256,243 @@ class VoiceAgent:
             if self._task:
                 await self._task.cancel()
 
-    async def start(self) -> None:
-        """Build and run the pipeline."""
+    async def _report_first_audio(self) -> None:
+        if self._first_audio_reported or self._invited_at is None:
+            return
+        self._first_audio_reported = True
+        latency = time.time() - self._invited_at
+        prewarmed = self._run_task is not None
+        logger.info(f"Invite to first audio: {latency:.3f}s (prewarmed: {prewarmed})")
+        if self._enable_metrics and self._task and self._transport:
+            data = InviteToFirstAudioMetricsData(
+                processor=self._transport.output().name, value=latency, prewarmed=prewarmed
+            )
+            await self._task.queue_frame(MetricsFrame(data=[data]))
+
+    async def prewarm(self) -> None:
+        """Build and start the pipeline before a call arrives (template mode).
+
+        Processors are set up and started (models loaded, provider
+        connections opened) while the transport waits for a room; start()
+        then binds the pipeline to the invited room. Use VoiceAgentPool to
+        keep pre-warmed agents ready.
+        """
+        if self._task is not None:
+            raise RuntimeError("prewarm() must be called once, before start().")
+        await self._build_task(defer_room=True)
+
+        started = asyncio.Event()
+
+        @self._task.event_handler("on_pipeline_started")
+        async def _started(_, __):
+            started.set()
+
+        self._run_task = asyncio.create_task(self._runner.run(self._task))  # type: ignore[union-attr]
+        waiter = asyncio.create_task(started.wait())
+        try:
+            await asyncio.wait({waiter, self._run_task}, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            await self.discard()
+            raise
+        finally:
+            waiter.cancel()
+        if not started.is_set():
+            raise RuntimeError("Pipeline finished while pre-warming.")
+
+    @property
+    def finished(self) -> bool:
+        """Whether a pre-warmed pipeline has stopped running."""
+        return bool(self._run_task and self._run_task.done())
+
+    async def discard(self) -> None:
+        """Stop a pre-warmed pipeline that was not used."""
+        if self._task:
+            await self._task.cancel()
+        if self._run_task:
+            await asyncio.gather(self._run_task, return_exceptions=True)
+
+    async def start(
+        self,
+        *,
+        url: Optional[str] = None,
+        token: Optional[str] = None,
+        room_name: Optional[str] = None,
+    ) -> None:
+        """Build and run the pipeline, or bind a pre-warmed one to the room.
+
+        The room defaults to the one of the invite being handled (agent
+        ContextVars).
+        """
+        self._invited_at = INVITE_TIME_CTX.get() or time.time()
+
+        if self._run_task is not None:
+            try:
+                await self._transport.bind(  # type: ignore[union-attr]
+                    url or URL_CTX.get(), token or TOKEN_CTX.get(), room_name or ROOM_CTX.get()
+                )
+            except BaseException:
+                await self.discard()
+                raise
+            await self._run_task
+            return
+
         if self._task is None or self._runner is None:
-            await self._build_task()
+            await self._build_task(url=url, token=token, room_name=room_name)
         await self._runner.run(self._task)  # type: ignore[arg-type]
+
+
+class VoiceAgentPool:
+    """Keeps pre-warmed VoiceAgent pipelines ready to answer calls.
+
+    ``build_agent`` creates a configured agent (VoiceAgent(...) and
+    AgentAction(...)). The pool pre-warms ``size`` of them and replaces each
+    one taken by a session. Templates older than ``max_idle_secs`` are
+    replaced too, since providers close idle connections; keep it below the
+    agent's idle_timeout_secs.
+
+    Example::
+
+        pool = VoiceAgentPool(build_agent, size=2)
+
+        async def create_session():
+            await pool.run_session()
+
+        agent = Agent(..., create_session=create_session, warmup=pool.start)
+
+    ``start()`` runs for the pool's lifetime and discards the templates when
+    cancelled, as the agent does with ``warmup`` on shutdown. The pool
+    detects forks, so it can be created before session workers are forked:
+    each worker keeps its own templates.
+    """
+
+    def __init__(
+        self,
+        build_agent: Callable[[], Awaitable[VoiceAgent]],
+        *,
+        size: int = 1,
+        max_idle_secs: float = 30.0,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            build_agent: Coroutine function returning a configured agent,
+                with AgentAction() already called.
+            size: Number of pre-warmed agents to keep ready.
+            max_idle_secs: Age after which an unused agent is replaced.
+        """
+        self._build_agent = build_agent
+        self._size = size
+        self._max_idle_secs = max_idle_secs
+        self._ready: Deque[Tuple[VoiceAgent, float]] = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._fill_task: Optional[asyncio.Task] = None
+        self._discard_tasks: Set[asyncio.Task] = set()
+        self._pid = os.getpid()
+
+    @property
+    def ready(self) -> int:
+        """Number of pre-warmed agents available."""
+        return len(self._ready)
+
+    async def start(self) -> None:
+        """Pre-warm agents until cancelled, then discard the unused ones."""
+        self._start_filling()
+        try:
+            await self._fill_task  # type: ignore[misc]
+        finally:
+            await self.stop()
+
+    async def run_session(
+        self,
+        *,
+        url: Optional[str] = None,
+        token: Optional[str] = None,
+        room_name: Optional[str] = None,
+    ) -> None:
+        """Run a session with a pre-warmed agent, or a new one if none is ready."""
+        self._start_filling()
+        agent = self._take()
+        self._wakeup.set()  # type: ignore[union-attr]
+        if agent is None:
+            logger.info("No pre-warmed agent available, building one")
+            agent = await self._build_agent()
+        await agent.start(url=url, token=token, room_name=room_name)
+
+    async def stop(self) -> None:
+        """Stop pre-warming and discard the pre-warmed agents."""
+        if self._fill_task:
+            self._fill_task.cancel()
+            await asyncio.gather(self._fill_task, return_exceptions=True)
+            self._fill_task = None
+        ready = [agent for agent, _ in self._ready]
+        self._ready.clear()
+        await asyncio.gather(
+            *(agent.discard() for agent in ready), *self._discard_tasks, return_exceptions=True
+        )
+
+    def _start_filling(self) -> None:
+        self._check_pid()
+        if not self._fill_task or self._fill_task.done():
+            # Templates are built in an empty context: they must not inherit
+            # the room ContextVars of the session that started the pool.
+            self._fill_task = contextvars.Context().run(
+                asyncio.create_task, self._fill(), name="voice-agent-pool"
+            )
+
+    def _check_pid(self) -> None:
+        if self._pid != os.getpid():
+            # Forked: templates and tasks belong to the parent.
+            self._ready = deque()
+            self._fill_task = None
+            self._discard_tasks = set()
+            self._wakeup = None
+            self._pid = os.getpid()
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+
+    def _expired(self, agent: VoiceAgent, created_at: float, now: float) -> bool:
+        return agent.finished or now - created_at >= self._max_idle_secs
+
+    def _take(self) -> Optional[VoiceAgent]:
+        now = time.monotonic()
+        while self._ready:
+            agent, created_at = self._ready.popleft()
+            if not self._expired(agent, created_at, now):
+                return agent
+            task = asyncio.create_task(agent.discard())
+            self._discard_tasks.add(task)
+            task.add_done_callback(self._discard_tasks.discard)
+        return None
+
+    async def _fill(self) -> None:
+        attempt = 0
+        while True:
+            now = time.monotonic()
+            expired = [t for t in self._ready if self._expired(*t, now)]
+
+            # Build replacements before discarding expired templates, so a
+            # session arriving meanwhile still finds one.
+            if len(self._ready) - len(expired) < self._size:
+                try:
+                    agent = await self._build_agent()
+                    await agent.prewarm()
+                    self._ready.append((agent, time.monotonic()))
+                    attempt = 0
+                except Exception as e:
+                    attempt += 1
+                    logger.warning(f"Unable to pre-warm agent: {e}")
+                    await asyncio.sleep(exponential_backoff_time(attempt))
+                continue
+
+            for template in expired:
+                self._ready.remove(template)
+                await template[0].discard()
+
+            timeout = self._max_idle_secs
+            if self._ready:
+                timeout = self._ready[0][1] + self._max_idle_secs - time.monotonic()
+            self._wakeup.clear()  # type: ignore[union-attr]
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=max(0.0, timeout))  # type: ignore[union-attr]
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,382 @@
+# worker_pool.py
+# Copyright (c) 2024–2025, TeleCMI
+# SPDX-License-Identifier: BSD 2-Clause License
+
+"""Process-sharded session workers for :class:`piopiy.agent.Agent`.
+
+Each worker is a forked child process running its own asyncio event loop, so
+VAD, resampling and turn inference for different calls stop competing for a
+single GIL. The parent keeps the signaling connection and routes every invite
+to the least-loaded worker over a duplex pipe.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import signal
+import time
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Set
+
+from piopiy.admission import LoopMonitor
+from piopiy.utils.http_clients import get_http_client_registry
+
+logger = logging.getLogger(__name__)
+
+# Parent -> worker commands.
+CMD_JOIN = "join"
+CMD_CANCEL = "cancel"
+CMD_STOP = "stop"
+
+# Worker -> parent events.
+EVT_ENDED = "ended"
+EVT_LOAD = "load"
+
+# A worker that dies sooner than this after starting is respawned only after
+# this delay, so a worker crashing on startup does not fork in a tight loop.
+RESPAWN_BACKOFF_SECS = 5.0
+
+
+@dataclass
+class WorkerHandle:
+    """Parent-side view of a single worker process."""
+
+    index: int
+    process: multiprocessing.process.BaseProcess
+    conn: Connection
+    rooms: Set[str] = field(default_factory=set)
+    loop_lag_secs: float = 0.0
+    cpu_percent: float = 0.0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def session_count(self) -> int:
+        """Number of sessions routed to the worker and not ended yet."""
+        return len(self.rooms)
+
+    @property
+    def alive(self) -> bool:
+        """Whether the worker process is running."""
+        return self.process.is_alive()
+
+
+class SessionWorkerPool:
+    """Forks ``num_workers`` processes and shards sessions across them.
+
+    ``create_session`` is inherited by the children through ``fork`` (closures
+    and lambdas work), and is invoked with the same ContextVars the in-process
+    agent sets, so session code does not need to know which mode it runs in.
+
+    A worker that dies is replaced by a new one; its sessions are lost.
+    """
+
+    def __init__(
+        self,
+        create_session: Callable[[], Awaitable[None]],
+        num_workers: Optional[int] = None,
+        sample_interval_secs: float = 0.5,
+        prewarm_urls: Sequence[str] = (),
+        warmup: Optional[Callable[[], Awaitable[None]]] = None,
+    ):
+        """Create the pool. Workers are forked by `start()`.
+
+        ``create_session``, ``prewarm_urls`` and ``warmup`` are the
+        :class:`piopiy.agent.Agent` arguments of the same name;
+        ``sample_interval_secs`` is how often workers report their load.
+        """
+        self.create_session = create_session
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.sample_interval_secs = sample_interval_secs
+        # Connections are per process, so every worker opens its own.
+        self.prewarm_urls = list(prewarm_urls)
+        self.warmup = warmup
+        self.workers: List[WorkerHandle] = []
+        self.respawns = 0
+        self._room_worker: Dict[str, WorkerHandle] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopping = False
+
+    def start(self) -> None:
+        """Fork the worker processes and start listening for their events."""
+        if self.workers:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._stopping = False
+        for index in range(self.num_workers):
+            self.workers.append(self._spawn(index))
+        logger.info("Started %d session workers", len(self.workers))
+
+    def _spawn(self, index: int) -> WorkerHandle:
+        ctx = multiprocessing.get_context("fork")
+        parent_conn, child_conn = ctx.Pipe(duplex=True)
+        process = ctx.Process(
+            target=_worker_main,
+            args=(
+                index,
+                child_conn,
+                # The child closes its copies of the parent's pipe ends.
+                [parent_conn] + [w.conn for w in self.workers if not w.conn.closed],
+                self.create_session,
+                self.sample_interval_secs,
+                self.prewarm_urls,
+                self.warmup,
+            ),
+            name=f"piopiy-worker-{index}",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        handle = WorkerHandle(index=index, process=process, conn=parent_conn)
+        self._loop.add_reader(parent_conn.fileno(), self._on_worker_readable, handle)  # type: ignore[union-attr]
+        return handle
+
+    def session_counts(self) -> Dict[int, int]:
+        """Return the number of active sessions per worker index."""
+        return {w.index: w.session_count for w in self.workers}
+
+    @property
+    def total_sessions(self) -> int:
+        """Number of sessions running across all workers."""
+        return len(self._room_worker)
+
+    def has_room(self, room: str) -> bool:
+        """Whether a worker is running the session of ``room``."""
+        return room in self._room_worker
+
+    def least_loaded(self) -> Optional[WorkerHandle]:
+        """Return the live worker with the fewest sessions (lowest lag on ties)."""
+        live = [w for w in self.workers if w.alive]
+        if not live:
+            return None
+        return min(live, key=lambda w: (w.session_count, w.loop_lag_secs))
+
+    def join(
+        self, room: str, url: str, token: str, invited_at: Optional[float] = None
+    ) -> Optional[int]:
+        """Route a ``join_room`` invite to the least-loaded live worker.
+
+        ``invited_at`` (``time.time()`` when the invite arrived) is exposed to
+        the session as ``INVITE_TIME_CTX``.
+
+        Returns the index of the worker that took the session, or ``None`` if
+        no worker is available.
+        """
+        worker = self.least_loaded()
+        if not worker:
+            logger.error("No live session workers for room %s", room)
+            return None
+        if not self._send(worker, (CMD_JOIN, room, url, token, invited_at)):
+            return None
+        worker.rooms.add(room)
+        self._room_worker[room] = worker
+        return worker.index
+
+    def cancel(self, room: str) -> bool:
+        """Forward a ``cancel_room`` to the worker running ``room``."""
+        worker = self._room_worker.pop(room, None)
+        if not worker:
+            return False
+        worker.rooms.discard(room)
+        return self._send(worker, (CMD_CANCEL, room))
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """Ask every worker to cancel its sessions and exit."""
+        self._stopping = True
+        for worker in self.workers:
+            self._detach(worker)
+            self._send(worker, (CMD_STOP,))
+        for worker in self.workers:
+            await asyncio.to_thread(worker.process.join, timeout)
+            if worker.process.is_alive():
+                worker.process.terminate()
+            worker.conn.close()
+        self.workers.clear()
+        self._room_worker.clear()
+
+    def _send(self, worker: WorkerHandle, message: tuple) -> bool:
+        try:
+            worker.conn.send(message)
+            return True
+        except (BrokenPipeError, EOFError, OSError) as e:
+            logger.error("Session worker %d unreachable: %s", worker.index, e)
+            self._on_worker_lost(worker)
+            return False
+
+    def _on_worker_readable(self, worker: WorkerHandle) -> None:
+        try:
+            while worker.conn.poll():
+                message = worker.conn.recv()
+                if message[0] == EVT_ENDED:
+                    room = message[1]
+                    worker.rooms.discard(room)
+                    if self._room_worker.get(room) is worker:
+                        del self._room_worker[room]
+                elif message[0] == EVT_LOAD:
+                    worker.loop_lag_secs, worker.cpu_percent = message[1], message[2]
+        except (EOFError, OSError):
+            self._on_worker_lost(worker)
+
+    def _on_worker_lost(self, worker: WorkerHandle) -> None:
+        if self._stopping or worker not in self.workers:
+            return
+        self._detach(worker)
+        worker.conn.close()
+        worker.process.join(timeout=0.1)
+        if worker.process.is_alive():
+            # Unreachable but running: it can no longer be told to stop.
+            worker.process.terminate()
+            worker.process.join(timeout=1.0)
+        logger.error(
+            "Session worker %d (pid %s) exited with code %s, dropping %d sessions",
+            worker.index,
+            worker.process.pid,
+            worker.process.exitcode,
+            worker.session_count,
+        )
+        for room in worker.rooms:
+            if self._room_worker.get(room) is worker:
+                del self._room_worker[room]
+        worker.rooms.clear()
+
+        uptime = time.monotonic() - worker.started_at
+        delay = RESPAWN_BACKOFF_SECS if uptime < RESPAWN_BACKOFF_SECS else 0.0
+        self._loop.call_later(delay, self._respawn, worker)  # type: ignore[union-attr]
+
+    def _respawn(self, worker: WorkerHandle) -> None:
+        if self._stopping or worker not in self.workers:
+            return
+        replacement = self._spawn(worker.index)
+        self.workers[self.workers.index(worker)] = replacement
+        self.respawns += 1
+        logger.warning(
+            "Respawned session worker %d (pid %d)", worker.index, replacement.process.pid
+        )
+
+    def _detach(self, worker: WorkerHandle) -> None:
+        if self._loop and not worker.conn.closed:
+            try:
+                self._loop.remove_reader(worker.conn.fileno())
+            except (ValueError, OSError):
+                pass
+
+
+def _worker_main(
+    index: int,
+    conn: Connection,
+    parent_conns: List[Connection],
+    create_session: Callable[[], Awaitable[None]],
+    sample_interval_secs: float,
+    prewarm_urls: List[str],
+    warmup: Optional[Callable[[], Awaitable[None]]],
+) -> None:
+    # The parent owns SIGINT/SIGTERM handling and tells us when to stop. A
+    # respawned worker is forked after the parent installed its handlers, so
+    # drop them (and the parent loop's wakeup fd) too.
+    signal.set_wakeup_fd(-1)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    for parent_conn in parent_conns:
+        parent_conn.close()
+    asyncio.run(
+        _worker_loop(index, conn, create_session, sample_interval_secs, prewarm_urls, warmup)
+    )
+
+
+async def _worker_loop(
+    index: int,
+    conn: Connection,
+    create_session: Callable[[], Awaitable[None]],
+    sample_interval_secs: float,
+    prewarm_urls: List[str],
+    warmup: Optional[Callable[[], Awaitable[None]]],
+) -> None:
+    # Imported here to avoid a circular import with piopiy.agent.
+    from piopiy.agent import (
+        INVITE_TIME_CTX,
+        ROOM_CTX,
+        TOKEN_CTX,
+        URL_CTX,
+        close_shared_clients,
+    )
+
+    loop = asyncio.get_running_loop()
+    sessions: Dict[str, asyncio.Task] = {}
+    stopped = asyncio.Event()
+
+    def notify_ended(room: str, task: asyncio.Task) -> None:
+        if sessions.get(room) is task:
+            del sessions[room]
+        try:
+            conn.send((EVT_ENDED, room))
+        except (BrokenPipeError, OSError):
+            stopped.set()
+
+    def start_session(room: str, url: str, token: str, invited_at: Optional[float]) -> None:
+        existing = sessions.get(room)
+        if existing and not existing.done():
+            logger.warning("Worker %d: session %s already running", index, room)
+            return
+        tok_url = URL_CTX.set(url)
+        tok_token = TOKEN_CTX.set(token)
+        tok_room = ROOM_CTX.set(room)
+        tok_invited = INVITE_TIME_CTX.set(invited_at)
+        try:
+            task = asyncio.create_task(create_session(), name=f"session:{room}")
+        finally:
+            INVITE_TIME_CTX.reset(tok_invited)
+            ROOM_CTX.reset(tok_room)
+            TOKEN_CTX.reset(tok_token)
+            URL_CTX.reset(tok_url)
+        sessions[room] = task
+        task.add_done_callback(lambda t: notify_ended(room, t))
+
+    def on_readable() -> None:
+        try:
+            while conn.poll():
+                message = conn.recv()
+                command = message[0]
+                if command == CMD_JOIN:
+                    start_session(*message[1:])
+                elif command == CMD_CANCEL:
+                    task = sessions.get(message[1])
+                    if task and not task.done():
+                        task.cancel()
+                elif command == CMD_STOP:
+                    stopped.set()
+        except (EOFError, OSError):
+            # Parent went away.
+            stopped.set()
+
+    def report_load(loop_lag_secs: float, cpu_percent: float) -> None:
+        try:
+            conn.send((EVT_LOAD, loop_lag_secs, cpu_percent))
+        except (BrokenPipeError, OSError):
+            stopped.set()
+
+    monitor = LoopMonitor(sample_interval_secs, on_sample=report_load)
+
+    loop.add_reader(conn.fileno(), on_readable)
+    monitor.start()
+    warmup_tasks = []
+    if prewarm_urls:
+        warmup_tasks.append(asyncio.create_task(get_http_client_registry().prewarm(prewarm_urls)))
+    if warmup:
+        warmup_tasks.append(asyncio.create_task(warmup()))
+    logger.info("Session worker %d started (pid %d)", index, os.getpid())
+
+    await stopped.wait()
+
+    await monitor.stop()
+    for t in warmup_tasks:
+        t.cancel()
+    await asyncio.gather(*warmup_tasks, return_exceptions=True)
+    loop.remove_reader(conn.fileno())
+    tasks = list(sessions.values())
+    for t in tasks:
+        if not t.done():
+            t.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await close_shared_clients()
+    conn.close()
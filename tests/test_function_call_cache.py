@@ -0,0 +1,118 @@
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import unittest
+
+from piopiy.frames.frames import (
+    FunctionCallFromLLM,
+    FunctionCallResultFrame,
+    FunctionCallResultProperties,
+    TextFrame,
+)
+from piopiy.pipeline.pipeline import Pipeline
+from piopiy.processors.aggregators.openai_llm_context import OpenAILLMContext
+from piopiy.processors.frame_processor import FrameDirection, FrameProcessor
+from piopiy.services.llm_service import FunctionCallCacheParams, LLMService
+from piopiy.tests.utils import SleepFrame, run_test
+
+
+class FakeLLMService(LLMService):
+    """Calls `lookup` with the text of every text frame as its query."""
+
+    async def process_frame(self, frame, direction):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, TextFrame):
+            call = FunctionCallFromLLM(
+                function_name="lookup",
+                tool_call_id=f"call-{frame.id}",
+                arguments={"query": frame.text},
+                context=OpenAILLMContext(),
+            )
+            await self.run_function_calls([call])
+        else:
+            await self.push_frame(frame, direction)
+
+
+class ResultCollector(FrameProcessor):
+    def __init__(self):
+        super().__init__()
+        self.results = []
+
+    async def process_frame(self, frame, direction):
+        await super().process_frame(frame, direction)
+        if direction == FrameDirection.DOWNSTREAM and isinstance(frame, FunctionCallResultFrame):
+            self.results.append(frame.result)
+        await self.push_frame(frame, direction)
+
+
+class TestFunctionCallCache(unittest.IsolatedAsyncioTestCase):
+    async def run_calls(self, handler, queries):
+        llm = FakeLLMService(run_in_parallel=False)
+        llm.register_function("lookup", handler, cache=FunctionCallCacheParams())
+        collector = ResultCollector()
+        frames = []
+        for query in queries:
+            frames += [TextFrame(query), SleepFrame(sleep=0.05)]
+        await run_test(Pipeline([llm, collector]), frames_to_send=frames)
+        return collector.results
+
+    async def test_successful_results_are_reused(self):
+        calls = []
+
+        async def handler(params):
+            calls.append(params.arguments["query"])
+            await params.result_callback(f"result {len(calls)}")
+
+        results = await self.run_calls(handler, ["a", "a", "b", "a"])
+
+        self.assertEqual(calls, ["a", "b"])
+        self.assertEqual(results, ["result 1", "result 1", "result 2", "result 1"])
+
+    async def test_results_marked_not_cacheable_are_not_reused(self):
+        calls = []
+
+        async def handler(params):
+            calls.append(params.arguments["query"])
+            if len(calls) == 1:
+                properties = FunctionCallResultProperties(cacheable=False)
+                await params.result_callback("lookup failed", properties=properties)
+            else:
+                await params.result_callback("found")
+
+        results = await self.run_calls(handler, ["a", "a", "a"])
+
+        self.assertEqual(calls, ["a", "a"])
+        self.assertEqual(results, ["lookup failed", "found", "found"])
+
+    async def test_result_text_does_not_decide_caching(self):
+        calls = []
+
+        async def handler(params):
+            calls.append(params.arguments["query"])
+            await params.result_callback("Error calling is a fine answer here")
+
+        await self.run_calls(handler, ["a", "a"])
+
+        self.assertEqual(calls, ["a"])
+
+    async def test_handler_exceptions_are_not_cached(self):
+        calls = []
+
+        async def handler(params):
+            calls.append(params.arguments["query"])
+            if len(calls) == 1:
+                raise RuntimeError("lookup failed")
+            await params.result_callback("found")
+
+        results = await self.run_calls(handler, ["a", "a", "a"])
+
+        self.assertEqual(calls, ["a", "a"])
+        self.assertEqual(results, ["found", "found"])
+
+
+if __name__ == "__main__":
+    unittest.main()
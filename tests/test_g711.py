@@ -0,0 +1,91 @@
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import audioop
+import unittest
+
+import numpy as np
+
+from piopiy.audio.g711 import G711Decoder, G711Encoder
+from piopiy.audio.utils import (
+    alaw_to_pcm,
+    create_stream_resampler,
+    pcm_to_alaw,
+    pcm_to_ulaw,
+    ulaw_to_pcm,
+)
+
+# G711Decoder/G711Encoder must match the two-pass helpers they replace.
+TWO_PASS = {"PCMU": (ulaw_to_pcm, pcm_to_ulaw), "PCMA": (alaw_to_pcm, pcm_to_alaw)}
+MAX_LSB_DIFF = 2
+NUM_FRAMES = 50
+
+
+def tone(sample_rate, num_samples):
+    t = np.arange(num_samples) / sample_rate
+    signal = 6000 * np.sin(2 * np.pi * 440 * t) + 3000 * np.sin(2 * np.pi * 1800 * t)
+    return np.rint(signal).astype(np.int16)
+
+
+class TestG711(unittest.IsolatedAsyncioTestCase):
+    def assert_close(self, actual, expected):
+        actual = np.frombuffer(actual, dtype=np.int16).astype(np.int32)
+        expected = np.frombuffer(expected, dtype=np.int16).astype(np.int32)
+        self.assertEqual(actual.size, expected.size)
+        self.assertLessEqual(int(np.max(np.abs(actual - expected), initial=0)), MAX_LSB_DIFF)
+
+    async def test_decode_matches_two_pass(self):
+        for encoding, (to_pcm, from_pcm) in TWO_PASS.items():
+            for sample_rate in (8000, 16000, 24000):
+                with self.subTest(encoding=encoding, sample_rate=sample_rate):
+                    # Encoded input taken from a real signal, 20 ms per frame.
+                    payload = await from_pcm(
+                        tone(8000, 160 * NUM_FRAMES).tobytes(),
+                        8000,
+                        8000,
+                        create_stream_resampler(),
+                    )
+                    decoder = G711Decoder(encoding)
+                    resampler = create_stream_resampler()
+                    for i in range(NUM_FRAMES):
+                        frame = payload[i * 160 : (i + 1) * 160]
+                        expected = await to_pcm(frame, 8000, sample_rate, resampler)
+                        self.assert_close(decoder.decode(frame, sample_rate), expected)
+
+    async def test_encode_matches_two_pass(self):
+        for encoding, (_, from_pcm) in TWO_PASS.items():
+            for sample_rate in (8000, 16000, 24000):
+                with self.subTest(encoding=encoding, sample_rate=sample_rate):
+                    frame_size = sample_rate // 50
+                    pcm = tone(sample_rate, frame_size * NUM_FRAMES).tobytes()
+                    encoder = G711Encoder(encoding)
+                    resampler = create_stream_resampler()
+                    for i in range(NUM_FRAMES):
+                        frame = pcm[i * frame_size * 2 : (i + 1) * frame_size * 2]
+                        expected = await from_pcm(frame, sample_rate, 8000, resampler)
+                        # Resampled samples ±2 LSB apart can be quantized to
+                        # neighbouring codes, but never further apart.
+                        actual = _code_levels(encoding, encoder.encode(frame, sample_rate))
+                        expected = _code_levels(encoding, expected)
+                        self.assertEqual(actual.size, expected.size)
+                        self.assertLessEqual(int(np.max(np.abs(actual - expected), initial=0)), 1)
+
+    def test_unsupported_encoding(self):
+        with self.assertRaises(ValueError):
+            G711Decoder("L16")
+        with self.assertRaises(ValueError):
+            G711Encoder("L16")
+
+
+def _code_levels(encoding, payload):
+    """Position of each code in the ordered list of the codec output levels."""
+    decode = audioop.ulaw2lin if encoding == "PCMU" else audioop.alaw2lin
+    levels = np.unique(np.frombuffer(decode(bytes(range(256)), 2), dtype=np.int16))
+    return np.searchsorted(levels, np.frombuffer(decode(payload, 2), dtype=np.int16))
+
+
+if __name__ == "__main__":
+    unittest.main()
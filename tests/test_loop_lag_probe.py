@@ -0,0 +1,64 @@
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import time
+import unittest
+
+from piopiy.metrics.histogram import LatencyHistogram, LoopLagProbe, get_loop_lag_probe
+
+
+class TestLoopLagProbe(unittest.IsolatedAsyncioTestCase):
+    async def test_one_probe_per_loop(self):
+        probe = get_loop_lag_probe()
+        self.assertIs(get_loop_lag_probe(), probe)
+
+        other = await asyncio.to_thread(asyncio.run, self.probe_in_new_loop())
+        self.assertIsNot(other, probe)
+
+    async def probe_in_new_loop(self):
+        return get_loop_lag_probe()
+
+    async def test_measurements_go_to_every_subscriber(self):
+        probe = LoopLagProbe(interval_secs=0.01)
+        first, second = LatencyHistogram(), LatencyHistogram()
+        probe.subscribe(first)
+        probe.subscribe(second)
+        probe.subscribe(first)
+
+        await asyncio.sleep(0.05)
+        # Block the loop, the next probe fires late.
+        time.sleep(0.05)
+        await asyncio.sleep(0.02)
+        probe.unsubscribe(first)
+        probe.unsubscribe(second)
+
+        self.assertGreater(first.count, 1)
+        self.assertEqual(first.count, second.count)
+        self.assertGreaterEqual(first.max, 0.03)
+
+    async def test_timer_only_runs_with_subscribers(self):
+        probe = LoopLagProbe(interval_secs=0.01)
+        first, second = LatencyHistogram(), LatencyHistogram()
+        self.assertFalse(probe.running)
+
+        probe.subscribe(first)
+        probe.subscribe(second)
+        probe.unsubscribe(first)
+        self.assertTrue(probe.running)
+        await asyncio.sleep(0.05)
+        self.assertEqual(first.count, 0)
+        self.assertGreater(second.count, 0)
+
+        probe.unsubscribe(second)
+        self.assertFalse(probe.running)
+        count = second.count
+        await asyncio.sleep(0.03)
+        self.assertEqual(second.count, count)
+
+
+if __name__ == "__main__":
+    unittest.main()
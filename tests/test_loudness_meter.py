@@ -0,0 +1,45 @@
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import unittest
+
+import numpy as np
+
+from piopiy.audio.utils import StreamingLoudnessMeter, calculate_audio_volume
+
+
+def noise(num_samples, amplitude, seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.uniform(-1, 1, num_samples) * amplitude).astype(np.float32)
+
+
+class TestStreamingLoudnessMeter(unittest.TestCase):
+    def test_matches_calculate_audio_volume(self):
+        for sample_rate in (8000, 16000, 48000):
+            for amplitude in (0.01, 0.1, 0.5):
+                audio = noise(sample_rate // 10, amplitude)
+                pcm = (audio * 32768).astype(np.int16)
+                expected = calculate_audio_volume(pcm.tobytes(), sample_rate)
+
+                meter = StreamingLoudnessMeter(sample_rate)
+                volume = meter.volume(pcm.astype(np.float32) / 32768)
+                self.assertAlmostEqual(volume, expected, places=4)
+
+    def test_filter_state_carries_over_windows(self):
+        audio = noise(16000, 0.2)
+        meter = StreamingLoudnessMeter(16000)
+        meter.volume(audio[:8000])
+        second = meter.volume(audio[8000:])
+
+        meter.reset()
+        self.assertNotEqual(meter.volume(audio[8000:]), second)
+
+    def test_empty_window(self):
+        self.assertEqual(StreamingLoudnessMeter(16000).volume(np.zeros(0, np.float32)), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import threading
+import unittest
+
+from piopiy.utils.model_registry import ModelRegistry
+
+
+class TestModelRegistry(unittest.TestCase):
+    def test_loads_once_and_counts_lookups(self):
+        registry = ModelRegistry()
+        loads = []
+
+        def loader():
+            loads.append(1)
+            return object()
+
+        model = registry.get("model", loader)
+        self.assertIs(registry.get("model", loader), model)
+        self.assertEqual(len(loads), 1)
+        self.assertEqual(registry.stats()["model"].lookups, 2)
+
+    def test_unload_between_load_and_lookup_count(self):
+        registry = ModelRegistry()
+        get_or_load = registry._get_or_load
+
+        def get_or_load_then_unload(key, loader):
+            model = get_or_load(key, loader)
+            registry.unload(key)
+            return model
+
+        registry._get_or_load = get_or_load_then_unload
+        self.assertIsNotNone(registry.get("model", object))
+        self.assertNotIn("model", registry.stats())
+
+    def test_concurrent_get_and_unload(self):
+        registry = ModelRegistry()
+        errors = []
+
+        def run(action):
+            try:
+                for _ in range(2000):
+                    action()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=run, args=(lambda: registry.get("model", object),))]
+        threads += [threading.Thread(target=run, args=(lambda: registry.unload("model"),))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
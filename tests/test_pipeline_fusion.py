@@ -0,0 +1,159 @@
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import unittest
+
+from piopiy.frames.frames import (
+    EndFrame,
+    InputAudioRawFrame,
+    SpeculativeLLMCommitFrame,
+    SpeculativeLLMStartFrame,
+    StartInterruptionFrame,
+    TextFrame,
+    UserStartedSpeakingFrame,
+)
+from piopiy.pipeline.pipeline import Pipeline
+from piopiy.processors.aggregators.speculative_gate import SpeculativeResponseGate
+from piopiy.processors.audio.audio_buffer_processor import AudioBufferProcessor
+from piopiy.processors.filters.identity_filter import IdentityFilter
+from piopiy.processors.frame_processor import FrameDirection, FrameProcessor
+from piopiy.tests.utils import SleepFrame, run_test
+
+
+class Recorder(FrameProcessor):
+    """Queued processor recording the downstream frames it processes."""
+
+    def __init__(self, delay=0.0):
+        super().__init__()
+        self.delay = delay
+        self.frames = []
+
+    async def process_frame(self, frame, direction):
+        await super().process_frame(frame, direction)
+        if direction == FrameDirection.DOWNSTREAM and not isinstance(frame, EndFrame):
+            if isinstance(frame, TextFrame) and self.delay:
+                await asyncio.sleep(self.delay)
+            self.frames.append(frame)
+        await self.push_frame(frame, direction)
+
+
+class HoldingStep(FrameProcessor):
+    """Fused processor that holds a "hold" text frame until released."""
+
+    inline_safe = True
+
+    def __init__(self):
+        super().__init__()
+        self.holding = asyncio.Event()
+        self.release = asyncio.Event()
+        self.tasks = set()
+
+    async def process_frame(self, frame, direction):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, TextFrame) and frame.text == "hold":
+            self.tasks.add(asyncio.current_task())
+            self.holding.set()
+            await self.release.wait()
+        await self.push_frame(frame, direction)
+
+
+def texts(frames):
+    return [f.text for f in frames if isinstance(f, TextFrame)]
+
+
+class TestPipelineFusion(unittest.IsolatedAsyncioTestCase):
+    def test_hot_path_processors_are_fused(self):
+        processors = [SpeculativeResponseGate(), AudioBufferProcessor(), IdentityFilter()]
+        Pipeline(processors)
+        self.assertTrue(all(p.direct_mode for p in processors))
+
+        processors = [SpeculativeResponseGate(), AudioBufferProcessor()]
+        Pipeline(processors, fuse_inline_processors=False)
+        self.assertFalse(any(p.direct_mode for p in processors))
+
+        # Processors without `inline_safe` keep their own tasks.
+        recorder = Recorder()
+        Pipeline([recorder])
+        self.assertFalse(recorder.direct_mode)
+
+    async def test_fused_chain_runs_in_the_upstream_task(self):
+        first = Recorder()
+        step = HoldingStep()
+        last = Recorder()
+        pipeline = Pipeline([first, IdentityFilter(), step, IdentityFilter(), last])
+
+        async def release():
+            await step.holding.wait()
+            step.release.set()
+
+        asyncio.create_task(release())
+        await run_test(pipeline, frames_to_send=[TextFrame("hold"), TextFrame("b")])
+
+        self.assertEqual(texts(last.frames), ["hold", "b"])
+        # The fused step handled the frame in the process task of `first`.
+        (task,) = step.tasks
+        self.assertIn(f"{first}::", task.get_name())
+
+    async def test_system_frames_keep_priority(self):
+        # The queued processor after the fused chain is busy with text
+        # frames, a system frame sent later must overtake the queued ones.
+        last = Recorder(delay=0.05)
+        pipeline = Pipeline([Recorder(), IdentityFilter(), IdentityFilter(), last])
+        frames = [TextFrame("a"), TextFrame("b"), TextFrame("c"), UserStartedSpeakingFrame()]
+        await run_test(pipeline, frames_to_send=frames + [SleepFrame(sleep=0.3)])
+
+        self.assertEqual(texts(last.frames), ["a", "b", "c"])
+        kinds = [type(f) for f in last.frames]
+        self.assertLess(kinds.index(UserStartedSpeakingFrame), len(kinds) - 1)
+
+    async def test_interruption_while_a_frame_is_mid_push(self):
+        # `first` is pushing "hold" through the fused chain when the
+        # interruption arrives: the push is cancelled with `first`'s process
+        # task, the interruption gets through and the chain keeps working.
+        first = Recorder()
+        step = HoldingStep()
+        last = Recorder()
+        pipeline = Pipeline([first, IdentityFilter(), step, IdentityFilter(), last])
+
+        frames = [
+            TextFrame("hold"),
+            SleepFrame(sleep=0.05),
+            StartInterruptionFrame(),
+            SleepFrame(sleep=0.05),
+            TextFrame("after"),
+            SleepFrame(sleep=0.05),
+        ]
+        await run_test(pipeline, frames_to_send=frames)
+
+        self.assertTrue(step.holding.is_set())
+        self.assertFalse(step.release.is_set())
+        kinds = [type(f) for f in last.frames]
+        self.assertIn(StartInterruptionFrame, kinds)
+        self.assertEqual(texts(last.frames), ["after"])
+        self.assertLess(kinds.index(StartInterruptionFrame), kinds.index(TextFrame))
+
+    async def test_fused_gate_and_audio_buffer(self):
+        # The commit is a system frame and overtakes the text frames the
+        # queued processor before the gate still has to push, which must
+        # still come out in order. Input audio is a system frame too and goes
+        # through the fused audio buffer without waiting for them.
+        last = Recorder()
+        audio = InputAudioRawFrame(audio=b"\x00" * 320, sample_rate=16000, num_channels=1)
+        pipeline = Pipeline([Recorder(), SpeculativeResponseGate(), AudioBufferProcessor(), last])
+        frames = [SpeculativeLLMStartFrame(speculation_id=1)]
+        frames += [TextFrame(str(i)) for i in range(10)]
+        frames += [SpeculativeLLMCommitFrame(speculation_id=1)]
+        frames += [TextFrame(str(i)) for i in range(10, 20)]
+        frames += [audio, SleepFrame(sleep=0.05)]
+        await run_test(pipeline, frames_to_send=frames)
+
+        self.assertEqual(texts(last.frames), [str(i) for i in range(20)])
+        self.assertIn(InputAudioRawFrame, [type(f) for f in last.frames])
+
+
+if __name__ == "__main__":
+    unittest.main()
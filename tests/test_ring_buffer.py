@@ -0,0 +1,200 @@
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import random
+import unittest
+
+import numpy as np
+
+from piopiy.audio.ring_buffer import AudioChunker, TimestampedAudioBuffer
+
+
+def pcm(num_samples, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.integers(-32768, 32768, num_samples, dtype=np.int16).tobytes()
+
+
+class ListHistory:
+    """The list of (time, samples) tuples `TimestampedAudioBuffer` replaces."""
+
+    def __init__(self, capacity):
+        self._capacity = capacity
+        self._chunks = []
+
+    def write(self, audio, timestamp):
+        samples = np.frombuffer(audio, dtype=np.int16).astype(np.float32) / 32768.0
+        self._chunks.append((timestamp, samples))
+
+    def trim_before(self, timestamp):
+        while self._chunks and self._chunks[0][0] < timestamp:
+            self._chunks.pop(0)
+
+    def read_since(self, timestamp, max_samples=None):
+        chunks = [samples for t, samples in self._chunks if t >= timestamp]
+        if not chunks:
+            chunks = [samples for _, samples in self._chunks]
+        segment = np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.float32)
+        # Only the newest samples fit in the buffer.
+        kept = sum(samples.size for _, samples in self._chunks)
+        limit = min(kept, self._capacity)
+        if max_samples is not None:
+            limit = min(limit, max_samples)
+        return segment[-limit:] if limit else segment[:0]
+
+
+class TestAudioChunker(unittest.TestCase):
+    def check_writes(self, sizes, chunk_size, zero_copy=False):
+        chunker = AudioChunker(chunk_size, zero_copy=zero_copy)
+        audio = pcm(sum(sizes) // 2 + 1)[: sum(sizes)]
+        chunks = []
+        offset = 0
+        for size in sizes:
+            chunks.extend(chunker.write(audio[offset : offset + size]))
+            offset += size
+
+        self.assertTrue(all(len(chunk) == chunk_size for chunk in chunks))
+        self.assertEqual(b"".join(chunks), audio[: len(chunks) * chunk_size])
+        self.assertEqual(len(chunker), len(audio) - len(chunks) * chunk_size)
+        return chunks
+
+    def test_write_of_whole_chunks(self):
+        chunks = self.check_writes([640], 320)
+        self.assertEqual(len(chunks), 2)
+
+    def test_writes_straddling_chunk_boundaries(self):
+        self.check_writes([100, 250, 30, 600, 1, 319, 960], 320)
+
+    def test_writes_smaller_than_a_chunk(self):
+        chunks = self.check_writes([7] * 100, 64)
+        self.assertEqual(len(chunks), 10)
+
+    def test_random_writes(self):
+        rng = random.Random(0)
+        for zero_copy in (False, True):
+            for chunk_size in (1, 2, 160, 320, 1000):
+                sizes = [rng.randint(0, 2000) for _ in range(50)]
+                self.check_writes(sizes, chunk_size, zero_copy)
+
+    def test_bytes_chunks_by_default(self):
+        chunks = self.check_writes([100, 700], 320)
+        self.assertTrue(all(type(chunk) is bytes for chunk in chunks))
+
+    def test_zero_copy_returns_memoryviews(self):
+        chunks = self.check_writes([100, 700, 300], 320, zero_copy=True)
+        self.assertTrue(all(isinstance(chunk, memoryview) for chunk in chunks))
+        self.assertTrue(all(chunk.readonly for chunk in chunks))
+
+    def test_chunks_do_not_see_later_buffer_changes(self):
+        for zero_copy in (False, True):
+            chunker = AudioChunker(4, zero_copy=zero_copy)
+            buffer = bytearray(b"abcdefghij")
+            chunks = chunker.write(buffer)
+            buffer[:] = b"x" * len(buffer)
+            chunks += chunker.write(b"kl")
+            self.assertEqual([bytes(chunk) for chunk in chunks], [b"abcd", b"efgh", b"ijkl"])
+
+    def test_clear(self):
+        chunker = AudioChunker(320)
+        chunker.write(pcm(100))
+        chunker.clear()
+        self.assertEqual(len(chunker), 0)
+        self.assertEqual(chunker.write(b"\x01" * 320), [b"\x01" * 320])
+
+
+class TestTimestampedAudioBuffer(unittest.TestCase):
+    def assert_same(self, buffer, reference, timestamp, max_samples=None):
+        np.testing.assert_array_equal(
+            buffer.read_since(timestamp, max_samples),
+            reference.read_since(timestamp, max_samples),
+        )
+
+    def test_read_since(self):
+        buffer = TimestampedAudioBuffer(16000)
+        reference = ListHistory(16000)
+        for i in range(10):
+            audio = pcm(320, seed=i)
+            buffer.write(audio, i * 0.02)
+            reference.write(audio, i * 0.02)
+
+        self.assertEqual(len(buffer), 3200)
+        for timestamp in (-1.0, 0.0, 0.05, 0.06, 0.18, 1.0):
+            self.assert_same(buffer, reference, timestamp)
+            self.assert_same(buffer, reference, timestamp, max_samples=500)
+
+    def test_wrap_around(self):
+        buffer = TimestampedAudioBuffer(1000)
+        for i in range(7):
+            buffer.write(pcm(320, seed=i), i * 0.02)
+
+        self.assertEqual(len(buffer), 1000)
+        newest = np.concatenate(
+            [np.frombuffer(pcm(320, seed=i), dtype=np.int16) for i in range(7)]
+        )[-1000:]
+        expected = newest / np.float32(32768.0)
+        np.testing.assert_array_equal(buffer.read_since(0.0), expected)
+        # Chunk 3 was partly overwritten, only its newest samples are left.
+        np.testing.assert_array_equal(buffer.read_since(0.06), expected)
+        np.testing.assert_array_equal(buffer.read_since(0.1), expected[-2 * 320 :])
+
+    def test_chunk_larger_than_capacity(self):
+        buffer = TimestampedAudioBuffer(1000)
+        buffer.write(pcm(300, seed=1), 0.0)
+        big = pcm(2500, seed=2)
+        buffer.write(big, 0.02)
+
+        self.assertEqual(len(buffer), 1000)
+        expected = np.frombuffer(big, dtype=np.int16)[-1000:] / np.float32(32768.0)
+        np.testing.assert_array_equal(buffer.read_since(0.0), expected)
+        np.testing.assert_array_equal(buffer.read_since(0.02), expected)
+
+        buffer.write(pcm(100, seed=3), 0.04)
+        np.testing.assert_array_equal(
+            buffer.read_since(0.04), np.frombuffer(pcm(100, seed=3), dtype=np.int16) / 32768.0
+        )
+
+    def test_trim_before(self):
+        buffer = TimestampedAudioBuffer(16000)
+        for i in range(5):
+            buffer.write(pcm(320, seed=i), float(i))
+
+        buffer.trim_before(2.0)
+        self.assertEqual(len(buffer), 3 * 320)
+        buffer.trim_before(10.0)
+        self.assertEqual(len(buffer), 0)
+        self.assertEqual(buffer.read_since(0.0).size, 0)
+
+    def test_matches_list_history(self):
+        rng = random.Random(0)
+        for capacity in (320, 1000, 4000):
+            buffer = TimestampedAudioBuffer(capacity)
+            reference = ListHistory(capacity)
+            now = 0.0
+            for i in range(400):
+                now += rng.choice([0.0, 0.01, 0.02, 0.05])
+                audio = pcm(rng.choice([0, 1, 160, 320, 700, 5000]), seed=i)
+                buffer.write(audio, now)
+                reference.write(audio, now)
+                if rng.random() < 0.3:
+                    timestamp = now - rng.uniform(0.0, 0.5)
+                    buffer.trim_before(timestamp)
+                    reference.trim_before(timestamp)
+                timestamp = now - rng.uniform(-0.01, 1.0)
+                max_samples = rng.choice([None, 100, 800])
+                self.assert_same(buffer, reference, timestamp, max_samples)
+
+    def test_clear(self):
+        buffer = TimestampedAudioBuffer(1000)
+        buffer.write(pcm(1500), 0.0)
+        buffer.clear()
+        self.assertEqual(len(buffer), 0)
+        buffer.write(pcm(10, seed=5), 1.0)
+        np.testing.assert_array_equal(
+            buffer.read_since(0.0), np.frombuffer(pcm(10, seed=5), dtype=np.int16) / 32768.0
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
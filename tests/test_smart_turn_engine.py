@@ -0,0 +1,260 @@
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import BrokenExecutor
+from unittest import mock
+
+import numpy as np
+
+from piopiy.audio.turn.base_turn_analyzer import EndOfTurnState
+from piopiy.audio.turn.smart_turn.base_smart_turn import BaseSmartTurn
+from piopiy.audio.turn.smart_turn.inference_engine import (
+    SmartTurnInferenceEngine,
+    SmartTurnModel,
+)
+from piopiy.utils.model_registry import model_registry
+
+
+class FakeModel(SmartTurnModel):
+    """Records batches by input length, optionally blocking until released."""
+
+    def __init__(self):
+        self.batches = []
+        self.threads = []
+        self.delay = 0.0
+        self.error = None
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def predict(self, audio):
+        return self.predict_batch([audio])[0]
+
+    def predict_batch(self, audios):
+        self.threads.append(threading.current_thread())
+        self.started.set()
+        self.release.wait(5)
+        # Blocking, like a real forward pass.
+        time.sleep(self.delay)
+        self.batches.append([len(audio) for audio in audios])
+        if self.error:
+            raise self.error
+        return [{"prediction": 1, "probability": 1.0} for _ in audios]
+
+
+def audio(num_samples):
+    return np.zeros(num_samples, dtype=np.float32)
+
+
+class EngineTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.model = FakeModel()
+        self.key = ("fake_smart_turn", id(self))
+
+    def tearDown(self):
+        self.model.release.set()
+        for engine in getattr(self, "engines", []):
+            engine.close()
+        model_registry.unload(self.key)
+
+    def engine(self, **kwargs):
+        engine = SmartTurnInferenceEngine(lambda: self.model, key=self.key, **kwargs)
+        self.engines = getattr(self, "engines", []) + [engine]
+        return engine
+
+    async def block_worker(self, engine):
+        """Start a request that keeps the worker busy until released."""
+        self.model.release.clear()
+        task = asyncio.create_task(engine.predict(audio(16000)))
+        await asyncio.to_thread(self.model.started.wait, 5)
+        return task
+
+
+class TestSmartTurnScheduling(EngineTestCase):
+    async def test_idle_worker_runs_a_request_right_away(self):
+        engine = self.engine()
+        task = await self.block_worker(engine)
+
+        self.assertIsNone(engine._window_handle)
+        self.model.release.set()
+        result = await task
+        self.assertEqual(result["metrics"]["batch_size"], 1)
+        self.assertEqual(self.model.batches, [[16000]])
+
+    async def test_requests_are_batched_while_the_worker_is_busy(self):
+        engine = self.engine()
+        first = await self.block_worker(engine)
+        others = [asyncio.create_task(engine.predict(audio(n))) for n in (8000, 8100)]
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(len(engine._pending), 2)
+        self.model.release.set()
+        results = await asyncio.gather(first, *others)
+
+        self.assertEqual(self.model.batches, [[16000], [8000, 8100]])
+        self.assertEqual([r["metrics"]["batch_size"] for r in results], [1, 2, 2])
+        self.assertGreater(results[1]["metrics"]["queue_wait_time"], 0.04)
+        self.assertEqual(engine.average_batch_size, 1.5)
+
+    async def test_window_only_applies_to_an_idle_worker(self):
+        engine = self.engine(batch_window_ms=50)
+        tasks = [asyncio.create_task(engine.predict(audio(n))) for n in (8000, 8100)]
+        await asyncio.sleep(0)
+
+        self.assertIsNotNone(engine._window_handle)
+        self.assertEqual(self.model.batches, [])
+        await asyncio.gather(*tasks)
+        self.assertEqual(self.model.batches, [[8000, 8100]])
+
+    async def test_flush_splits_by_length_and_max_batch_size(self):
+        engine = self.engine(max_batch_size=2)
+        first = await self.block_worker(engine)
+        # A full batch is submitted even while the worker is busy.
+        tasks = [asyncio.create_task(engine.predict(audio(n))) for n in (8000, 8001)]
+        await asyncio.sleep(0)
+        self.assertEqual(engine._pending, [])
+        # Lengths in different buckets are not batched together.
+        tasks += [asyncio.create_task(engine.predict(audio(n))) for n in (8002, 40000)]
+        await asyncio.sleep(0)
+
+        self.model.release.set()
+        await asyncio.gather(first, *tasks)
+        self.assertEqual(self.model.batches, [[16000], [8000, 8001], [8002], [40000]])
+
+    async def test_model_errors_fail_the_batch(self):
+        engine = self.engine()
+        self.model.error = ValueError("bad input")
+        with self.assertRaises(ValueError):
+            await engine.predict(audio(8000))
+        executor = engine._executor
+
+        self.model.error = None
+        result = await engine.predict(audio(8000))
+        self.assertEqual(result["prediction"], 1)
+        self.assertIs(engine._executor, executor)
+
+    async def test_broken_worker_is_restarted(self):
+        engine = self.engine()
+        await engine.predict(audio(8000))
+        executor = engine._executor
+
+        self.model.error = BrokenExecutor("worker died")
+        with self.assertRaises(BrokenExecutor):
+            await engine.predict(audio(8000))
+        self.assertIsNone(engine._executor)
+
+        self.model.error = None
+        await engine.predict(audio(8000))
+        self.assertIsNotNone(engine._executor)
+        self.assertIsNot(engine._executor, executor)
+
+    async def test_submit_failure_fails_the_batch_and_restarts_the_worker(self):
+        engine = self.engine()
+        await engine.predict(audio(8000))
+
+        with mock.patch.object(engine, "_submit", side_effect=BrokenExecutor("worker died")):
+            with self.assertRaises(BrokenExecutor):
+                await engine.predict(audio(8000))
+        self.assertIsNone(engine._executor)
+        self.assertEqual(engine._in_flight, 0)
+
+        await engine.predict(audio(8000))
+        self.assertIsNotNone(engine._executor)
+
+    async def test_cancelled_batch_cancels_its_requests(self):
+        engine = self.engine(max_batch_size=1)
+        first = await self.block_worker(engine)
+        queued = asyncio.create_task(engine.predict(audio(8000)))
+        await asyncio.sleep(0)
+
+        # Closing the worker cancels the batch still waiting for it.
+        engine.close()
+        with self.assertRaises(asyncio.CancelledError):
+            await queued
+        self.model.release.set()
+        self.assertEqual((await first)["prediction"], 1)
+        self.assertEqual(engine._in_flight, 0)
+
+    async def test_cancelled_request_does_not_affect_its_batch(self):
+        engine = self.engine()
+        first = await self.block_worker(engine)
+        cancelled = asyncio.create_task(engine.predict(audio(8000)))
+        kept = asyncio.create_task(engine.predict(audio(8100)))
+        await asyncio.sleep(0)
+
+        cancelled.cancel()
+        self.model.release.set()
+        await first
+        self.assertEqual((await kept)["metrics"]["batch_size"], 2)
+        self.assertTrue(cancelled.cancelled())
+
+
+class EngineSmartTurn(BaseSmartTurn):
+    """Analyzer predicting with an engine, like the local smart-turn-v2 ones."""
+
+    def __init__(self, engine, **kwargs):
+        super().__init__(**kwargs)
+        self._engine = engine
+
+    async def _predict_endpoint(self, audio_array):
+        return await self._engine.predict(audio_array)
+
+
+class TestSmartTurnInferenceEngine(EngineTestCase):
+    async def test_prediction_runs_off_the_event_loop(self):
+        engine = self.engine(worker="thread")
+        self.model.delay = 0.2
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+        await engine.predict(audio(8000))
+        ticker_task.cancel()
+
+        (thread,) = self.model.threads
+        self.assertIsNot(thread, threading.current_thread())
+        self.assertTrue(thread.name.startswith("smart-turn"))
+        # The loop kept running while the model was busy.
+        self.assertGreater(ticks, 10)
+
+    async def test_metrics_reach_smart_turn_metrics_data(self):
+        engine = self.engine()
+        analyzer = EngineSmartTurn(engine, sample_rate=16000)
+        analyzer.set_sample_rate(16000)
+        for _ in range(50):
+            analyzer.append_audio(b"\x01\x00" * 320, is_speech=True)
+
+        # Another session keeps the worker busy, so the turn has to wait.
+        self.model.delay = 0.05
+        busy = await self.block_worker(engine)
+        analysis = asyncio.create_task(analyzer.analyze_end_of_turn())
+        await asyncio.sleep(0.1)
+        self.model.release.set()
+        await busy
+        state, metrics = await analysis
+
+        self.assertEqual(state, EndOfTurnState.COMPLETE)
+        self.assertGreaterEqual(metrics.queue_wait_time_ms, 100)
+        self.assertGreaterEqual(metrics.inference_time_ms, 45)
+        self.assertLess(metrics.inference_time_ms, metrics.queue_wait_time_ms)
+        self.assertAlmostEqual(
+            metrics.server_total_time_ms,
+            metrics.queue_wait_time_ms + metrics.inference_time_ms,
+        )
+        self.assertGreaterEqual(metrics.e2e_processing_time_ms, metrics.server_total_time_ms)
+
+
+if __name__ == "__main__":
+    unittest.main()
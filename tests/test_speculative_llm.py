@@ -0,0 +1,256 @@
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import unittest
+
+from piopiy.frames.frames import (
+    EndFrame,
+    InterimTranscriptionFrame,
+    LLMFullResponseEndFrame,
+    LLMFullResponseStartFrame,
+    LLMTextFrame,
+    SpeculativeLLMCancelFrame,
+    SpeculativeLLMCommitFrame,
+    SpeculativeLLMStartFrame,
+    StartInterruptionFrame,
+    TextFrame,
+    TranscriptionFrame,
+    UserStartedSpeakingFrame,
+    UserStoppedSpeakingFrame,
+)
+from piopiy.pipeline.pipeline import Pipeline
+from piopiy.processors.aggregators.llm_response import (
+    LLMUserAggregatorParams,
+    LLMUserContextAggregator,
+)
+from piopiy.processors.aggregators.openai_llm_context import (
+    OpenAILLMContext,
+    OpenAILLMContextFrame,
+)
+from piopiy.processors.aggregators.speculative_gate import SpeculativeResponseGate
+from piopiy.processors.frame_processor import FrameDirection, FrameProcessor
+from piopiy.services.llm_service import LLMService
+from piopiy.tests.utils import SleepFrame, run_test
+
+WORDS_PER_RESPONSE = 5
+WORD_DELAY = 0.02
+
+
+class FakeLLMService(LLMService):
+    """Answers with the last user message, one word every `WORD_DELAY`."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.requests = []
+        self.completed = []
+
+    async def process_frame(self, frame, direction):
+        await super().process_frame(frame, direction)
+
+        if not isinstance(frame, OpenAILLMContextFrame):
+            await self.push_frame(frame, direction)
+            return
+
+        text = frame.context.get_messages()[-1]["content"]
+        self.requests.append(text)
+        try:
+            await self.push_frame(LLMFullResponseStartFrame())
+            for i in range(WORDS_PER_RESPONSE):
+                await asyncio.sleep(WORD_DELAY)
+                await self.push_frame(LLMTextFrame(f"{text}:{i}"))
+            self.completed.append(text)
+        finally:
+            await self.push_frame(LLMFullResponseEndFrame())
+
+
+class FrameCollector(FrameProcessor):
+    def __init__(self):
+        super().__init__()
+        self.frames = []
+
+    async def process_frame(self, frame, direction):
+        await super().process_frame(frame, direction)
+        if direction == FrameDirection.DOWNSTREAM and not isinstance(frame, EndFrame):
+            self.frames.append(frame)
+        await self.push_frame(frame, direction)
+
+
+async def run_frames(processors, frames):
+    collector = FrameCollector()
+    await run_test(Pipeline(processors + [collector]), frames_to_send=frames)
+    return collector.frames
+
+
+def user_turn(interim, final=None, wait=0.0):
+    frames = [
+        UserStartedSpeakingFrame(),
+        InterimTranscriptionFrame(text=interim, user_id="", timestamp=""),
+        # User speaking frames are system frames, let the interim get there first.
+        SleepFrame(sleep=0.01),
+        UserStoppedSpeakingFrame(),
+    ]
+    if wait:
+        frames.append(SleepFrame(sleep=wait))
+    if final is not None:
+        frames.append(TranscriptionFrame(text=final, user_id="", timestamp=""))
+    return frames
+
+
+def texts(frames):
+    return [f.text for f in frames if isinstance(f, LLMTextFrame)]
+
+
+class TestSpeculativeLLM(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.context = OpenAILLMContext()
+        self.aggregator = LLMUserContextAggregator(
+            self.context,
+            params=LLMUserAggregatorParams(
+                aggregation_timeout=0.02,
+                enable_speculative_llm=True,
+                speculative_final_timeout=0.3,
+            ),
+        )
+        self.llm = FakeLLMService()
+
+    async def run_frames(self, frames):
+        processors = [self.aggregator, self.llm, SpeculativeResponseGate()]
+        return await run_frames(processors, frames + [SleepFrame(sleep=0.5)])
+
+    def assert_no_speculation_frames(self, frames):
+        for frame in frames:
+            self.assertNotIsInstance(
+                frame,
+                (SpeculativeLLMStartFrame, SpeculativeLLMCommitFrame, SpeculativeLLMCancelFrame),
+            )
+
+    async def test_commit_releases_the_speculative_response(self):
+        down = await self.run_frames(user_turn("hello there", "Hello there.", wait=0.03))
+
+        self.assertEqual(self.llm.requests, ["hello there"])
+        self.assertEqual(texts(down), [f"hello there:{i}" for i in range(WORDS_PER_RESPONSE)])
+        self.assertEqual(self.context.get_messages(), [{"role": "user", "content": "hello there"}])
+        self.assert_no_speculation_frames(down)
+
+    async def test_commit_waits_for_the_final_transcription(self):
+        # The response is complete before the final transcription arrives.
+        down = await self.run_frames(user_turn("hello there", "hello there", wait=0.2))
+
+        self.assertEqual(self.llm.completed, ["hello there"])
+        self.assertEqual(len(texts(down)), WORDS_PER_RESPONSE)
+
+    async def test_mismatch_stops_the_request_and_reissues_it(self):
+        down = await self.run_frames(user_turn("hello there", "hello world", wait=0.03))
+
+        self.assertEqual(self.llm.requests, ["hello there", "hello world"])
+        # The speculative request was stopped, not generated to completion.
+        self.assertEqual(self.llm.completed, ["hello world"])
+        self.assertEqual(texts(down), [f"hello world:{i}" for i in range(WORDS_PER_RESPONSE)])
+        # Only the reissued response gets past the gate.
+        starts = [f for f in down if isinstance(f, LLMFullResponseStartFrame)]
+        self.assertEqual(len(starts), 1)
+        self.assertEqual(self.context.get_messages(), [{"role": "user", "content": "hello world"}])
+        self.assert_no_speculation_frames(down)
+
+    async def test_mismatch_after_the_response_completed(self):
+        down = await self.run_frames(user_turn("hello there", "hello world", wait=0.2))
+
+        self.assertEqual(self.llm.completed, ["hello there", "hello world"])
+        self.assertEqual(texts(down), [f"hello world:{i}" for i in range(WORDS_PER_RESPONSE)])
+
+    async def test_user_speaking_again_cancels_the_speculation(self):
+        frames = user_turn("hello", wait=0.03) + user_turn("hello there", "hello there", 0.03)
+        down = await self.run_frames(frames)
+
+        self.assertEqual(self.llm.requests, ["hello", "hello there"])
+        self.assertEqual(self.llm.completed, ["hello there"])
+        self.assertEqual(texts(down), [f"hello there:{i}" for i in range(WORDS_PER_RESPONSE)])
+
+    async def test_interim_only_transcription_times_out(self):
+        down = await self.run_frames(user_turn("hello there") + [SleepFrame(sleep=1.0)])
+
+        self.assertEqual(self.llm.requests, ["hello there"])
+        self.assertEqual(len(texts(down)), WORDS_PER_RESPONSE)
+
+    async def test_interruption_discards_the_speculative_response(self):
+        frames = user_turn("hello there", wait=0.03) + [StartInterruptionFrame()]
+        down = await self.run_frames(frames)
+
+        self.assertEqual(texts(down), [])
+        self.assertIn(StartInterruptionFrame, [type(f) for f in down])
+
+
+class TestSpeculativeResponseGate(unittest.IsolatedAsyncioTestCase):
+    def response(self, text):
+        return [
+            LLMFullResponseStartFrame(),
+            TextFrame(f"{text}:0"),
+            TextFrame(f"{text}:1"),
+            LLMFullResponseEndFrame(),
+        ]
+
+    async def run_gate(self, frames, gate=None):
+        down = await run_frames([gate or SpeculativeResponseGate()], frames)
+        return [f.text for f in down if isinstance(f, TextFrame)]
+
+    async def test_commit(self):
+        frames = [SpeculativeLLMStartFrame(speculation_id=1)] + self.response("a")
+        frames.append(SpeculativeLLMCommitFrame(speculation_id=1))
+        self.assertEqual(await self.run_gate(frames), ["a:0", "a:1"])
+
+    async def test_early_commit(self):
+        frames = [
+            SpeculativeLLMCommitFrame(speculation_id=1),
+            SpeculativeLLMStartFrame(speculation_id=1),
+        ] + self.response("a")
+        self.assertEqual(await self.run_gate(frames), ["a:0", "a:1"])
+
+    async def test_cancel_mid_response(self):
+        response = self.response("a")
+        frames = [SpeculativeLLMStartFrame(speculation_id=1)] + response[:2]
+        frames += [SleepFrame(sleep=0.05), SpeculativeLLMCancelFrame(speculation_id=1)]
+        frames += response[2:] + self.response("b")
+        self.assertEqual(await self.run_gate(frames), ["b:0", "b:1"])
+
+    async def test_cancel_after_response(self):
+        frames = [SpeculativeLLMStartFrame(speculation_id=1)] + self.response("a")
+        frames += [SleepFrame(sleep=0.05), SpeculativeLLMCancelFrame(speculation_id=1)]
+        frames += self.response("b")
+        self.assertEqual(await self.run_gate(frames), ["b:0", "b:1"])
+
+    async def test_early_cancel(self):
+        frames = [
+            SpeculativeLLMCancelFrame(speculation_id=1),
+            SpeculativeLLMStartFrame(speculation_id=1),
+        ] + self.response("a")
+        frames += self.response("b")
+        self.assertEqual(await self.run_gate(frames), ["b:0", "b:1"])
+
+    async def test_stale_early_cancels_are_dropped(self):
+        gate = SpeculativeResponseGate()
+        frames = [
+            SpeculativeLLMCancelFrame(speculation_id=1),
+            SpeculativeLLMStartFrame(speculation_id=2),
+        ] + self.response("a")
+        frames.append(SpeculativeLLMCommitFrame(speculation_id=2))
+        self.assertEqual(await self.run_gate(frames, gate), ["a:0", "a:1"])
+        self.assertEqual(gate._early_cancels, set())
+
+    async def test_end_frame_is_not_held_back(self):
+        # run_test() sends an EndFrame and waits for it to reach the end.
+        frames = [SpeculativeLLMStartFrame(speculation_id=1)] + self.response("a")
+        self.assertEqual(await self.run_gate(frames), [])
+
+    async def test_interruption_clears_early_cancels(self):
+        gate = SpeculativeResponseGate()
+        frames = [SpeculativeLLMCancelFrame(speculation_id=1), StartInterruptionFrame()]
+        await self.run_gate(frames, gate)
+        self.assertEqual(gate._early_cancels, set())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import random
+import re
+import unittest
+from unittest import mock
+
+import nltk
+
+from piopiy.utils.string import IncrementalSentenceMatcher, match_endofsentence
+from piopiy.utils.text.simple_text_aggregator import SimpleTextAggregator
+
+TEXTS = [
+    'He said "stop." Then he left. Nobody followed.',
+    "It was fine (see above.) Next we move on! Done?",
+    "Dr. Smith met Mr. Jones at 5 p.m. on Friday. They talked for an hour.",
+    "Prices rose 3.5 percent, e.g. food and rent. That hurt.",
+    "She asked 'why?' and waited. The answer came later... Much later.",
+    "No punctuation at all in this one",
+]
+
+_ABBREVIATIONS = {"dr", "mr", "mrs", "e.g", "i.e", "p.m"}
+_BOUNDARY_RE = re.compile(r"[.!?]+[\"')\]]*(?=\s+[A-Z0-9\"'(])")
+
+
+def fake_sent_tokenize(text):
+    """Punkt-like tokenizer: a boundary needs the next word to exist."""
+    sentences = []
+    start = 0
+    for match in _BOUNDARY_RE.finditer(text):
+        word = text[start : match.start()].split()[-1:] or [""]
+        if word[0].lower() in _ABBREVIATIONS:
+            continue
+        sentences.append(text[start : match.end()].strip())
+        start = match.end()
+    rest = text[start:].strip()
+    if rest:
+        sentences.append(rest)
+    return sentences
+
+
+def has_punkt():
+    try:
+        nltk.data.find("tokenizers/punkt_tab")
+        return True
+    except LookupError:
+        return False
+
+
+def random_tokens(text, rng):
+    tokens = []
+    i = 0
+    while i < len(text):
+        n = rng.randint(1, 6)
+        tokens.append(text[i : i + n])
+        i += n
+    return tokens
+
+
+class MatcherEquivalenceMixin:
+    def assert_matches_full_scan(self, tokens):
+        """The matcher must agree with `match_endofsentence` after every append."""
+        matcher = IncrementalSentenceMatcher()
+        buffer = ""
+        for token in tokens:
+            buffer += token
+            expected = match_endofsentence(buffer)
+            self.assertEqual(matcher.match(buffer), expected, repr(buffer))
+            if expected:
+                buffer = buffer[expected:]
+                matcher.reset()
+
+    def test_single_characters(self):
+        for text in TEXTS:
+            self.assert_matches_full_scan(list(text))
+
+    def test_random_splits(self):
+        rng = random.Random(0)
+        for _ in range(20):
+            for text in TEXTS:
+                self.assert_matches_full_scan(random_tokens(text, rng))
+
+
+@mock.patch("piopiy.utils.string.sent_tokenize", fake_sent_tokenize)
+class TestIncrementalSentenceMatcher(MatcherEquivalenceMixin, unittest.TestCase):
+    def test_closing_quote(self):
+        matcher = IncrementalSentenceMatcher()
+        self.assertEqual(matcher.match('He said "stop."'), 0)
+        self.assertEqual(matcher.match('He said "stop." Then'), len('He said "stop."'))
+
+    def test_closing_paren(self):
+        matcher = IncrementalSentenceMatcher()
+        self.assertEqual(matcher.match("(see above.)"), 0)
+        self.assertEqual(matcher.match("(see above.) "), 0)
+        self.assertEqual(matcher.match("(see above.) Next"), len("(see above.)"))
+
+    def test_abbreviation(self):
+        matcher = IncrementalSentenceMatcher()
+        self.assertEqual(matcher.match("I met Dr. Smith"), 0)
+        self.assertEqual(matcher.match("I met Dr. Smith today"), 0)
+        self.assertEqual(matcher.match("I met Dr. Smith today."), len("I met Dr. Smith today."))
+
+    def test_no_punctuation_skips_tokenizer(self):
+        matcher = IncrementalSentenceMatcher()
+        with mock.patch("piopiy.utils.string.sent_tokenize") as tokenize:
+            self.assertEqual(matcher.match("Hello"), 0)
+            self.assertEqual(matcher.match("Hello there"), 0)
+            tokenize.assert_not_called()
+
+
+@unittest.skipUnless(has_punkt(), "NLTK punkt_tab data not available")
+class TestIncrementalSentenceMatcherNLTK(MatcherEquivalenceMixin, unittest.TestCase):
+    pass
+
+
+@mock.patch("piopiy.utils.string.sent_tokenize", fake_sent_tokenize)
+class TestSimpleTextAggregator(unittest.IsolatedAsyncioTestCase):
+    async def test_sentences_split_across_appends(self):
+        rng = random.Random(1)
+        text = " ".join(TEXTS)
+        for _ in range(10):
+            tokens = random_tokens(text, rng)
+
+            # What the aggregator did before, scanning the whole buffer.
+            expected = []
+            buffer = ""
+            for token in tokens:
+                buffer += token
+                end = match_endofsentence(buffer)
+                if end:
+                    expected.append(buffer[:end])
+                    buffer = buffer[end:]
+
+            aggregator = SimpleTextAggregator()
+            sentences = []
+            for token in tokens:
+                sentence = await aggregator.aggregate(token)
+                if sentence:
+                    sentences.append(sentence)
+
+            self.assertEqual(sentences, expected)
+            self.assertEqual(aggregator.text, buffer)
+            self.assertGreater(len(sentences), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
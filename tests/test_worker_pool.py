@@ -0,0 +1,119 @@
+#
+# Copyright (c) 2024–2025, TeleCMI
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import multiprocessing
+import os
+import signal
+import time
+import unittest
+from unittest import mock
+
+from piopiy.worker_pool import CMD_JOIN, SessionWorkerPool, WorkerHandle
+
+
+class FakeProcess:
+    def __init__(self, alive=True):
+        self._alive = alive
+
+    def is_alive(self):
+        return self._alive
+
+
+async def create_session():
+    await asyncio.sleep(3600)
+
+
+async def wait_until(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise TimeoutError("condition not met")
+        await asyncio.sleep(0.05)
+
+
+class TestLeastLoadedRouting(unittest.TestCase):
+    def setUp(self):
+        self.pool = SessionWorkerPool(create_session, num_workers=3)
+        self.pipes = []
+        for index in range(3):
+            parent_conn, child_conn = multiprocessing.Pipe(duplex=True)
+            self.pipes.append(child_conn)
+            self.pool.workers.append(
+                WorkerHandle(index=index, process=FakeProcess(), conn=parent_conn)
+            )
+
+    def tearDown(self):
+        for worker in self.pool.workers:
+            worker.conn.close()
+        for conn in self.pipes:
+            conn.close()
+
+    def test_routes_to_worker_with_fewest_sessions(self):
+        self.pool.workers[0].rooms.update({"a", "b"})
+        self.pool.workers[1].rooms.add("c")
+        self.pool.workers[2].rooms.update({"d", "e"})
+
+        self.assertEqual(self.pool.join("room", "url", "token"), 1)
+        self.assertEqual(self.pipes[1].recv(), (CMD_JOIN, "room", "url", "token", None))
+        self.assertTrue(self.pool.has_room("room"))
+        self.assertEqual(self.pool.session_counts(), {0: 2, 1: 2, 2: 2})
+
+    def test_breaks_ties_by_loop_lag(self):
+        self.pool.workers[0].loop_lag_secs = 0.2
+        self.pool.workers[1].loop_lag_secs = 0.1
+        self.pool.workers[2].loop_lag_secs = 0.3
+
+        self.assertEqual(self.pool.join("room", "url", "token"), 1)
+
+    def test_spreads_sessions_evenly(self):
+        for i in range(9):
+            self.pool.join(f"room-{i}", "url", "token")
+
+        self.assertEqual(self.pool.session_counts(), {0: 3, 1: 3, 2: 3})
+        self.assertEqual(self.pool.total_sessions, 9)
+
+    def test_skips_dead_workers(self):
+        self.pool.workers[0].process = FakeProcess(alive=False)
+
+        self.assertEqual(self.pool.join("room", "url", "token"), 1)
+
+    def test_no_live_workers(self):
+        for worker in self.pool.workers:
+            worker.process = FakeProcess(alive=False)
+
+        self.assertIsNone(self.pool.least_loaded())
+        self.assertIsNone(self.pool.join("room", "url", "token"))
+
+
+class TestDeadWorker(unittest.IsolatedAsyncioTestCase):
+    @mock.patch("piopiy.worker_pool.RESPAWN_BACKOFF_SECS", 0.0)
+    async def test_dead_worker_is_respawned_and_its_sessions_dropped(self):
+        pool = SessionWorkerPool(create_session, num_workers=2)
+        pool.start()
+        try:
+            worker = pool.workers[0]
+            pool.workers[1].rooms.add("busy")  # route the next invite to worker 0
+            self.assertEqual(pool.join("room", "url", "token"), 0)
+
+            os.kill(worker.process.pid, signal.SIGKILL)
+            await wait_until(lambda: pool.respawns == 1)
+
+            self.assertFalse(pool.has_room("room"))
+            self.assertEqual(worker.session_count, 0)
+            replacement = pool.workers[0]
+            self.assertIsNot(replacement, worker)
+            self.assertEqual(replacement.index, 0)
+            self.assertTrue(replacement.alive)
+
+            self.assertEqual(pool.join("room", "url", "token"), 0)
+        finally:
+            await pool.stop()
+        self.assertEqual(pool.workers, [])
+
+
+if __name__ == "__main__":
+    unittest.main()